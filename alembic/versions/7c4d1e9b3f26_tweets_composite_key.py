@@ -0,0 +1,60 @@
+"""Tweets composite key
+
+Revision ID: 7c4d1e9b3f26
+Revises: 0b9e4d7c2a61
+Create Date: 2026-10-18 23:12:40.518263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4d1e9b3f26'
+down_revision: Union[str, None] = '0b9e4d7c2a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = 'id, keyword, text, like_count, retweet_count, reply_count, quote_count, created_at, fetched_at'
+
+
+def _create_tweets(name: str, primary_key: Sequence[str]) -> None:
+    op.create_table(name,
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('keyword', sa.String(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('like_count', sa.Integer(), nullable=True),
+    sa.Column('retweet_count', sa.Integer(), nullable=True),
+    sa.Column('reply_count', sa.Integer(), nullable=True),
+    sa.Column('quote_count', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('fetched_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint(*primary_key)
+    )
+
+
+def _swap_tweets(select: str) -> None:
+    op.execute(f'INSERT INTO tweets_tmp ({COLUMNS}) {select}')
+    op.drop_index(op.f('ix_tweets_keyword'), table_name='tweets')
+    op.drop_index(op.f('ix_tweets_created_at'), table_name='tweets')
+    op.drop_table('tweets')
+    op.rename_table('tweets_tmp', 'tweets')
+    op.create_index(op.f('ix_tweets_created_at'), 'tweets', ['created_at'], unique=False)
+    op.create_index(op.f('ix_tweets_keyword'), 'tweets', ['keyword'], unique=False)
+
+
+def upgrade() -> None:
+    # 기본 키를 id → (id, keyword)로 변경 (SQLite는 기본 키를 바꿀 수 없어 테이블을 다시 만듦)
+    _create_tweets('tweets_tmp', ['id', 'keyword'])
+    _swap_tweets(f'SELECT {COLUMNS} FROM tweets')
+
+
+def downgrade() -> None:
+    # 트윗 ID마다 키워드 하나만 남김
+    _create_tweets('tweets_tmp', ['id'])
+    _swap_tweets(
+        f'SELECT {COLUMNS} FROM tweets WHERE keyword = '
+        '(SELECT MIN(t.keyword) FROM tweets t WHERE t.id = tweets.id)'
+    )
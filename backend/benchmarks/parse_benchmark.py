@@ -0,0 +1,112 @@
+"""
+AI 응답 파서 마이크로 벤치마크
+실제 모델 응답 형태와 깨진 응답을 섞은 코퍼스로 파싱 비용과 경로 분포를 측정합니다.
+
+실행: python -m backend.benchmarks.parse_benchmark [--repeat 2000]
+"""
+import argparse
+import json
+import time
+from collections import Counter
+from pydantic import ValidationError
+from backend.services.ai_models import InsightResponse, TweetResponse, InstagramPostResponse
+from backend.services.ai_service import AIService, INSIGHT_ADAPTER, TWEET_ADAPTER, INSTAGRAM_ADAPTER
+from backend.services.response_parser import parse_structured
+
+_SUMMARY = {
+    "summary_kr": "- AI 에이전트 관련 논의가 급증했습니다.\n- 가격 인하 소식에 긍정적 반응이 많습니다.",
+    "summary_en": "- Discussion of AI agents spiked.\n- Price cuts drew mostly positive reactions.",
+}
+_TWEETS = {
+    "tweets": [
+        "🚀 AI 에이전트가 업무 방식을 바꾸고 있어요. 여러분의 팀은 준비됐나요? #AI #생산성",
+        "가격 인하 소식에 커뮤니티 반응이 뜨겁습니다 🔥 어떻게 생각하세요? #트렌드",
+        "오늘의 인사이트: 작은 자동화가 큰 차이를 만듭니다 💡 #자동화",
+    ]
+}
+_INSTAGRAM = {
+    "caption": "📈 이번 주 트렌드 요약\n\nAI 에이전트와 자동화가 대화를 주도했습니다. "
+               "특히 {중괄호}와 \"따옴표\"가 포함된 캡션도 안전하게 처리되어야 합니다. 여러분의 생각은? 👇",
+    "hashtags": ["트렌드", "#AI", "자동화", "인사이트"],
+}
+
+# (종류, 응답 텍스트)
+CORPUS = [
+    ("insights", json.dumps(_SUMMARY, ensure_ascii=False)),
+    ("insights", "```json\n" + json.dumps(_SUMMARY, ensure_ascii=False, indent=2) + "\n```"),
+    ("insights", "다음은 요청하신 분석입니다:\n\n" + json.dumps(_SUMMARY, ensure_ascii=False) + "\n\n도움이 되셨길 바랍니다."),
+    ("insights", '{"summary_kr": "짧음", "summary_en": "short"} 수정본: ' + json.dumps(_SUMMARY, ensure_ascii=False)),
+    ("insights", json.dumps(_SUMMARY, ensure_ascii=False)[:-20]),  # 잘린 응답
+    ("insights", "한글 요약: AI 에이전트 논의가 늘었고 가격 인하 반응이 좋습니다.\n영문 요약: AI agent discussion grew; price cuts were welcomed."),
+    ("tweets", json.dumps(_TWEETS, ensure_ascii=False)),
+    ("tweets", "```\n" + json.dumps(_TWEETS, ensure_ascii=False) + "\n```"),
+    ("tweets", "1. 🚀 AI 에이전트가 업무 방식을 바꾸고 있어요 #AI\n2. 가격 인하 소식에 반응이 뜨겁습니다 🔥\n3. 작은 자동화가 큰 차이를 만듭니다 💡"),
+    ("tweets", '{"tweets": []}'),
+    ("instagram", json.dumps(_INSTAGRAM, ensure_ascii=False)),
+    ("instagram", "Sure! ```json\n" + json.dumps(_INSTAGRAM, ensure_ascii=False, indent=2) + "\n```"),
+    ("instagram", '{"caption": "too short", "hashtags": ["a"]}'),
+    ("instagram", "no json here at all"),
+]
+
+_ADAPTERS = {"insights": INSIGHT_ADAPTER, "tweets": TWEET_ADAPTER, "instagram": INSTAGRAM_ADAPTER}
+_MODELS = {"insights": InsightResponse, "tweets": TweetResponse, "instagram": InstagramPostResponse}
+
+
+def _legacy_parse(kind: str, text: str):
+    """이전 방식: split 기반 코드 블록 제거 + json.loads + 모델 생성 (비교용)"""
+    try:
+        text = text.strip()
+        if "```json" in text:
+            text = text.split("```json")[1].split("```")[0].strip()
+        elif "```" in text:
+            text = text.split("```")[1].split("```")[0].strip()
+        return _MODELS[kind](**json.loads(text))
+    except (json.JSONDecodeError, ValidationError, ValueError):
+        return None
+
+
+def run(repeat: int):
+    service = AIService()
+    fallbacks = {
+        "insights": service._parse_insights_text,
+        "tweets": lambda t: service._parse_tweets_text(t, 5),
+        "instagram": service._parse_instagram_post_text,
+    }
+
+    paths = Counter()
+    legacy_paths = Counter()
+    for kind, text in CORPUS:
+        paths[parse_structured(text, _ADAPTERS[kind], kind, fallbacks[kind]).path] += 1
+        if _legacy_parse(kind, text) is not None:
+            legacy_paths["json"] += 1
+        elif fallbacks[kind](text):
+            legacy_paths["text"] += 1
+        else:
+            legacy_paths["failed"] += 1
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for kind, text in CORPUS:
+            parse_structured(text, _ADAPTERS[kind], kind, fallbacks[kind])
+    new_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for kind, text in CORPUS:
+            if _legacy_parse(kind, text) is None:
+                fallbacks[kind](text)
+    legacy_elapsed = time.perf_counter() - started
+
+    calls = repeat * len(CORPUS)
+    print(f"코퍼스 {len(CORPUS)}개 x {repeat}회")
+    print(f"single-pass 파서: {new_elapsed / calls * 1e6:.1f} µs/응답, 경로 {dict(paths)}")
+    print(f"이전 파서:        {legacy_elapsed / calls * 1e6:.1f} µs/응답, 경로 {dict(legacy_paths)}")
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.WARNING)
+    parser = argparse.ArgumentParser(description="AI 응답 파서 벤치마크")
+    parser.add_argument("--repeat", type=int, default=2000)
+    run(parser.parse_args().repeat)
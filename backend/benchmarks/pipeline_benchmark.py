@@ -0,0 +1,87 @@
+"""
+트윗 수집 → 인사이트 생성 파이프라인 부하 벤치마크
+스텁 서버(backend.stubs.twitter_server, backend.stubs.llm_server)를 대상으로
+실제 HTTP / 재시도 / 파싱 경로를 거치며 단계별 지연 시간과 결과 분포를 측정합니다.
+
+실행:
+    uvicorn backend.stubs.twitter_server:app --port 9300
+    uvicorn backend.stubs.llm_server:app --port 9400
+
+    TWITTER_BEARER_TOKEN=stub TWITTER_BASE_URL=http://localhost:9300/2 \\
+    OPENAI_API_KEY=stub OPENAI_BASE_URL=http://localhost:9400/v1 \\
+    CLAUDE_API_KEY=stub CLAUDE_BASE_URL=http://localhost:9400 \\
+    DATABASE_URL=sqlite:////tmp/bench.db AI_CACHE_PATH= \\
+    python -m backend.benchmarks.pipeline_benchmark --keywords 50 --concurrency 10
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from backend.database import init_db
+from backend.services.ai_service import AIService
+from backend.services.llm_clients import close_llm_clients
+from backend.services.provider_router import percentile, provider_router
+from backend.services.rate_limiter import RateLimitExceeded, twitter_rate_limiter
+from backend.services.response_parser import parse_stats
+from backend.services.twitter_service import TwitterService, close_twitter_client
+
+
+async def _run_keyword(keyword: str, semaphore: asyncio.Semaphore, timings: dict, outcomes: Counter):
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            tweets = await TwitterService().search_tweets(keyword, hours=24)
+        except RateLimitExceeded:
+            outcomes["rate_limited"] += 1
+            return
+        fetched = time.perf_counter()
+        timings["fetch"].append(fetched - started)
+
+        try:
+            await AIService().generate_insights(tweets)
+        except Exception:
+            outcomes["ai_failed"] += 1
+            return
+        done = time.perf_counter()
+        timings["generate"].append(done - fetched)
+        timings["total"].append(done - started)
+        outcomes["ok"] += 1
+
+
+async def run(keywords: int, concurrency: int):
+    init_db()
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = {"fetch": [], "generate": [], "total": []}
+    outcomes = Counter()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        _run_keyword(f"bench{index}", semaphore, timings, outcomes) for index in range(keywords)
+    ])
+    elapsed = time.perf_counter() - started
+    await close_twitter_client()
+    await close_llm_clients()
+
+    print(f"키워드 {keywords}개, 동시 실행 {concurrency}, 전체 {elapsed:.2f}초 ({keywords / elapsed:.1f} 키워드/초)")
+    print(f"결과: {dict(outcomes)}")
+    for stage, samples in timings.items():
+        if samples:
+            print(
+                f"{stage:>8}: p50 {percentile(samples, 0.5) * 1000:.0f}ms  "
+                f"p95 {percentile(samples, 0.95) * 1000:.0f}ms  "
+                f"p99 {percentile(samples, 0.99) * 1000:.0f}ms"
+            )
+    print(f"파싱 경로: {parse_stats}")
+    print(f"Twitter 레이트 리밋: {twitter_rate_limiter.snapshot()}")
+    print(f"provider: {provider_router.snapshot()}")
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.WARNING)
+    parser = argparse.ArgumentParser(description="파이프라인 부하 벤치마크 (스텁 서버 대상)")
+    parser.add_argument("--keywords", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.keywords, args.concurrency))
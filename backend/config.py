@@ -7,6 +7,9 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = None
     claude_api_key: Optional[str] = None
     twitter_bearer_token: Optional[str] = None
+    openai_base_url: Optional[str] = None  # OpenAI 호환 엔드포인트 (스텁 서버 등)
+    claude_base_url: Optional[str] = None  # Anthropic 호환 엔드포인트 (스텁 서버 등)
+    twitter_base_url: Optional[str] = None  # Twitter API v2 호환 엔드포인트 (스텁 서버 등)
     
     # Database
     database_url: str = "sqlite:///./twitter_insights.db"
@@ -15,16 +18,96 @@ class Settings(BaseSettings):
     backend_port: int = 8000
     backend_host: str = "0.0.0.0"
     
+    # Twitter API 클라이언트
+    twitter_http2: bool = True  # HTTP/2 사용 (h2 패키지 필요)
+    twitter_max_connections: int = 20  # 최대 커넥션 수
+    twitter_max_keepalive_connections: int = 10  # keep-alive 유지 커넥션 수
+    twitter_keepalive_expiry: float = 60.0  # keep-alive 만료 시간 (초)
+    twitter_connect_timeout: float = 5.0  # 연결 타임아웃 (초)
+    twitter_read_timeout: float = 10.0  # 응답 읽기 타임아웃 (초)
+    twitter_write_timeout: float = 5.0  # 요청 쓰기 타임아웃 (초)
+    twitter_pool_timeout: float = 5.0  # 커넥션 풀 대기 타임아웃 (초)
+    twitter_window_max: int = 500  # 키워드별로 보관하는 최근 트윗 최대 개수
+    twitter_candidate_pool: int = 100  # 랭킹 전에 수집하는 후보 트윗 수
+    twitter_prompt_pool: int = 100  # 랭킹 후 프롬프트 단계로 넘기는 트윗 수 (유사 트윗 압축 후 토큰 예산으로 최종 선택)
+    twitter_recency_half_life: float = 6.0  # 참여도 점수 최근성 반감기 (시간)
+    twitter_run_tweet_budget: int = 1000  # 스케줄 실행 1회에 수집할 트윗 총량
+    twitter_target_tweets: int = 50  # 키워드당 목표 표본 크기
+    twitter_max_results_cap: int = 300  # 키워드당 최대 수집량
+    twitter_min_hours: int = 1  # 최소 검색 구간 (시간)
+    twitter_max_hours: int = 168  # 최대 검색 구간 (시간, 최근 검색 API는 7일)
+    twitter_default_tweets_per_hour: float = 10.0  # 발생량 기록이 없는 키워드의 가정값
+    twitter_volume_smoothing: float = 0.5  # 발생량 지수 이동 평균 가중치
+    twitter_batch_queries: bool = False  # 스케줄 실행 시 여러 키워드를 OR 쿼리로 묶어 검색
+    twitter_query_max_length: int = 512  # 검색 쿼리 최대 길이 (API 요금제별 상이)
+    twitter_rate_limit: int = 450  # 레이트 리밋 창당 허용 요청 수 (검색 API, 앱 인증 기준)
+    twitter_rate_window: int = 900  # 레이트 리밋 창 길이 (초)
+    twitter_rate_burst: int = 5  # 연속으로 보낼 수 있는 최대 요청 수
+    twitter_rate_max_wait: float = 60.0  # 이보다 오래 기다려야 하면 레이트 리밋으로 처리 (초)
+    
+    # Instagram Graph API
+    instagram_access_token: Optional[str] = None
+    instagram_user_id: Optional[str] = None  # 해시태그 검색에 사용할 Instagram 비즈니스 계정 ID
+    instagram_base_url: Optional[str] = None  # Graph API 호환 엔드포인트 (스텁 서버 등)
+    instagram_hashtag_weekly_limit: int = 30  # 7일간 조회 가능한 고유 해시태그 수
+    instagram_media_pages: int = 2  # 엣지(recent/top)별로 가져올 최대 페이지 수
+    
     # Scheduler
     enable_scheduler: bool = True  # 스케줄러 활성화 여부
     scheduler_hours: str = "9,15,21"  # 스케줄러 실행 시간 (콤마로 구분)
+    scheduler_fetch_concurrency: int = 5  # 동시에 실행할 트윗 수집 수
+    scheduler_llm_concurrency: int = 3  # 동시에 실행할 AI 생성(인사이트 + 포스트) 수
+    scheduler_keyword_timeout: int = 180  # 키워드별 단계(트윗 수집 / AI 생성) 제한 시간 (초, 대기 시간 제외)
+    scheduler_lease_ttl: int = 60  # 스케줄러 리더 리스 유효 시간 (초, 리더가 죽으면 이 시간 뒤 다른 워커가 이어받음)
+    adaptive_scheduling: bool = False  # True면 고정 시간 대신 키워드별 트렌드 속도에 따라 실행 간격 조절
+    adaptive_tick_minutes: int = 15  # 실행할 키워드를 고르는 주기 (분)
+    adaptive_base_interval_hours: float = 8.0  # 발생량 변화가 없는 키워드의 실행 간격 (시간)
+    adaptive_min_interval_hours: float = 1.0  # 급상승 키워드의 최소 실행 간격 (시간)
+    adaptive_max_interval_hours: float = 48.0  # 조용한 키워드의 최대 실행 간격 (시간)
+    adaptive_velocity_smoothing: float = 0.5  # 변화율 지수 이동 평균의 새 관측값 가중치 (0~1)
+    adaptive_quiet_tweets_per_hour: float = 5.0  # 시간당 트윗 수가 이보다 적으면 조용한 키워드로 보고 간격을 늘림
+    adaptive_llm_budget_per_hour: int = 20  # 시간당 최대 인사이트 생성 수 (수동 생성 포함)
+    insight_skip_unchanged: bool = True  # 트윗 집합이 마지막 인사이트와 같으면 재생성 건너뜀
+    insight_skip_similarity: float = 0.9  # 이 유사도(Jaccard) 이상이면 같은 트윗 집합으로 취급 (1.0 = 완전히 같을 때만)
+    
+    # Job Queue (backend.worker)
+    job_queue_enabled: bool = False  # True면 API/스케줄러는 jobs 테이블에 작업만 추가하고 워커 프로세스가 실행
+    job_max_attempts: int = 5  # 작업당 최대 시도 횟수
+    job_retry_base: float = 30.0  # 재시도 대기 시간 기준값 (초, 시도마다 2배)
+    job_retry_max: float = 1800.0  # 재시도 대기 시간 상한 (초)
+    job_lease_seconds: int = 300  # 워커가 가져간 작업의 리스 시간 (초, 실행 중 갱신, 워커가 죽으면 만료 후 재실행)
+    worker_concurrency: int = 4  # 워커 프로세스 하나가 동시에 실행할 작업 수
+    worker_poll_interval: float = 2.0  # 대기 작업이 없을 때 다시 조회할 간격 (초)
     
     # AI Service
     ai_cache_ttl: int = 3600  # 캐시 TTL (초)
+    ai_cache_max_entries: int = 512  # 메모리 캐시 최대 항목 수 (LRU)
+    ai_cache_path: Optional[str] = "./ai_cache.db"  # 디스크 캐시 경로 (비우면 메모리만 사용)
+    ai_cache_disk_max_entries: int = 10000  # 디스크 캐시 최대 항목 수
     ai_max_retries: int = 3  # 최대 재시도 횟수
     ai_timeout: int = 30  # API 타임아웃 (초)
     ai_temperature: float = 0.7  # AI 응답 온도
     ai_max_tokens: int = 2000  # 최대 토큰 수
+    ai_prompt_token_budget: int = 1500  # 프롬프트에 넣을 트윗 토큰 예산
+    ai_dedupe_threshold: float = 0.7  # 유사 트윗으로 묶을 MinHash 유사도 기준
+    ai_fused_generation: bool = False  # 인사이트/트윗/인스타그램을 한 번의 호출로 생성
+    ai_fused_max_tokens: int = 4000  # fused 생성 최대 토큰 수
+    ai_batch_mode: bool = False  # 스케줄 실행 시 provider batch API 사용
+    ai_batch_poll_interval: int = 30  # batch 상태 폴링 간격 (초)
+    ai_batch_timeout: int = 3600  # batch 완료 대기 최대 시간 (초, 스케줄 간격의 절반을 넘지 않도록 제한)
+    ai_max_connections: int = 50  # LLM 클라이언트 최대 커넥션 수
+    ai_max_keepalive_connections: int = 20  # keep-alive 유지 커넥션 수
+    ai_keepalive_expiry: float = 30.0  # keep-alive 만료 시간 (초)
+    ai_provider_order: str = "openai,claude"  # 인사이트/트윗 생성 provider 순서
+    ai_instagram_provider_order: str = "claude,openai"  # 인스타그램 포스트 provider 순서
+    ai_hedge_enabled: bool = False  # 헤지 요청 사용 여부
+    ai_hedge_delay: Optional[float] = None  # 헤지 지연 시간 (초, 비우면 최근 p95 사용)
+    ai_hedge_default_delay: float = 5.0  # 지연 샘플이 부족할 때 기본 헤지 지연 시간 (초)
+    ai_router_dynamic_order: bool = True  # 최근 p50/p99 기반으로 provider 순서 조정
+    ai_router_window: int = 200  # provider별 통계 보관 호출 수
+    ai_router_min_samples: int = 20  # 순서 조정/헤지 지연 계산에 필요한 최소 샘플 수
+    ai_breaker_failure_threshold: int = 5  # 회로 차단기를 여는 연속 실패 횟수
+    ai_breaker_reset_timeout: int = 60  # 회로가 열린 뒤 probe를 허용하기까지 대기 시간 (초)
     
     class Config:
         env_file = ".env"
@@ -1,9 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import logging
 from backend.database import init_db
-from backend.routers import keywords, insights, posts, twitter_insights, instagram_insights
-from backend.services.scheduler_service import start_scheduler, stop_scheduler
+from backend.routers import keywords, insights, posts, twitter_insights, instagram_insights, jobs
+from backend.services.scheduler_service import start_scheduler, stop_scheduler, last_run_summary, LEADER_LEASE
+from backend.services.leader_lease import WORKER_ID, lease_status
+from backend.services.adaptive_scheduler import schedule_snapshot
+from backend.services.llm_clients import init_llm_clients, close_llm_clients
+from backend.services.twitter_service import get_twitter_client, close_twitter_client
+from backend.services.instagram_service import close_instagram_client
+from backend.services.ai_cache import response_cache
+from backend.services.provider_router import provider_router
+from backend.services.response_parser import parse_stats
+from backend.services.rate_limiter import RateLimitExceeded, twitter_rate_limiter
 from backend.config import settings
 
 # 로깅 설정
@@ -34,6 +44,17 @@ app.include_router(insights.router)
 app.include_router(posts.router)
 app.include_router(twitter_insights.router)
 app.include_router(instagram_insights.router)
+app.include_router(jobs.router)
+
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exception_handler(request: Request, exc: RateLimitExceeded):
+    """외부 API 레이트 리밋은 일반 오류(500)와 구분해 429로 응답"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc), "retry_after": round(exc.retry_after)},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))}
+    )
 
 
 @app.on_event("startup")
@@ -43,6 +64,10 @@ async def startup_event():
     init_db()
     logger.info("데이터베이스 초기화 완료")
     
+    # 공유 LLM / Twitter 클라이언트 생성 (커넥션 풀 재사용)
+    init_llm_clients()
+    get_twitter_client()
+    
     # 스케줄러 시작 (24시간 자동 실행)
     # 설정에서 enable_scheduler=False로 설정하면 비활성화됨
     if settings.enable_scheduler:
@@ -56,9 +81,12 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """애플리케이션 종료 시 스케줄러 중지"""
+    """애플리케이션 종료 시 스케줄러 중지 및 클라이언트 정리"""
     logger.info("애플리케이션 종료 중...")
     stop_scheduler()
+    await close_llm_clients()
+    await close_twitter_client()
+    await close_instagram_client()
     logger.info("애플리케이션 종료 완료")
 
 
@@ -76,3 +104,37 @@ async def health():
     """Health check endpoint"""
     return {"status": "healthy"}
 
+
+@app.get("/health/ai-cache")
+async def ai_cache_stats():
+    """AI 응답 캐시 적중률 통계"""
+    return response_cache.stats()
+
+
+@app.get("/health/ai-providers")
+async def ai_provider_stats():
+    """AI provider별 지연 시간/오류율/회로 차단기 상태"""
+    return provider_router.snapshot()
+
+
+@app.get("/health/ai-parser")
+async def ai_parser_stats():
+    """AI 응답 파싱 경로별 횟수 (json / extracted / text / failed)"""
+    return parse_stats
+
+
+@app.get("/health/twitter-rate-limit")
+async def twitter_rate_limit_stats():
+    """Twitter API 레이트 리밋 상태 (남은 호출 수, 대기 횟수, 429 횟수)"""
+    return twitter_rate_limiter.snapshot()
+
+
+@app.get("/health/scheduler")
+async def scheduler_stats():
+    """스케줄러 리더 워커, 마지막 스케줄 실행 요약, 적응형 스케줄의 키워드별 실행 간격"""
+    return {
+        "worker_id": WORKER_ID,
+        "leader": lease_status(LEADER_LEASE),
+        "last_run": last_run_summary,
+        "adaptive": schedule_snapshot() if settings.adaptive_scheduling else None,
+    }
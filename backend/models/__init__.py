@@ -1,6 +1,11 @@
 from backend.models.keyword import Keyword
 from backend.models.insight import Insight
 from backend.models.post import Post
+from backend.models.tweet_cursor import TweetCursor
+from backend.models.tweet import Tweet
+from backend.models.instagram_hashtag import InstagramHashtag
+from backend.models.scheduler_lease import SchedulerLease
+from backend.models.job import Job
+from backend.models.keyword_schedule import KeywordSchedule
 
-__all__ = ["Keyword", "Insight", "Post"]
-
+__all__ = ["Keyword", "Insight", "Post", "TweetCursor", "Tweet", "InstagramHashtag", "SchedulerLease", "Job", "KeywordSchedule"]
@@ -13,6 +13,8 @@ class Insight(Base):
     summary_kr = Column(Text, nullable=True)
     summary_en = Column(Text, nullable=True)
     tweets_analyzed = Column(Integer, default=0)
+    content_fingerprint = Column(String, nullable=True, index=True)  # 분석한 트윗 집합의 지문 (sha256, LLM 생성 인사이트만)
+    tweet_hashes = Column(Text, nullable=True)  # 분석한 트윗별 해시 (콤마로 구분, 유사도 비교용)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from backend.database import Base
+
+
+class InstagramHashtag(Base):
+    __tablename__ = "instagram_hashtags"
+
+    id = Column(Integer, primary_key=True, index=True)
+    hashtag = Column(String, unique=True, index=True, nullable=False)  # 정규화된 해시태그 (소문자, # 제외)
+    hashtag_id = Column(String, nullable=False)  # Graph API 해시태그 ID
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)  # 조회 시각 (주간 한도 계산용)
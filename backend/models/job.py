@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Index
+from sqlalchemy.sql import func
+import enum
+from backend.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)  # 작업 종류 (generate_insight, generate_posts)
+    payload = Column(Text, nullable=False)  # 작업 인자 (JSON)
+    dedupe_key = Column(String, nullable=True, index=True)  # 같은 키의 대기/실행 중 작업이 있으면 중복 추가하지 않음
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)  # 시도 횟수 (가져갈 때 증가)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime(timezone=True), nullable=False)  # 이 시각 이후에 실행 (재시도 백오프)
+    locked_by = Column(String, nullable=True)  # 작업을 가져간 워커 ID
+    locked_until = Column(DateTime(timezone=True), nullable=True)  # 워커 리스 만료 시각 (지나면 다른 워커가 다시 가져감)
+    last_error = Column(Text, nullable=True)
+    result = Column(String, nullable=True)  # 처리 결과 (created, skipped 등)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from backend.database import Base
+
+
+class KeywordSchedule(Base):
+    __tablename__ = "keyword_schedules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    keyword_id = Column(Integer, ForeignKey("keywords.id"), unique=True, index=True, nullable=False)
+    last_run_at = Column(DateTime(timezone=True), nullable=True)  # 마지막으로 생성을 시작한 시각
+    next_run_at = Column(DateTime(timezone=True), nullable=True, index=True)  # 다음 생성 예정 시각
+    last_volume = Column(Float, nullable=True)  # 마지막 실행 때의 시간당 트윗 수
+    velocity = Column(Float, nullable=True)  # 실행 간 트윗 발생량 변화율 (지수 이동 평균, 1 = 변화 없음)
+    interval_hours = Column(Float, nullable=True)  # 현재 실행 간격
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
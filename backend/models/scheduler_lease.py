@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from backend.database import Base
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String, primary_key=True)  # 리스 이름 (예: scheduler)
+    owner = Column(String, nullable=True)  # 리스를 가진 워커 ID (호스트:PID:랜덤)
+    expires_at = Column(DateTime(timezone=True), nullable=False)  # 만료 시각 (갱신이 끊기면 다른 워커가 가져감)
+    acquired_at = Column(DateTime(timezone=True), nullable=True)  # 현재 소유자가 리스를 얻은 시각
+    last_sweep_at = Column(DateTime(timezone=True), nullable=True)  # 리더가 마지막으로 스케줄 작업(인사이트 생성)을 마친 시각
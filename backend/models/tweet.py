@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from backend.database import Base
+
+
+class Tweet(Base):
+    __tablename__ = "tweets"
+
+    # OR 묶음 검색에서는 트윗 하나가 여러 키워드에 매칭되므로 (트윗 ID, 키워드)마다 한 행
+    id = Column(String, primary_key=True)  # Twitter 트윗 ID
+    keyword = Column(String, primary_key=True, index=True)  # 수집한 키워드
+    text = Column(Text, nullable=False)
+    like_count = Column(Integer, default=0)
+    retweet_count = Column(Integer, default=0)
+    reply_count = Column(Integer, default=0)
+    quote_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), index=True, nullable=True)  # 트윗 작성 시각
+    fetched_at = Column(DateTime(timezone=True), server_default=func.now())
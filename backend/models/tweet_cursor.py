@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float
+from sqlalchemy.sql import func
+from backend.database import Base
+
+
+class TweetCursor(Base):
+    __tablename__ = "tweet_cursors"
+
+    id = Column(Integer, primary_key=True, index=True)
+    keyword = Column(String, unique=True, index=True, nullable=False)
+    newest_id = Column(String, nullable=True)  # 마지막으로 받은 가장 최신 트윗 ID (since_id로 사용)
+    recent_tweets = Column(Text, nullable=True)  # 최근 검색 구간의 트윗 (JSON 배열)
+    tweets_per_hour = Column(Float, nullable=True)  # 관측된 시간당 트윗 수 (지수 이동 평균)
+    last_fetched_at = Column(DateTime(timezone=True), nullable=True)  # 마지막 수집 시각
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
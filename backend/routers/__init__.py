@@ -1,4 +1,4 @@
-from backend.routers import keywords, insights, posts, twitter_insights, instagram_insights
+from backend.routers import keywords, insights, posts, twitter_insights, instagram_insights, jobs
 
-__all__ = ["keywords", "insights", "posts", "twitter_insights", "instagram_insights"]
+__all__ = ["keywords", "insights", "posts", "twitter_insights", "instagram_insights", "jobs"]
 
@@ -1,16 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
+import json
+import logging
 from pydantic import BaseModel
 from backend.database import get_db
 from backend.models.keyword import Keyword
 from backend.models.insight import Insight
 from backend.models.post import Post, PostType
 from backend.services.twitter_service import TwitterService
+from backend.services.fetch_planner import plan_fetch
 from backend.services.ai_service import AIService
+from backend.services.rate_limiter import RateLimitExceeded
+from backend.services.scheduler_service import save_posts_for_insight
+from backend.services.job_queue import GENERATE_INSIGHT, GENERATE_POSTS, enqueue
+from backend.services.content_fingerprint import fingerprint_fields
+from backend.config import settings
 from datetime import datetime
 
 router = APIRouter(prefix="/api/insights", tags=["insights"])
+logger = logging.getLogger(__name__)
 
 
 class InsightResponse(BaseModel):
@@ -74,13 +84,29 @@ async def generate_insight(
     if not keyword:
         raise HTTPException(status_code=404, detail="키워드를 찾을 수 없습니다.")
     
+    # 작업 큐를 쓰면 워커 프로세스가 생성
+    if settings.job_queue_enabled:
+        job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": keyword.id}, dedupe_key=f"insight:{keyword.id}")
+        return {
+            "message": "인사이트 생성 작업이 대기열에 추가되었습니다.",
+            "job_id": job_id
+        }
+    
     # 트윗 수집
     twitter_service = TwitterService()
-    tweets = await twitter_service.search_tweets(keyword.keyword, max_results=10, hours=24)
+    plan = plan_fetch(keyword.keyword)
+    tweets = await twitter_service.search_tweets(
+        keyword.keyword, hours=plan.hours, candidates=plan.max_results
+    )
     
-    # AI 분석
+    # AI 분석 (fused 모드면 포스트까지 한 번에 생성)
     ai_service = AIService()
-    insights_data = await ai_service.generate_insights(tweets)
+    bundle = None
+    if settings.ai_fused_generation:
+        bundle = await ai_service.generate_all(tweets, count=5)
+        insights_data = bundle["insights"]
+    else:
+        insights_data = await ai_service.generate_insights(tweets)
     
     # 인사이트 저장
     insight = Insight(
@@ -88,14 +114,18 @@ async def generate_insight(
         keyword=keyword.keyword,
         summary_kr=insights_data["summary_kr"],
         summary_en=insights_data["summary_en"],
-        tweets_analyzed=len(tweets)
+        tweets_analyzed=len(tweets),
+        **fingerprint_fields(tweets, insights_data)
     )
     db.add(insight)
     db.commit()
     db.refresh(insight)
     
-    # 포스트 생성 (백그라운드)
-    background_tasks.add_task(generate_posts_for_insight, insight.id, insights_data)
+    # 포스트 생성 (fused 모드는 바로 저장, 아니면 백그라운드)
+    if bundle is not None:
+        save_posts_for_insight(insight.id, bundle["tweets"], bundle["instagram"], db)
+    else:
+        schedule_posts(background_tasks, insight.id, insights_data)
     
     return {
         "message": "인사이트가 생성되었습니다.",
@@ -103,6 +133,96 @@ async def generate_insight(
     }
 
 
+def _sse(event: str, data: dict) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/generate/{keyword_id}/stream")
+async def generate_insight_stream(
+    keyword_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """
+    키워드에 대한 인사이트 생성 (SSE 스트리밍)
+    이벤트: stage(진행 단계), token(요약 조각), reset(provider 전환), done(인사이트 ID), error
+    """
+    keyword = db.query(Keyword).filter(Keyword.id == keyword_id).first()
+    if not keyword:
+        raise HTTPException(status_code=404, detail="키워드를 찾을 수 없습니다.")
+    keyword_pk, keyword_text = keyword.id, keyword.keyword
+
+    async def event_stream():
+        from backend.database import SessionLocal
+
+        try:
+            yield _sse("stage", {"stage": "fetching"})
+            twitter_service = TwitterService()
+            plan = plan_fetch(keyword_text)
+            tweets = await twitter_service.search_tweets(
+                keyword_text, hours=plan.hours, candidates=plan.max_results
+            )
+            yield _sse("stage", {"stage": "fetched", "tweets": len(tweets)})
+
+            yield _sse("stage", {"stage": "analyzing"})
+            ai_service = AIService()
+            insights_data = None
+            async for event in ai_service.stream_insights(tweets):
+                if event["type"] == "token":
+                    yield _sse("token", {"text": event["text"]})
+                elif event["type"] == "reset":
+                    yield _sse("reset", {})
+                elif event["type"] == "result":
+                    insights_data = event["data"]
+
+            # 인사이트 저장 (스트림은 응답 이후까지 이어지므로 별도 세션 사용)
+            session = SessionLocal()
+            try:
+                insight = Insight(
+                    keyword_id=keyword_pk,
+                    keyword=keyword_text,
+                    summary_kr=insights_data["summary_kr"],
+                    summary_en=insights_data["summary_en"],
+                    tweets_analyzed=len(tweets),
+                    **fingerprint_fields(tweets, insights_data)
+                )
+                session.add(insight)
+                session.commit()
+                session.refresh(insight)
+                insight_id = insight.id
+            finally:
+                session.close()
+
+            # 포스트 생성 (스트림 종료 후 백그라운드)
+            schedule_posts(background_tasks, insight_id, insights_data)
+            yield _sse("done", {"insight_id": insight_id, **insights_data})
+        except RateLimitExceeded as e:
+            yield _sse("error", {"detail": str(e), "retry_after": round(e.retry_after)})
+        except Exception as e:
+            logger.error(f"스트리밍 인사이트 생성 중 오류: {e}", exc_info=True)
+            yield _sse("error", {"detail": "인사이트 생성 중 오류가 발생했습니다."})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=background_tasks,
+    )
+
+
+def schedule_posts(background_tasks: BackgroundTasks, insight_id: int, insights_data: dict):
+    """포스트 생성 예약 (작업 큐를 쓰면 jobs 테이블에, 아니면 이 프로세스의 백그라운드 작업으로)"""
+    if settings.job_queue_enabled:
+        enqueue(
+            GENERATE_POSTS,
+            {"insight_id": insight_id, "insights_data": insights_data},
+            dedupe_key=f"posts:{insight_id}"
+        )
+    else:
+        background_tasks.add_task(generate_posts_for_insight, insight_id, insights_data)
+
+
 async def generate_posts_for_insight(insight_id: int, insights_data: dict):
     """인사이트에 대한 포스트 생성 (백그라운드 작업)"""
     from backend.database import SessionLocal
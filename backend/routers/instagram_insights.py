@@ -9,6 +9,9 @@ from backend.models.insight import Insight
 from backend.models.post import Post, PostType
 from backend.services.instagram_service import InstagramService
 from backend.services.ai_service import AIService
+from backend.services.job_queue import GENERATE_INSTAGRAM_INSIGHT, enqueue
+from backend.services.content_fingerprint import find_unchanged_insight, fingerprint_fields
+from backend.config import settings
 
 router = APIRouter(prefix="/api/instagram/insights", tags=["instagram insights"])
 
@@ -36,13 +39,26 @@ async def generate_instagram_insight(
     if not keyword:
         raise HTTPException(status_code=404, detail="키워드를 찾을 수 없습니다.")
 
-    # 인스타그램 포스트 수집 (현재 더미 데이터)
+    # 작업 큐를 쓰면 워커 프로세스가 생성
+    if settings.job_queue_enabled:
+        job_id = enqueue(
+            GENERATE_INSTAGRAM_INSIGHT, {"keyword_id": keyword.id}, dedupe_key=f"instagram_insight:{keyword.id}"
+        )
+        return {"message": "인사이트 생성 작업이 대기열에 추가되었습니다.", "job_id": job_id}
+
+    # 인스타그램 포스트 수집 (토큰이 없으면 더미 데이터)
     instagram_service = InstagramService()
     posts_data = await instagram_service.fetch_posts(keyword.keyword, max_results=10)
 
+    # 포스트가 마지막 인사이트와 같으면 새로 생성하지 않음
+    captions = [p["caption"] for p in posts_data]
+    unchanged = find_unchanged_insight(db, keyword.id, captions)
+    if unchanged is not None:
+        return {"message": "포스트가 마지막 인사이트와 같아 새로 생성하지 않았습니다.", "insight_id": unchanged.id}
+
     # AI 분석 (재사용 가능한 AI 서비스)
     ai_service = AIService()
-    insights_data = await ai_service.generate_insights([p["caption"] for p in posts_data])
+    insights_data = await ai_service.generate_insights(captions)
 
     # 인사이트 저장
     insight = Insight(
@@ -50,7 +66,8 @@ async def generate_instagram_insight(
         keyword=keyword.keyword,
         summary_kr=insights_data.get("summary_kr"),
         summary_en=insights_data.get("summary_en"),
-        tweets_analyzed=len(posts_data)  # 여기서는 분석된 포스트 수를 저장
+        tweets_analyzed=len(posts_data),  # 여기서는 분석된 포스트 수를 저장
+        **fingerprint_fields(captions, insights_data)
     )
     db.add(insight)
     db.commit()
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import json
+from backend.database import get_db
+from backend.models.job import Job, JobStatus
+from backend.services.job_queue import queue_stats
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+def _job_dict(job: Job) -> dict:
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "payload": json.loads(job.payload),
+        "status": job.status.value,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "run_after": job.run_after.isoformat() if job.run_after else None,
+        "locked_by": job.locked_by,
+        "last_error": job.last_error,
+        "result": job.result,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+@router.get("/")
+async def get_jobs(
+    status: Optional[JobStatus] = None,
+    skip: int = 0,
+    limit: int = 50,
+    db: Session = Depends(get_db)
+) -> List[dict]:
+    """작업 목록 조회 (최신순)"""
+    query = db.query(Job)
+    if status:
+        query = query.filter(Job.status == status)
+    jobs = query.order_by(Job.id.desc()).offset(skip).limit(limit).all()
+    return [_job_dict(job) for job in jobs]
+
+
+@router.get("/stats")
+async def get_job_stats():
+    """상태별 작업 수"""
+    return queue_stats()
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: int, db: Session = Depends(get_db)):
+    """작업 상태 조회"""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return _job_dict(job)
@@ -8,7 +8,11 @@ from backend.models.keyword import Keyword
 from backend.models.insight import Insight
 from backend.models.post import Post, PostType
 from backend.services.twitter_service import TwitterService
+from backend.services.fetch_planner import plan_fetch
 from backend.services.ai_service import AIService
+from backend.services.job_queue import GENERATE_INSIGHT, enqueue
+from backend.services.content_fingerprint import find_unchanged_insight, fingerprint_fields
+from backend.config import settings
 
 router = APIRouter(prefix="/api/twitter/insights", tags=["twitter insights"])
 
@@ -36,9 +40,22 @@ async def generate_twitter_insight(
     if not keyword:
         raise HTTPException(status_code=404, detail="키워드를 찾을 수 없습니다.")
 
+    # 작업 큐를 쓰면 워커 프로세스가 인사이트와 포스트를 생성
+    if settings.job_queue_enabled:
+        job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": keyword.id}, dedupe_key=f"insight:{keyword.id}")
+        return {"message": "인사이트 생성 작업이 대기열에 추가되었습니다.", "job_id": job_id}
+
     # 트윗 수집
     twitter_service = TwitterService()
-    tweets = await twitter_service.search_tweets(keyword.keyword, max_results=10, hours=24)
+    plan = plan_fetch(keyword.keyword)
+    tweets = await twitter_service.search_tweets(
+        keyword.keyword, hours=plan.hours, candidates=plan.max_results
+    )
+
+    # 트윗이 마지막 인사이트와 같으면 새로 생성하지 않음
+    unchanged = find_unchanged_insight(db, keyword.id, tweets)
+    if unchanged is not None:
+        return {"message": "트윗이 마지막 인사이트와 같아 새로 생성하지 않았습니다.", "insight_id": unchanged.id}
 
     # AI 분석
     ai_service = AIService()
@@ -50,7 +67,8 @@ async def generate_twitter_insight(
         keyword=keyword.keyword,
         summary_kr=insights_data["summary_kr"],
         summary_en=insights_data["summary_en"],
-        tweets_analyzed=len(tweets)
+        tweets_analyzed=len(tweets),
+        **fingerprint_fields(tweets, insights_data)
     )
     db.add(insight)
     db.commit()
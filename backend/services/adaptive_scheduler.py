@@ -0,0 +1,163 @@
+"""
+트렌드 속도 기반 키워드별 스케줄
+모든 키워드를 고정 시간에 돌리는 대신, 실행 사이의 트윗 발생량 변화율(velocity)로 키워드마다 실행 간격을 정합니다.
+- velocity = 이번 발생량 / 지난 실행 때 발생량 (지수 이동 평균, 1이면 변화 없음)
+- 실행 간격 = 기본 간격 / velocity (최소/최대 간격 사이) → 급상승 키워드는 자주, 조용한 키워드는 드물게
+- 발생량이 조용함 기준(adaptive_quiet_tweets_per_hour)보다 적으면 기준값과 비교해, 변화가 없어도
+  발생량이 적을수록 간격이 늘어남 (0 → 0은 최대 간격)
+- 주기(tick)마다 실행 시각이 된 키워드를 velocity 순으로 골라, 시간당 LLM 예산 안에서만 실행
+  (예산이 모자라 밀린 키워드는 다음 tick에 다시 후보가 됨)
+- 스케줄은 실행이 생성/변화 없음으로 끝난 뒤에만 갱신 (레이트 리밋/실패한 키워드는 다음 tick에 재시도)
+발생량은 트윗 수집 때 갱신되는 tweet_cursors.tweets_per_hour를 사용합니다.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.models.insight import Insight
+from backend.models.keyword import Keyword
+from backend.models.keyword_schedule import KeywordSchedule
+from backend.services.fetch_planner import load_volumes
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 관측으로 velocity가 튀지 않도록 변화율을 이 범위로 제한
+MIN_RATIO = 0.1
+MAX_RATIO = 10.0
+
+
+def smoothed_velocity(previous: Optional[float], last_volume: Optional[float], volume: Optional[float]) -> float:
+    """
+    지난 실행 대비 발생량 변화율을 지수 이동 평균에 반영
+    지난 발생량이 조용함 기준보다 작으면 기준값으로 나눠, 발생량이 기준 아래에서 그대로면
+    "변화 없음"(1)이 아니라 기준 대비 비율(0 → 0이면 최소)로 봅니다.
+    """
+    if volume is None:
+        ratio = 1.0
+    elif last_volume is None and volume >= settings.adaptive_quiet_tweets_per_hour:
+        # 첫 관측이고 조용하지 않으면 비교 대상이 없으므로 변화 없음
+        ratio = 1.0
+    else:
+        baseline = max(last_volume or 0, settings.adaptive_quiet_tweets_per_hour, 1e-9)
+        ratio = min(max(volume / baseline, MIN_RATIO), MAX_RATIO)
+    if previous is None:
+        return ratio
+    alpha = settings.adaptive_velocity_smoothing
+    return alpha * ratio + (1 - alpha) * previous
+
+
+def interval_hours(velocity: float) -> float:
+    """velocity → 실행 간격 (시간)"""
+    interval = settings.adaptive_base_interval_hours / max(velocity, MIN_RATIO)
+    return min(max(interval, settings.adaptive_min_interval_hours), settings.adaptive_max_interval_hours)
+
+
+def llm_budget_left(db, now: datetime) -> int:
+    """최근 1시간 인사이트 생성 수를 뺀 남은 예산"""
+    used = db.query(Insight.id).filter(Insight.created_at >= now - timedelta(hours=1)).count()
+    return max(settings.adaptive_llm_budget_per_hour - used, 0)
+
+
+def select_due_keywords(now: Optional[datetime] = None) -> List[int]:
+    """
+    이번 tick에 실행할 키워드 선택
+    스케줄은 여기서 바꾸지 않고, 실행이 끝난 뒤 advance_schedules가 갱신합니다.
+    Returns: 실행할 keyword_id 목록 (velocity가 높은 순)
+    """
+    now = now or datetime.utcnow()
+    db = SessionLocal()
+    try:
+        keywords = db.query(Keyword).filter(Keyword.is_active == True).all()
+        if not keywords:
+            return []
+        schedules: Dict[int, KeywordSchedule] = {
+            schedule.keyword_id: schedule
+            for schedule in db.query(KeywordSchedule).filter(
+                KeywordSchedule.keyword_id.in_([keyword.id for keyword in keywords])
+            )
+        }
+        volumes = load_volumes([keyword.keyword for keyword in keywords])
+
+        due = []
+        for keyword in keywords:
+            schedule = schedules.get(keyword.id)
+            next_run_at = schedule.next_run_at.replace(tzinfo=None) if schedule and schedule.next_run_at else None
+            if next_run_at and next_run_at > now:
+                continue
+            velocity = smoothed_velocity(
+                schedule.velocity if schedule else None,
+                schedule.last_volume if schedule else None,
+                volumes[keyword.keyword]
+            )
+            overdue = (now - next_run_at).total_seconds() if next_run_at else 0
+            due.append((velocity, overdue, keyword))
+        # 급상승 키워드 먼저, 같으면 오래 밀린 키워드 먼저
+        due.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+        budget = llm_budget_left(db, now)
+        chosen = due[:budget]
+        if due:
+            logger.info(
+                f"적응형 스케줄: 실행 대상 {len(due)}개 중 {len(chosen)}개 실행"
+                + (f", {len(due) - len(chosen)}개는 LLM 예산 부족으로 다음으로 미룸" if len(due) > len(chosen) else "")
+            )
+        return [keyword.id for _, _, keyword in chosen]
+    finally:
+        db.close()
+
+
+def advance_schedules(keyword_ids: List[int], now: Optional[datetime] = None):
+    """
+    실행을 마친(생성 / 변화 없음) 키워드의 velocity와 다음 실행 시각 갱신
+    레이트 리밋/실패/시간 초과로 끝난 키워드는 호출하지 않으므로 스케줄이 그대로 남아 다음 tick에 다시 후보가 됩니다.
+    """
+    if not keyword_ids:
+        return
+    now = now or datetime.utcnow()
+    db = SessionLocal()
+    try:
+        keywords = db.query(Keyword).filter(Keyword.id.in_(keyword_ids)).all()
+        schedules: Dict[int, KeywordSchedule] = {
+            schedule.keyword_id: schedule
+            for schedule in db.query(KeywordSchedule).filter(KeywordSchedule.keyword_id.in_(keyword_ids))
+        }
+        volumes = load_volumes([keyword.keyword for keyword in keywords])
+        for keyword in keywords:
+            schedule = schedules.get(keyword.id)
+            if schedule is None:
+                schedule = KeywordSchedule(keyword_id=keyword.id)
+                db.add(schedule)
+            velocity = smoothed_velocity(schedule.velocity, schedule.last_volume, volumes[keyword.keyword])
+            hours = interval_hours(velocity)
+            schedule.velocity = velocity
+            schedule.last_volume = volumes[keyword.keyword]
+            schedule.interval_hours = hours
+            schedule.last_run_at = now
+            schedule.next_run_at = now + timedelta(hours=hours)
+        db.commit()
+    finally:
+        db.close()
+
+
+def schedule_snapshot() -> List[Dict]:
+    """키워드별 velocity / 실행 간격 / 다음 실행 시각"""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Keyword.keyword, KeywordSchedule)
+            .join(KeywordSchedule, KeywordSchedule.keyword_id == Keyword.id)
+            .order_by(KeywordSchedule.next_run_at)
+            .all()
+        )
+        return [
+            {
+                "keyword": keyword,
+                "velocity": round(schedule.velocity, 2) if schedule.velocity is not None else None,
+                "interval_hours": round(schedule.interval_hours, 2) if schedule.interval_hours is not None else None,
+                "next_run_at": schedule.next_run_at.isoformat() if schedule.next_run_at else None,
+            }
+            for keyword, schedule in rows
+        ]
+    finally:
+        db.close()
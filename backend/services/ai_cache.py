@@ -0,0 +1,208 @@
+"""
+AI 응답 캐시
+프롬프트 + 모델 + 생성 파라미터로 키를 만드는 2단계 캐시입니다.
+- 1단계: 프로세스 내 LRU (크기 제한)
+- 2단계: SQLite 디스크 캐시 (재시작 후에도 유지, 워커 간 공유)
+값은 JSON 문자열로 보관하고 조회할 때마다 새로 풀어 돌려주므로, 호출자가 받은 값을 고쳐도 캐시는 바뀌지 않습니다.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(prompt: str, model: str, temperature: float, max_tokens: int) -> str:
+    """프롬프트/모델/파라미터 기반 콘텐츠 주소 캐시 키 생성"""
+    payload = json.dumps(
+        {
+            "prompt": prompt,
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """LRU 메모리 캐시 + SQLite 디스크 캐시"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        disk_max_entries: Optional[int] = None,
+    ):
+        self.path = path if path is not None else settings.ai_cache_path
+        self.ttl = ttl if ttl is not None else settings.ai_cache_ttl
+        self.max_entries = max_entries if max_entries is not None else settings.ai_cache_max_entries
+        self.disk_max_entries = (
+            disk_max_entries if disk_max_entries is not None else settings.ai_cache_disk_max_entries
+        )
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._disk_ready = False
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+
+    # ---- 디스크 계층 (스레드에서 실행) ----
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        if not self._disk_ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS ai_response_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_ai_response_cache_accessed "
+                "ON ai_response_cache (accessed_at)"
+            )
+            conn.commit()
+            self._disk_ready = True
+        return conn
+
+    def _disk_get(self, key: str) -> Optional[Tuple[str, float]]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT value, created_at FROM ai_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if time.time() - created_at >= self.ttl:
+                conn.execute("DELETE FROM ai_response_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute(
+                "UPDATE ai_response_cache SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            conn.commit()
+            return value, created_at
+        finally:
+            conn.close()
+
+    def _disk_set(self, key: str, value: str, created_at: float):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_response_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, created_at, created_at),
+            )
+            # 만료 항목 및 용량 초과분(오래 사용되지 않은 순) 정리
+            conn.execute(
+                "DELETE FROM ai_response_cache WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+            conn.execute(
+                """DELETE FROM ai_response_cache WHERE key IN (
+                    SELECT key FROM ai_response_cache
+                    ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.disk_max_entries,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ---- 메모리 계층 ----
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        value, created_at = entry
+        if time.time() - created_at >= self.ttl:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_set(self, key: str, value: str, created_at: float):
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    # ---- 공개 API ----
+
+    async def _lookup(self, key: str) -> Optional[Any]:
+        """메모리 → 디스크 순으로 조회 (적중 통계만 기록, 미스는 호출자가 요청 단위로 기록)"""
+        value = self._memory_get(key)
+        if value is not None:
+            self._stats["memory_hits"] += 1
+            return json.loads(value)
+
+        if self.path:
+            try:
+                entry = await asyncio.to_thread(self._disk_get, key)
+            except sqlite3.Error as e:
+                logger.warning(f"디스크 캐시 조회 실패: {e}")
+                entry = None
+            if entry is not None:
+                value, created_at = entry
+                self._memory_set(key, value, created_at)
+                self._stats["disk_hits"] += 1
+                return json.loads(value)
+        return None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시 조회"""
+        value = await self._lookup(key)
+        if value is None:
+            self._stats["misses"] += 1
+        return value
+
+    async def get_first(self, keys: List[str]) -> Optional[Tuple[str, Any]]:
+        """
+        여러 키 중 처음 적중한 (키, 값) 조회
+        provider별 키를 차례로 보더라도 요청 하나당 미스는 한 번만 기록합니다.
+        """
+        for key in keys:
+            value = await self._lookup(key)
+            if value is not None:
+                return key, value
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: Any):
+        """캐시 저장 (메모리 + 디스크)"""
+        created_at = time.time()
+        text = json.dumps(value, ensure_ascii=False)
+        self._memory_set(key, text, created_at)
+        self._stats["sets"] += 1
+        if self.path:
+            try:
+                await asyncio.to_thread(self._disk_set, key, text, created_at)
+            except sqlite3.Error as e:
+                logger.warning(f"디스크 캐시 저장 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 통계"""
+        hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "hits": hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+
+# 프로세스 전역 캐시 (모든 AIService 인스턴스가 공유)
+response_cache = ResponseCache()
@@ -62,3 +62,13 @@ class InstagramPostResponse(BaseModel):
                 cleaned.append(tag)
         
         return cleaned[:15]  # 최대 15개로 제한
+
+
+class FusedResponse(InsightResponse):
+    """
+    fused(인사이트 + 트윗 + 인스타그램 한 번에) 응답 모델
+    인사이트는 필수, 나머지 섹션은 원본 그대로 받아 섹션별 모델로 따로 검증합니다.
+    """
+    tweets: Optional[List[str]] = Field(None, description="생성된 트윗 목록")
+    caption: Optional[str] = Field(None, description="캡션")
+    hashtags: Optional[List[str]] = Field(None, description="해시태그 목록")
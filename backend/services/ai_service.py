@@ -1,59 +1,73 @@
-from typing import List, Dict, Optional
-import json
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Dict, Optional, Sequence
+import contextlib
 import logging
-import hashlib
 import asyncio
-from functools import wraps
-from datetime import datetime, timedelta
+import time
 from backend.config import settings
-from backend.services.ai_models import InsightResponse, TweetResponse, InstagramPostResponse
+from backend.services.ai_cache import response_cache, make_cache_key
+from backend.services.provider_router import provider_router
+from backend.services.tweet_compaction import compact_tweets
+from backend.services.ai_models import InsightResponse, TweetResponse, InstagramPostResponse, FusedResponse
+from backend.services.llm_clients import get_openai_client, get_claude_client
+from backend.services.batch_service import run_batch
+from backend.services.response_parser import parse_structured
+from pydantic import TypeAdapter, ValidationError
 
 logger = logging.getLogger(__name__)
 
-# 간단한 인메모리 캐시
-_cache = {}
-_cache_timestamps = {}
-
-
-def cache_response(ttl: int = None):
-    """응답 캐싱 데코레이터"""
-    if ttl is None:
-        ttl = settings.ai_cache_ttl
-    
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # 캐시 키 생성
-            cache_key = hashlib.md5(
-                f"{func.__name__}:{str(args)}:{str(kwargs)}".encode()
-            ).hexdigest()
-            
-            # 캐시 확인
-            if cache_key in _cache:
-                timestamp = _cache_timestamps.get(cache_key)
-                if timestamp and (datetime.now() - timestamp).total_seconds() < ttl:
-                    logger.info(f"캐시 히트: {func.__name__}")
-                    return _cache[cache_key]
-                else:
-                    # 만료된 캐시 삭제
-                    del _cache[cache_key]
-                    del _cache_timestamps[cache_key]
-            
-            # 캐시 미스 - 함수 실행
-            logger.info(f"캐시 미스: {func.__name__}")
-            result = await func(*args, **kwargs)
-            
-            # 결과 캐싱
-            _cache[cache_key] = result
-            _cache_timestamps[cache_key] = datetime.now()
-            
-            return result
-        return wrapper
-    return decorator
-
-
-async def retry_with_backoff(func, max_retries: int = None, timeout: int = None):
-    """재시도 로직 with exponential backoff"""
+OPENAI_MODEL = "gpt-4o-mini"
+CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
+
+INSIGHT_ADAPTER = TypeAdapter(InsightResponse)
+TWEET_ADAPTER = TypeAdapter(TweetResponse)
+INSTAGRAM_ADAPTER = TypeAdapter(InstagramPostResponse)
+FUSED_ADAPTER = TypeAdapter(FusedResponse)
+
+# LLM이 아닌 더미/대체 인사이트에 붙는 표시 (지문 저장, 변경 없음 판단에서 제외)
+FALLBACK_KEY = "is_fallback"
+
+
+def is_fallback(insights: Optional[Dict]) -> bool:
+    """LLM 호출 실패 등으로 더미 데이터가 반환된 인사이트인지"""
+    return bool(insights and insights.get(FALLBACK_KEY))
+
+SYSTEM_PROMPT = (
+    "You are an expert social media analyst and content creator. "
+    "You analyze trends and create engaging, high-quality content. "
+    "Always respond in valid JSON format when requested."
+)
+
+# 진행 중인 동일 요청 (single-flight)
+_inflight: Dict[str, "asyncio.Task"] = {}
+
+
+async def single_flight(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    같은 키로 동시에 들어온 요청을 하나의 실행으로 합침
+    첫 호출자가 작업을 시작하고, 이후 호출자는 같은 결과를 기다립니다.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.info("동일한 AI 요청이 진행 중, 결과를 공유합니다.")
+    # 한 호출자가 취소되어도 공유 작업은 계속 진행
+    return await asyncio.shield(task)
+
+
+async def retry_with_backoff(
+    func,
+    max_retries: int = None,
+    timeout: int = None,
+    should_retry: Optional[Callable[[], bool]] = None,
+    on_failure: Optional[Callable[[Exception], None]] = None,
+):
+    """
+    재시도 로직 with exponential backoff
+    on_failure는 매 실패마다 호출되고, should_retry가 False를 반환하면 즉시 중단합니다.
+    """
     if max_retries is None:
         max_retries = settings.ai_max_retries
     if timeout is None:
@@ -73,6 +87,12 @@ async def retry_with_backoff(func, max_retries: int = None, timeout: int = None)
             last_exception = e
             logger.warning(f"API 호출 실패 (시도 {attempt + 1}/{max_retries}): {e}")
         
+        if on_failure is not None:
+            on_failure(last_exception)
+        if should_retry is not None and not should_retry():
+            logger.info("회로 차단기가 열려 재시도를 중단합니다.")
+            break
+        
         # 마지막 시도가 아니면 대기
         if attempt < max_retries - 1:
             wait_time = 2 ** attempt  # exponential backoff: 1, 2, 4초
@@ -83,27 +103,235 @@ async def retry_with_backoff(func, max_retries: int = None, timeout: int = None)
     raise last_exception
 
 
+def hedge_delay(provider: str, model: str) -> float:
+    """
+    헤지 요청을 보내기 전 대기 시간
+    설정값이 있으면 그대로 사용하고, 없으면 최근 지연 시간의 p95를 사용합니다.
+    """
+    if settings.ai_hedge_delay:
+        return settings.ai_hedge_delay
+    p95 = provider_router.latency_percentile(provider, model, 0.95)
+    if p95 is None or provider_router.sample_count(provider, model) < settings.ai_router_min_samples:
+        return settings.ai_hedge_default_delay
+    return p95
+
+
+def parse_provider_order(value: str) -> List[str]:
+    """콤마로 구분된 provider 순서 문자열 파싱"""
+    return [p.strip().lower() for p in value.split(",") if p.strip()]
+
+
 class AIService:
     def __init__(self):
         self.openai_api_key = settings.openai_api_key
         self.claude_api_key = settings.claude_api_key
 
-    @cache_response()
-    async def generate_insights(self, tweets: List[str]) -> Dict:
+    def _provider_chain(self, order: Sequence[str]) -> List[tuple]:
+        """사용 가능한 (provider, model) 목록을 우선순위 순으로 반환"""
+        chain = []
+        for provider in order:
+            if provider == "openai" and self.openai_api_key:
+                chain.append(("openai", OPENAI_MODEL))
+            elif provider == "claude" and self.claude_api_key:
+                chain.append(("claude", CLAUDE_MODEL))
+        return chain
+
+    async def _call_provider(
+        self, provider: str, prompt: str, model: str, max_tokens: Optional[int] = None
+    ) -> str:
+        """provider 이름으로 API 호출 (성공 시 지연 시간 기록)"""
+        started = time.monotonic()
+        if provider == "openai":
+            result = await self._call_openai(prompt, model=model, max_tokens=max_tokens)
+        else:
+            result = await self._call_claude(prompt, model=model, max_tokens=max_tokens)
+        provider_router.record_success(provider, model, time.monotonic() - started)
+        return result
+
+    async def _generate(
+        self,
+        prompt: str,
+        parser: Callable[[str], Optional[Any]],
+        order: Sequence[str],
+        max_tokens: Optional[int] = None,
+    ) -> Optional[Any]:
         """
-        트윗 리스트를 분석하여 트렌드 요약 생성
-        Returns: {summary_kr: str, summary_en: str}
+        캐시 확인 후 provider를 순서대로 호출하여 파싱된 결과 반환
+        동일한 프롬프트의 동시 요청은 하나의 호출로 합쳐집니다.
         """
-        if not tweets:
-            return {
-                "summary_kr": "분석할 트윗이 없습니다.",
-                "summary_en": "No tweets to analyze."
-            }
+        max_tokens = max_tokens or settings.ai_max_tokens
+        chain = [
+            (provider, model, make_cache_key(prompt, model, settings.ai_temperature, max_tokens))
+            for provider, model in self._provider_chain(order)
+        ]
 
-        tweets_text = "\n".join(tweets[:20])  # 상위 20개만 사용
-        
+        # 어느 provider든 캐시된 결과가 있으면 바로 사용
+        cached = await response_cache.get_first([key for _, _, key in chain])
+        if cached is not None:
+            provider, model = next((provider, model) for provider, model, key in chain if key == cached[0])
+            logger.info(f"캐시 히트: {provider}/{model}")
+            return cached[1]
+
+        flight_key = make_cache_key(
+            prompt, ",".join(order), settings.ai_temperature, max_tokens
+        )
+        return await single_flight(
+            flight_key, lambda: self._call_chain(prompt, parser, chain, max_tokens)
+        )
+
+    async def _call_chain(
+        self,
+        prompt: str,
+        parser: Callable[[str], Optional[Any]],
+        chain: List[tuple],
+        max_tokens: int,
+    ) -> Optional[Any]:
+        """
+        provider를 라우터가 정한 순서대로 호출하고 첫 번째로 파싱에 성공한 결과를 캐시에 저장
+        회로 차단기가 열린 provider는 건너뜁니다.
+        """
+        if not chain:
+            logger.warning("설정된 AI provider가 없습니다 (API 키 미설정).")
+            return None
+        chain = provider_router.order(chain)
+        if not chain:
+            logger.warning("호출 가능한 AI provider가 없습니다 (회로 차단기 열림).")
+            return None
+
+        if settings.ai_hedge_enabled and len(chain) > 1:
+            return await self._call_hedged(prompt, parser, chain, max_tokens)
+
+        for provider, model, key in chain:
+            if not provider_router.allow(provider, model):
+                continue
+            try:
+                key, parsed = await self._attempt(
+                    provider, model, key, prompt, parser, max_tokens
+                )
+            except Exception as e:
+                logger.error(f"{provider} API 호출 실패: {e}")
+                continue
+
+            await response_cache.set(key, parsed)
+            return parsed
+
+        return None
+
+    async def _attempt(
+        self,
+        provider: str,
+        model: str,
+        key: str,
+        prompt: str,
+        parser: Callable[[str], Optional[Any]],
+        max_tokens: int,
+    ) -> tuple:
+        """provider 호출 + 파싱 (파싱 실패도 예외로 처리)"""
+        try:
+            result = await retry_with_backoff(
+                lambda: self._call_provider(provider, prompt, model, max_tokens),
+                should_retry=lambda: not provider_router.is_open(provider, model),
+                on_failure=lambda _: provider_router.record_failure(provider, model),
+            )
+        except asyncio.CancelledError:
+            # 헤지 요청에서 취소된 경우 half-open probe 슬롯 반환
+            provider_router.release(provider, model)
+            raise
+        parsed = parser(result) if result else None
+        if not parsed:
+            raise ValueError(f"{provider} 응답 파싱 실패")
+        return key, parsed
+
+    async def _call_hedged(
+        self,
+        prompt: str,
+        parser: Callable[[str], Optional[Any]],
+        chain: List[tuple],
+        max_tokens: int,
+    ) -> Optional[Any]:
+        """
+        헤지 요청: 현재 provider가 헤지 지연 시간 안에 응답하지 않거나 실패하면
+        다음 provider를 동시에 호출하고, 먼저 검증을 통과한 응답을 사용합니다.
+        나머지 요청은 취소되고, 취소 시점까지의 경과 시간을 지연 시간 샘플로 기록합니다.
+        """
+        remaining = list(chain)
+        pending = set()
+        launched: Dict[asyncio.Future, tuple] = {}
+        last_launched = None
+
+        def launch() -> bool:
+            nonlocal last_launched
+            while remaining:
+                provider, model, key = remaining.pop(0)
+                if not provider_router.allow(provider, model):
+                    continue
+                last_launched = (provider, model)
+                task = asyncio.ensure_future(
+                    self._attempt(provider, model, key, prompt, parser, max_tokens)
+                )
+                launched[task] = (provider, model, time.monotonic())
+                pending.add(task)
+                return True
+            return False
+
+        launch()
+        try:
+            while pending:
+                timeout = hedge_delay(*last_launched) if remaining else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.info(f"{last_launched[0]} 응답 지연 ({timeout:.1f}초), 헤지 요청 시작")
+                    launch()
+                    continue
+
+                failed = False
+                for task in done:
+                    pending.discard(task)
+                    if task.exception() is None:
+                        key, parsed = task.result()
+                        await response_cache.set(key, parsed)
+                        return parsed
+                    logger.warning(f"헤지 요청 실패: {task.exception()}")
+                    failed = True
+
+                if failed:
+                    launch()
+            return None
+        finally:
+            now = time.monotonic()
+            for task in pending:
+                task.cancel()
+                provider, model, started = launched[task]
+                provider_router.record_cancelled(provider, model, now - started)
+
+    def _format_tweets(self, tweets: List[str]) -> str:
+        """
+        프롬프트에 넣을 트윗 목록 텍스트
+        유사 트윗은 대표 1개 + 개수로 묶고, 토큰 예산 안에서만 포함합니다.
+        tweets는 참여도 순으로 정렬된 후보 전체이므로, 대표는 클러스터에서 순위가 가장 높은 트윗이고
+        복사본이 상위를 채우더라도 남은 예산은 그다음 순위의 다른 트윗으로 채워집니다.
+        """
+        clusters = compact_tweets(
+            tweets,
+            token_budget=settings.ai_prompt_token_budget,
+            threshold=settings.ai_dedupe_threshold,
+        )
+        lines = []
+        for cluster in clusters:
+            text = " ".join(cluster.text.split())
+            if cluster.count > 1:
+                lines.append(f"- (유사 트윗 {cluster.count}개) {text}")
+            else:
+                lines.append(f"- {text}")
+        logger.info(f"트윗 압축: {len(tweets)}개 → {len(clusters)}개")
+        return "\n".join(lines)
+
+    def _build_insights_prompt(self, tweets_text: str) -> str:
+        """인사이트 생성 프롬프트"""
         # 개선된 프롬프트 - JSON 응답 강제
-        prompt = f"""다음 트윗들을 분석하여 주요 트렌드를 요약해주세요.
+        return f"""다음 트윗들을 분석하여 주요 트렌드를 요약해주세요.
 
 트윗 목록:
 {tweets_text}
@@ -120,56 +348,107 @@ class AIService:
 - 트렌드의 맥락과 의미 설명
 - 각 언어로 독립적으로 작성 (단순 번역 X)"""
 
-        try:
-            # OpenAI API 시도
-            if self.openai_api_key:
-                result = await retry_with_backoff(
-                    lambda: self._call_openai(prompt, model="gpt-4o-mini")
-                )
-                if result and "OpenAI API key" not in result:
-                    parsed = self._parse_insights(result)
-                    if parsed:
-                        return parsed
-            
-            # Claude API 시도
-            if self.claude_api_key:
-                result = await retry_with_backoff(
-                    lambda: self._call_claude(prompt, model="claude-3-5-sonnet-20241022")
-                )
-                if result and "Claude API key" not in result:
-                    parsed = self._parse_insights(result)
-                    if parsed:
-                        return parsed
-        except Exception as e:
-            logger.error(f"AI API 호출 중 오류: {e}", exc_info=True)
+    async def generate_insights(self, tweets: List[str]) -> Dict:
+        """
+        트윗 리스트를 분석하여 트렌드 요약 생성
+        Returns: {summary_kr: str, summary_en: str} (더미 데이터면 is_fallback: True 포함)
+        """
+        if not tweets:
+            return {
+                "summary_kr": "분석할 트윗이 없습니다.",
+                "summary_en": "No tweets to analyze.",
+                FALLBACK_KEY: True
+            }
+
+        tweets_text = await asyncio.to_thread(self._format_tweets, tweets)
+        prompt = self._build_insights_prompt(tweets_text)
+
+        parsed = await self._generate(
+            prompt, self._parse_insights, parse_provider_order(settings.ai_provider_order)
+        )
+        if parsed:
+            return parsed
 
         # API 호출 실패 시 더미 데이터 반환
         logger.warning("AI API 호출 실패, 더미 데이터 반환")
         return self._get_dummy_insights(len(tweets))
+
+    async def stream_insights(self, tweets: List[str]) -> AsyncIterator[Dict]:
+        """
+        스트리밍 인사이트 생성
+        Yields:
+            {"type": "token", "text": str}  생성 중인 응답 조각
+            {"type": "reset"}               provider 전환 (이전 조각 폐기)
+            {"type": "result", "data": {summary_kr, summary_en}}  최종 결과 (항상 마지막)
+        """
+        if not tweets:
+            yield {"type": "result", "data": await self.generate_insights(tweets)}
+            return
+
+        tweets_text = await asyncio.to_thread(self._format_tweets, tweets)
+        prompt = self._build_insights_prompt(tweets_text)
+        max_tokens = settings.ai_max_tokens
+        chain = [
+            (provider, model, make_cache_key(prompt, model, settings.ai_temperature, max_tokens))
+            for provider, model in self._provider_chain(
+                parse_provider_order(settings.ai_provider_order)
+            )
+        ]
+
+        cached = await response_cache.get_first([key for _, _, key in chain])
+        if cached is not None:
+            yield {"type": "result", "data": cached[1]}
+            return
+
+        streamed = False
+        for provider, model, key in provider_router.order(chain):
+            if not provider_router.allow(provider, model):
+                continue
+            chunks = []
+            started = time.monotonic()
+            try:
+                if streamed:
+                    yield {"type": "reset"}
+                stream = (
+                    self._stream_openai(prompt, model, max_tokens)
+                    if provider == "openai"
+                    else self._stream_claude(prompt, model, max_tokens)
+                )
+                async for delta in stream:
+                    chunks.append(delta)
+                    streamed = True
+                    yield {"type": "token", "text": delta}
+            except Exception as e:
+                logger.error(f"{provider} 스트리밍 호출 실패: {e}")
+                provider_router.record_failure(provider, model)
+                continue
+            except BaseException:
+                # 취소(CancelledError) 또는 클라이언트 연결 종료로 aclose()된 경우(GeneratorExit):
+                # 성공/실패로 세지 않고 half-open 시험 호출 슬롯만 반납
+                provider_router.release(provider, model)
+                raise
+            provider_router.record_success(provider, model, time.monotonic() - started)
+
+            parsed = self._parse_insights("".join(chunks))
+            if parsed:
+                await response_cache.set(key, parsed)
+                yield {"type": "result", "data": parsed}
+                return
+
+        logger.warning("AI 스트리밍 호출 실패, 더미 데이터 반환")
+        yield {"type": "result", "data": self._get_dummy_insights(len(tweets))}
     
     def _parse_insights(self, text: str) -> Optional[Dict]:
-        """AI 응답에서 한글/영문 요약 파싱 (JSON 우선)"""
-        try:
-            # JSON 파싱 시도
-            # 코드 블록 제거
-            text = text.strip()
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-            
-            data = json.loads(text)
-            
-            # Pydantic 모델로 검증
-            validated = InsightResponse(**data)
+        """AI 응답에서 한글/영문 요약 파싱 (JSON 우선, 실패 시 텍스트 파싱)"""
+        result = parse_structured(
+            text, INSIGHT_ADAPTER, "insights", fallback=self._parse_insights_text
+        )
+        if isinstance(result.value, InsightResponse):
             return {
-                "summary_kr": validated.summary_kr,
-                "summary_en": validated.summary_en
+                "summary_kr": result.value.summary_kr,
+                "summary_en": result.value.summary_en
             }
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"JSON 파싱 실패, 텍스트 파싱 시도: {e}")
-            # 폴백: 텍스트 기반 파싱
-            return self._parse_insights_text(text)
+        return result.value
     
     def _parse_insights_text(self, text: str) -> Optional[Dict]:
         """텍스트 기반 파싱 (폴백)"""
@@ -205,7 +484,6 @@ class AIService:
         
         return None
 
-    @cache_response()
     async def generate_tweets(self, insights: Dict, count: int = 5) -> List[str]:
         """
         인사이트를 바탕으로 트윗 초안 생성
@@ -236,52 +514,28 @@ class AIService:
 - 이모지를 적절히 활용하여 시각적 매력 추가
 - 행동을 유도하는 CTA 포함 고려"""
 
-        try:
-            # OpenAI API 시도
-            if self.openai_api_key:
-                result = await retry_with_backoff(
-                    lambda: self._call_openai(prompt, model="gpt-4o-mini")
-                )
-                if result and "OpenAI API key" not in result:
-                    tweets = self._parse_tweets(result, count)
-                    if tweets:
-                        return tweets
-            
-            # Claude API 시도
-            if self.claude_api_key:
-                result = await retry_with_backoff(
-                    lambda: self._call_claude(prompt, model="claude-3-5-sonnet-20241022")
-                )
-                if result and "Claude API key" not in result:
-                    tweets = self._parse_tweets(result, count)
-                    if tweets:
-                        return tweets
-        except Exception as e:
-            logger.error(f"트윗 생성 중 오류: {e}", exc_info=True)
+        tweets = await self._generate(
+            prompt,
+            lambda text: self._parse_tweets(text, count),
+            parse_provider_order(settings.ai_provider_order),
+        )
+        if tweets:
+            return tweets
 
         # API 호출 실패 시 더미 데이터 반환
         logger.warning("AI API 호출 실패, 더미 트윗 반환")
         return self._get_dummy_tweets(summary, count)
     
     def _parse_tweets(self, text: str, count: int) -> Optional[List[str]]:
-        """AI 응답에서 트윗 목록 파싱 (JSON 우선)"""
-        try:
-            # JSON 파싱 시도
-            text = text.strip()
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-            
-            data = json.loads(text)
-            
-            # Pydantic 모델로 검증
-            validated = TweetResponse(**data)
-            return validated.tweets[:count]
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"JSON 파싱 실패, 텍스트 파싱 시도: {e}")
-            # 폴백: 텍스트 기반 파싱
-            return self._parse_tweets_text(text, count)
+        """AI 응답에서 트윗 목록 파싱 (JSON 우선, 실패 시 텍스트 파싱)"""
+        result = parse_structured(
+            text, TWEET_ADAPTER, "tweets", fallback=lambda t: self._parse_tweets_text(t, count)
+        )
+        if result.value is None:
+            return None
+        if isinstance(result.value, TweetResponse):
+            return result.value.tweets[:count]
+        return result.value
     
     def _parse_tweets_text(self, text: str, count: int) -> Optional[List[str]]:
         """텍스트 기반 트윗 파싱 (폴백)"""
@@ -307,7 +561,6 @@ class AIService:
         
         return tweets if tweets else None
 
-    @cache_response()
     async def generate_instagram_post(self, insights: Dict) -> Dict:
         """
         인사이트를 바탕으로 인스타그램 캡션 + 해시태그 생성
@@ -334,55 +587,30 @@ class AIService:
 - 스토리텔링 요소 포함
 - 독자의 참여를 유도하는 질문이나 CTA 포함"""
 
-        try:
-            # Claude API 우선 사용 (인스타그램 포스트에 더 적합)
-            if self.claude_api_key:
-                result = await retry_with_backoff(
-                    lambda: self._call_claude(prompt, model="claude-3-5-sonnet-20241022")
-                )
-                if result and "Claude API key" not in result:
-                    parsed = self._parse_instagram_post(result)
-                    if parsed:
-                        return parsed
-            
-            # OpenAI API 시도
-            if self.openai_api_key:
-                result = await retry_with_backoff(
-                    lambda: self._call_openai(prompt, model="gpt-4o-mini")
-                )
-                if result and "OpenAI API key" not in result:
-                    parsed = self._parse_instagram_post(result)
-                    if parsed:
-                        return parsed
-        except Exception as e:
-            logger.error(f"인스타그램 포스트 생성 중 오류: {e}", exc_info=True)
+        # 기본값은 Claude 우선 (인스타그램 포스트에 더 적합)
+        parsed = await self._generate(
+            prompt,
+            self._parse_instagram_post,
+            parse_provider_order(settings.ai_instagram_provider_order),
+        )
+        if parsed:
+            return parsed
 
         # API 호출 실패 시 더미 데이터 반환
         logger.warning("AI API 호출 실패, 더미 인스타그램 포스트 반환")
         return self._get_dummy_instagram_post(summary)
     
     def _parse_instagram_post(self, text: str) -> Optional[Dict]:
-        """AI 응답에서 인스타그램 캡션과 해시태그 파싱 (JSON 우선)"""
-        try:
-            # JSON 파싱 시도
-            text = text.strip()
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-            
-            data = json.loads(text)
-            
-            # Pydantic 모델로 검증
-            validated = InstagramPostResponse(**data)
+        """AI 응답에서 인스타그램 캡션과 해시태그 파싱 (JSON 우선, 실패 시 텍스트 파싱)"""
+        result = parse_structured(
+            text, INSTAGRAM_ADAPTER, "instagram", fallback=self._parse_instagram_post_text
+        )
+        if isinstance(result.value, InstagramPostResponse):
             return {
-                "caption": validated.caption,
-                "hashtags": validated.hashtags
+                "caption": result.value.caption,
+                "hashtags": result.value.hashtags
             }
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"JSON 파싱 실패, 텍스트 파싱 시도: {e}")
-            # 폴백: 텍스트 기반 파싱
-            return self._parse_instagram_post_text(text)
+        return result.value
     
     def _parse_instagram_post_text(self, text: str) -> Optional[Dict]:
         """텍스트 기반 인스타그램 포스트 파싱 (폴백)"""
@@ -427,22 +655,174 @@ class AIService:
         
         return None
 
-    async def _call_openai(self, prompt: str, model: str = "gpt-4o-mini") -> str:
+    async def build_fused_prompt(self, tweets: List[str], count: int = 5) -> str:
+        """fused 생성 프롬프트 (인사이트 + 트윗 초안 + 인스타그램 포스트)"""
+        tweets_text = await asyncio.to_thread(self._format_tweets, tweets)
+        return f"""다음 트윗들을 분석하여 주요 트렌드를 요약하고, 그 요약을 바탕으로 트윗 초안 {count}개와 인스타그램 포스트를 작성해주세요.
+
+트윗 목록:
+{tweets_text}
+
+반드시 다음 JSON 형식으로만 응답해주세요:
+{{
+  "summary_kr": "한국어로 작성된 주요 트렌드 요약 (3-5개의 구체적인 포인트)",
+  "summary_en": "English summary of main trends (3-5 specific points)",
+  "tweets": ["첫 번째 트윗 내용", "두 번째 트윗 내용", ...],
+  "caption": "인스타그램 캡션 내용 (이모지 포함)",
+  "hashtags": ["해시태그1", "해시태그2", ...]
+}}
+
+요약 작성 가이드:
+- 구체적이고 실용적인 인사이트 제공
+- 감정적 톤과 주요 키워드 파악
+- 각 언어로 독립적으로 작성 (단순 번역 X)
+
+트윗 작성 가이드:
+- 각 트윗은 280자 이내, 해시태그는 최대 2-3개
+- 각 트윗은 서로 다른 관점이나 포인트를 다루기
+- 이모지와 CTA를 적절히 활용
+
+인스타그램 작성 가이드:
+- 캡션은 500-1000자 정도, 스토리텔링과 참여 유도 질문 포함
+- 해시태그는 5-10개 정도, 관련성 높은 것만"""
+
+    async def generate_all(self, tweets: List[str], count: int = 5) -> Dict:
+        """
+        인사이트 + 트윗 초안 + 인스타그램 포스트를 한 번의 호출로 생성 (fused 모드)
+        Returns: {insights: {summary_kr, summary_en}, tweets: List[str], instagram: {caption, hashtags}}
+        검증에 실패한 섹션만 개별 생성 메서드로 다시 생성합니다.
+        """
+        bundle = {}
+        if tweets:
+            prompt = await self.build_fused_prompt(tweets, count)
+            bundle = await self._generate(
+                prompt,
+                lambda text: self._parse_fused(text, count),
+                parse_provider_order(settings.ai_provider_order),
+                max_tokens=settings.ai_fused_max_tokens,
+            ) or {}
+
+        return await self._complete_bundle(tweets, bundle, count)
+
+    async def _complete_bundle(self, tweets: List[str], bundle: Dict, count: int) -> Dict:
+        """fused 결과에서 빠진 섹션을 개별 생성 메서드로 채움"""
+        insights = bundle.get("insights")
+        if not insights:
+            insights = await self.generate_insights(tweets)
+        tweet_drafts = bundle.get("tweets")
+        if not tweet_drafts:
+            tweet_drafts = await self.generate_tweets(insights, count=count)
+        instagram = bundle.get("instagram")
+        if not instagram:
+            instagram = await self.generate_instagram_post(insights)
+
+        return {"insights": insights, "tweets": tweet_drafts, "instagram": instagram}
+
+    async def generate_all_batch(
+        self,
+        tweet_sets: Dict[str, List[str]],
+        count: int = 5,
+        timeout: Optional[float] = None,
+        llm: Optional[asyncio.Semaphore] = None,
+    ) -> Dict[str, Dict]:
+        """
+        여러 키워드의 fused 결과를 provider batch API 한 번으로 생성 (스케줄 실행용)
+        Args: {custom_id: 트윗 목록}, batch 대기 제한 시간, 일반 호출 동시 실행 제한
+        Returns: {custom_id: generate_all과 같은 형식}
+        batch에서 결과를 얻지 못한 항목은 일반 호출로 동시에 생성합니다 (llm 세마포어 안에서).
+        """
+        max_tokens = settings.ai_fused_max_tokens
+        prompts = {
+            custom_id: await self.build_fused_prompt(tweets, count)
+            for custom_id, tweets in tweet_sets.items()
+            if tweets
+        }
+
+        texts: Dict[str, str] = {}
+        chain = [
+            (provider, model)
+            for provider, model in self._provider_chain(
+                parse_provider_order(settings.ai_provider_order)
+            )
+            if provider_router.is_available(provider, model)
+        ]
+        if prompts and chain:
+            provider, model = chain[0]
+            try:
+                texts = await run_batch(
+                    provider, model, prompts, max_tokens,
+                    system_prompt=SYSTEM_PROMPT, timeout=timeout
+                )
+            except Exception as e:
+                logger.error(f"{provider} batch 실행 실패, 개별 호출로 전환: {e}", exc_info=True)
+
+        async def fallback(tweets: List[str]) -> Dict:
+            async with (llm if llm is not None else contextlib.nullcontext()):
+                return await self.generate_all(tweets, count=count)
+
+        results = {}
+        fallbacks = {}
+        for custom_id, tweets in tweet_sets.items():
+            bundle = self._parse_fused(texts[custom_id], count) if custom_id in texts else None
+            if bundle is None:
+                fallbacks[custom_id] = fallback(tweets)
+                continue
+            await response_cache.set(
+                make_cache_key(prompts[custom_id], model, settings.ai_temperature, max_tokens),
+                bundle,
+            )
+            results[custom_id] = await self._complete_bundle(tweets, bundle, count)
+        if fallbacks:
+            logger.info(f"batch 결과가 없는 {len(fallbacks)}개 항목을 개별 호출로 생성")
+            results.update(zip(fallbacks, await asyncio.gather(*fallbacks.values())))
+        return results
+
+    def _parse_fused(self, text: str, count: int) -> Optional[Dict]:
+        """fused 응답을 섹션별로 검증 (유효한 섹션만 반환)"""
+        # 인사이트가 없으면 나머지 섹션도 근거가 없으므로 전체 실패로 처리
+        fused = parse_structured(text, FUSED_ADAPTER, "fused").value
+        if fused is None:
+            logger.warning("fused 응답 파싱 실패")
+            return None
+
+        result = {
+            "insights": {
+                "summary_kr": fused.summary_kr,
+                "summary_en": fused.summary_en
+            }
+        }
+        try:
+            result["tweets"] = TWEET_ADAPTER.validate_python({"tweets": fused.tweets}).tweets[:count]
+        except ValidationError as e:
+            logger.warning(f"fused 응답 트윗 검증 실패: {e}")
+        try:
+            validated = INSTAGRAM_ADAPTER.validate_python(
+                {"caption": fused.caption, "hashtags": fused.hashtags}
+            )
+            result["instagram"] = {
+                "caption": validated.caption,
+                "hashtags": validated.hashtags
+            }
+        except ValidationError as e:
+            logger.warning(f"fused 응답 인스타그램 검증 실패: {e}")
+        return result
+
+    async def _call_openai(
+        self, prompt: str, model: str = "gpt-4o-mini", max_tokens: Optional[int] = None
+    ) -> str:
         """OpenAI API 호출"""
         if not self.openai_api_key:
             return "OpenAI API key가 설정되지 않았습니다."
         
         try:
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=self.openai_api_key)
+            client = get_openai_client()
             
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are an expert social media analyst and content creator. You analyze trends and create engaging, high-quality content. Always respond in valid JSON format when requested."
+                        "content": SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -450,7 +830,7 @@ class AIService:
                     }
                 ],
                 temperature=settings.ai_temperature,
-                max_tokens=settings.ai_max_tokens,
+                max_tokens=max_tokens or settings.ai_max_tokens,
                 response_format={"type": "json_object"}  # JSON 모드 강제
             )
             
@@ -460,19 +840,22 @@ class AIService:
             logger.error(f"OpenAI API 호출 오류: {e}", exc_info=True)
             raise
 
-    async def _call_claude(self, prompt: str, model: str = "claude-3-5-sonnet-20241022") -> str:
+    async def _call_claude(
+        self,
+        prompt: str,
+        model: str = "claude-3-5-sonnet-20241022",
+        max_tokens: Optional[int] = None,
+    ) -> str:
         """Claude API 호출"""
         if not self.claude_api_key:
             return "Claude API key가 설정되지 않았습니다."
         
         try:
-            import anthropic
+            client = get_claude_client()
             
-            client = anthropic.Anthropic(api_key=self.claude_api_key)
-            
-            response = client.messages.create(
+            response = await client.messages.create(
                 model=model,
-                max_tokens=settings.ai_max_tokens,
+                max_tokens=max_tokens or settings.ai_max_tokens,
                 temperature=settings.ai_temperature,
                 messages=[
                     {
@@ -488,6 +871,42 @@ class AIService:
             logger.error(f"Claude API 호출 오류: {e}", exc_info=True)
             raise
     
+    async def _stream_openai(
+        self, prompt: str, model: str, max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """OpenAI 스트리밍 호출 (텍스트 조각 단위로 반환)"""
+        client = get_openai_client()
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=settings.ai_temperature,
+            max_tokens=max_tokens or settings.ai_max_tokens,
+            response_format={"type": "json_object"},
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def _stream_claude(
+        self, prompt: str, model: str, max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """Claude 스트리밍 호출 (텍스트 조각 단위로 반환)"""
+        client = get_claude_client()
+        stream = await client.messages.create(
+            model=model,
+            max_tokens=max_tokens or settings.ai_max_tokens,
+            temperature=settings.ai_temperature,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True
+        )
+        async for event in stream:
+            if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                yield event.delta.text
+
     # 더미 데이터 생성 메서드들
     def _get_dummy_insights(self, tweet_count: int) -> Dict:
         """더미 인사이트 생성"""
@@ -503,7 +922,8 @@ class AIService:
 
         return {
             "summary_kr": summary_kr,
-            "summary_en": summary_en
+            "summary_en": summary_en,
+            FALLBACK_KEY: True
         }
     
     def _get_dummy_tweets(self, summary: str, count: int) -> List[str]:
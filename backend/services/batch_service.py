@@ -0,0 +1,238 @@
+"""
+Provider batch API 클라이언트
+여러 프롬프트를 OpenAI Batch API / Anthropic Message Batches API로 한 번에 제출하고,
+완료될 때까지 폴링한 뒤 custom_id별 응답 텍스트를 돌려줍니다.
+대화형 지연이 필요 없는 스케줄 실행에서 비용을 줄이기 위해 사용합니다.
+"""
+from typing import Dict, Optional
+import asyncio
+import json
+import logging
+import time
+import httpx
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+OPENAI_DEFAULT_BASE_URL = "https://api.openai.com/v1"
+CLAUDE_DEFAULT_BASE_URL = "https://api.anthropic.com"
+ANTHROPIC_VERSION = "2023-06-01"
+
+
+class BatchError(Exception):
+    """batch 제출/실행 실패"""
+
+
+async def run_batch(
+    provider: str,
+    model: str,
+    prompts: Dict[str, str],
+    max_tokens: int,
+    system_prompt: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, str]:
+    """
+    batch 제출 → 완료 대기 → 결과 수집
+    timeout(초)이 지나도 끝나지 않으면 batch를 취소합니다 (기본값 ai_batch_timeout).
+    Returns: {custom_id: 응답 텍스트} (실패한 항목은 포함되지 않음)
+    """
+    timeout = timeout or settings.ai_batch_timeout
+    async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=10.0)) as client:
+        if provider == "openai":
+            batch = _OpenAIBatch(client, model, max_tokens, system_prompt)
+        else:
+            batch = _ClaudeBatch(client, model, max_tokens, system_prompt)
+
+        batch_id = await batch.submit(prompts)
+        logger.info(f"{provider} batch 제출 완료 (ID: {batch_id}, 요청 {len(prompts)}개)")
+
+        deadline = time.monotonic() + timeout
+        while not await batch.is_done(batch_id):
+            if time.monotonic() > deadline:
+                await batch.cancel(batch_id)
+                raise BatchError(f"batch 시간 초과 ({timeout:.0f}초): {batch_id}")
+            await asyncio.sleep(settings.ai_batch_poll_interval)
+
+        results = await batch.results(batch_id)
+        logger.info(f"{provider} batch 완료 (ID: {batch_id}, 성공 {len(results)}/{len(prompts)})")
+        return results
+
+
+class _OpenAIBatch:
+    """OpenAI Batch API (/v1/files + /v1/batches)"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        model: str,
+        max_tokens: int,
+        system_prompt: Optional[str],
+    ):
+        self.client = client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.system_prompt = system_prompt
+        self.base_url = (settings.openai_base_url or OPENAI_DEFAULT_BASE_URL).rstrip("/")
+        self.headers = {"Authorization": f"Bearer {settings.openai_api_key}"}
+        self._status: Dict = {}
+
+    async def submit(self, prompts: Dict[str, str]) -> str:
+        lines = []
+        for custom_id, prompt in prompts.items():
+            messages = [{"role": "user", "content": prompt}]
+            if self.system_prompt:
+                messages.insert(0, {"role": "system", "content": self.system_prompt})
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": settings.ai_temperature,
+                    "max_tokens": self.max_tokens,
+                    "response_format": {"type": "json_object"}
+                }
+            }, ensure_ascii=False))
+
+        upload = await self.client.post(
+            f"{self.base_url}/files",
+            headers=self.headers,
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", "\n".join(lines).encode(), "application/jsonl")},
+        )
+        _raise_for_status(upload)
+
+        response = await self.client.post(
+            f"{self.base_url}/batches",
+            headers=self.headers,
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h"
+            },
+        )
+        _raise_for_status(response)
+        return response.json()["id"]
+
+    async def is_done(self, batch_id: str) -> bool:
+        response = await self.client.get(
+            f"{self.base_url}/batches/{batch_id}", headers=self.headers
+        )
+        _raise_for_status(response)
+        self._status = response.json()
+        status = self._status.get("status")
+        if status in ("failed", "expired", "cancelled"):
+            raise BatchError(f"batch {batch_id} 상태: {status}")
+        return status == "completed"
+
+    async def cancel(self, batch_id: str):
+        await self.client.post(
+            f"{self.base_url}/batches/{batch_id}/cancel", headers=self.headers
+        )
+
+    async def results(self, batch_id: str) -> Dict[str, str]:
+        output_file_id = self._status.get("output_file_id")
+        if not output_file_id:
+            return {}
+        response = await self.client.get(
+            f"{self.base_url}/files/{output_file_id}/content", headers=self.headers
+        )
+        _raise_for_status(response)
+
+        results = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            body = (item.get("response") or {}).get("body") or {}
+            if item.get("error") or not body.get("choices"):
+                logger.warning(f"batch 항목 실패: {item.get('custom_id')}")
+                continue
+            results[item["custom_id"]] = body["choices"][0]["message"]["content"].strip()
+        return results
+
+
+class _ClaudeBatch:
+    """Anthropic Message Batches API (/v1/messages/batches)"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        model: str,
+        max_tokens: int,
+        system_prompt: Optional[str],
+    ):
+        self.client = client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.system_prompt = system_prompt
+        self.base_url = (settings.claude_base_url or CLAUDE_DEFAULT_BASE_URL).rstrip("/")
+        self.headers = {
+            "x-api-key": settings.claude_api_key or "",
+            "anthropic-version": ANTHROPIC_VERSION
+        }
+        self._status: Dict = {}
+
+    async def submit(self, prompts: Dict[str, str]) -> str:
+        requests = []
+        for custom_id, prompt in prompts.items():
+            params = {
+                "model": self.model,
+                "max_tokens": self.max_tokens,
+                "temperature": settings.ai_temperature,
+                "messages": [{"role": "user", "content": prompt}]
+            }
+            if self.system_prompt:
+                params["system"] = self.system_prompt
+            requests.append({"custom_id": custom_id, "params": params})
+
+        response = await self.client.post(
+            f"{self.base_url}/v1/messages/batches",
+            headers=self.headers,
+            json={"requests": requests},
+        )
+        _raise_for_status(response)
+        return response.json()["id"]
+
+    async def is_done(self, batch_id: str) -> bool:
+        response = await self.client.get(
+            f"{self.base_url}/v1/messages/batches/{batch_id}", headers=self.headers
+        )
+        _raise_for_status(response)
+        self._status = response.json()
+        return self._status.get("processing_status") == "ended"
+
+    async def cancel(self, batch_id: str):
+        await self.client.post(
+            f"{self.base_url}/v1/messages/batches/{batch_id}/cancel", headers=self.headers
+        )
+
+    async def results(self, batch_id: str) -> Dict[str, str]:
+        results_url = self._status.get("results_url")
+        if not results_url:
+            return {}
+        response = await self.client.get(results_url, headers=self.headers)
+        _raise_for_status(response)
+
+        results = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            result = item.get("result") or {}
+            if result.get("type") != "succeeded":
+                logger.warning(f"batch 항목 실패: {item.get('custom_id')} ({result.get('type')})")
+                continue
+            text = "".join(
+                block.get("text", "")
+                for block in result["message"].get("content", [])
+                if block.get("type") == "text"
+            )
+            results[item["custom_id"]] = text.strip()
+        return results
+
+
+def _raise_for_status(response: httpx.Response):
+    if response.status_code >= 400:
+        raise BatchError(f"batch API 오류 {response.status_code}: {response.text[:200]}")
@@ -0,0 +1,75 @@
+"""
+분석 대상 트윗 집합의 지문
+인사이트마다 분석한 트윗 집합의 지문(content_fingerprint)과 트윗별 해시(tweet_hashes)를 저장하고,
+다음 실행에서 트윗 집합이 같거나 거의 같으면(Jaccard 유사도 ≥ insight_skip_similarity) LLM 호출과 저장을 건너뜁니다.
+지문은 LLM이 실제로 생성한 인사이트에만 저장하므로, 더미(폴백) 인사이트 다음 실행은 항상 다시 생성합니다.
+"""
+from typing import Dict, List, Optional
+import hashlib
+import logging
+from sqlalchemy.orm import Session
+from backend.config import settings
+from backend.models.insight import Insight
+from backend.services.ai_service import is_fallback
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(text: str) -> str:
+    """공백/대소문자 차이는 같은 트윗으로 취급"""
+    return " ".join(text.lower().split())
+
+
+def tweet_hashes(tweets: List[str]) -> List[str]:
+    """트윗별 해시 (정렬, 중복 제거 → 순서가 바뀌어도 같은 집합이면 같은 목록)"""
+    return sorted({
+        hashlib.blake2b(_normalize(tweet).encode(), digest_size=8).hexdigest()
+        for tweet in tweets
+    })
+
+
+def fingerprint(hashes: List[str]) -> str:
+    """트윗 집합 전체의 지문"""
+    return hashlib.sha256(",".join(hashes).encode()).hexdigest()
+
+
+def fingerprint_fields(tweets: List[str], insights: Dict) -> Dict[str, str]:
+    """Insight에 저장할 지문 컬럼 값 (LLM 호출이 실패해 더미 인사이트면 저장하지 않음)"""
+    if is_fallback(insights):
+        return {}
+    hashes = tweet_hashes(tweets)
+    return {"content_fingerprint": fingerprint(hashes), "tweet_hashes": ",".join(hashes)}
+
+
+def similarity(a: List[str], b: List[str]) -> float:
+    """두 트윗 해시 집합의 Jaccard 유사도"""
+    set_a, set_b = set(a), set(b)
+    if not set_a and not set_b:
+        return 1.0
+    return len(set_a & set_b) / len(set_a | set_b)
+
+
+def find_unchanged_insight(db: Session, keyword_id: int, tweets: List[str]) -> Optional[Insight]:
+    """
+    키워드의 마지막 인사이트가 같은(또는 충분히 비슷한) 트윗 집합으로 만들어졌으면 그 인사이트를 반환
+    insight_skip_unchanged가 꺼져 있거나, 마지막 인사이트에 지문이 없으면(더미 인사이트, 지문 도입 이전 인사이트) None
+    """
+    if not settings.insight_skip_unchanged:
+        return None
+    last = (
+        db.query(Insight)
+        .filter(Insight.keyword_id == keyword_id)
+        .order_by(Insight.created_at.desc(), Insight.id.desc())
+        .first()
+    )
+    if last is None or not last.content_fingerprint:
+        return None
+
+    hashes = tweet_hashes(tweets)
+    if fingerprint(hashes) == last.content_fingerprint:
+        return last
+    score = similarity(hashes, last.tweet_hashes.split(",") if last.tweet_hashes else [])
+    if score >= settings.insight_skip_similarity:
+        logger.info(f"키워드 {keyword_id}: 마지막 인사이트와 트윗 유사도 {score:.2f}")
+        return last
+    return None
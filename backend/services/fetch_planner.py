@@ -0,0 +1,110 @@
+"""
+트윗 수집 계획
+키워드별로 관측된 트윗 발생량(시간당 트윗 수)을 보고 검색 구간과 수집량을 정합니다.
+- 조용한 키워드: 목표 표본을 모을 수 있도록 구간을 길게
+- 활발한 키워드: 짧은 구간에서 촘촘하게
+실행 1회의 전체 수집량(API 예산)은 고정하고, 남는 예산은 발생량이 많은 키워드에 배분합니다.
+"""
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+import logging
+import math
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.models.tweet_cursor import TweetCursor
+
+logger = logging.getLogger(__name__)
+
+# Twitter 검색 API의 요청당 최소 결과 수
+MIN_RESULTS = 10
+
+
+@dataclass
+class FetchPlan:
+    """키워드 하나의 검색 구간 + 수집할 트윗 수 (랭킹 후보 수)"""
+    hours: int
+    max_results: int
+
+
+def load_volumes(keywords: List[str]) -> Dict[str, Optional[float]]:
+    """키워드별 관측된 시간당 트윗 수 (기록이 없으면 None)"""
+    db = SessionLocal()
+    try:
+        rows = db.query(TweetCursor.keyword, TweetCursor.tweets_per_hour).filter(
+            TweetCursor.keyword.in_(keywords)
+        ).all()
+        volumes = {keyword: rate for keyword, rate in rows}
+        return {keyword: volumes.get(keyword) for keyword in keywords}
+    finally:
+        db.close()
+
+
+def allocate(rates: Dict[str, float], budget: int) -> Dict[str, FetchPlan]:
+    """
+    시간당 트윗 수 → 검색 계획
+    1. 목표 표본(twitter_target_tweets)을 모으는 데 필요한 구간 계산 (최소/최대 구간 사이)
+    2. 그 구간에서 기대되는 트윗 수를 수집량으로 사용
+    3. 합계가 예산을 넘으면 비례 축소, 남으면 발생량이 많은 키워드부터 추가 배분
+    """
+    target = settings.twitter_target_tweets
+    cap = settings.twitter_max_results_cap
+    plans: Dict[str, FetchPlan] = {}
+    available: Dict[str, int] = {}
+    for keyword, rate in rates.items():
+        rate = max(rate, 0.01)
+        hours = min(max(math.ceil(target / rate), settings.twitter_min_hours), settings.twitter_max_hours)
+        available[keyword] = min(max(round(rate * hours), MIN_RESULTS), cap)
+        plans[keyword] = FetchPlan(hours=hours, max_results=min(available[keyword], target))
+
+    total = sum(plan.max_results for plan in plans.values())
+    if total > budget:
+        scale = budget / total
+        for plan in plans.values():
+            plan.max_results = max(MIN_RESULTS, math.floor(plan.max_results * scale))
+        if len(plans) * MIN_RESULTS > budget:
+            logger.warning(
+                f"키워드 {len(plans)}개에 최소 수집량({MIN_RESULTS}개)을 주기에 예산 {budget}개가 부족합니다."
+            )
+        return plans
+
+    # 남은 예산은 구간 안에 트윗이 더 있는 키워드에 발생량 비율로 배분
+    leftover = budget - total
+    while leftover > 0:
+        hungry = {
+            keyword: rates[keyword]
+            for keyword, plan in plans.items()
+            if plan.max_results < available[keyword] and rates[keyword] > 0
+        }
+        if not hungry:
+            break
+        weight = sum(hungry.values())
+        given = 0
+        for keyword, rate in sorted(hungry.items(), key=lambda item: item[1], reverse=True):
+            plan = plans[keyword]
+            share = max(1, math.floor(leftover * rate / weight))
+            extra = min(share, available[keyword] - plan.max_results, leftover - given)
+            plan.max_results += extra
+            given += extra
+            if given >= leftover:
+                break
+        if given == 0:
+            break
+        leftover -= given
+    return plans
+
+
+def plan_fetches(keywords: List[str], budget: Optional[int] = None) -> Dict[str, FetchPlan]:
+    """여러 키워드의 검색 계획 (전체 수집량은 budget 이하, 기본값은 실행당 예산)"""
+    if not keywords:
+        return {}
+    volumes = load_volumes(keywords)
+    rates = {
+        keyword: volume if volume is not None else settings.twitter_default_tweets_per_hour
+        for keyword, volume in volumes.items()
+    }
+    return allocate(rates, budget if budget is not None else settings.twitter_run_tweet_budget)
+
+
+def plan_fetch(keyword: str) -> FetchPlan:
+    """키워드 하나의 검색 계획 (수동 생성 요청용, 목표 표본 크기까지)"""
+    return plan_fetches([keyword], budget=settings.twitter_target_tweets)[keyword]
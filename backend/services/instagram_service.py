@@ -1,30 +1,189 @@
+import asyncio
+import logging
+import re
 import httpx
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
 from backend.config import settings
-from typing import List, Dict
+from backend.database import SessionLocal
+from backend.models.instagram_hashtag import InstagramHashtag
+from backend.services.rate_limiter import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+INSTAGRAM_DEFAULT_BASE_URL = "https://graph.facebook.com/v20.0"
+MEDIA_FIELDS = "id,caption,like_count,comments_count,timestamp,permalink,media_type"
+# Graph API rate-limit error codes (app / user / page / custom)
+RATE_LIMIT_CODES = {4, 17, 32, 613}
+# Graph API does not say when to retry, so back off for an hour
+RATE_LIMIT_RETRY_AFTER = 3600.0
+
+_HASHTAG = re.compile(r"#(\w+)")
+
+# App-wide shared Graph API client
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_instagram_client() -> httpx.AsyncClient:
+    """Return the shared httpx client (created on first use)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        )
+    return _client
+
+
+async def close_instagram_client():
+    """Close the shared client on app shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class InstagramAPIError(Exception):
+    """Instagram Graph API call failed."""
+
+
+def normalize_hashtag(hashtag: str) -> str:
+    """Hashtags are case-insensitive and cannot contain spaces or '#'."""
+    return "".join(hashtag.lower().lstrip("#").split())
+
 
 class InstagramService:
-    """Simple Instagram service placeholder.
-    Currently returns dummy post data. Replace with real Instagram Graph API calls.
+    """Instagram Graph API hashtag search.
+    Flow: ig_hashtag_search (hashtag -> id, cached in the DB) -> top_media + recent_media.
+    Returns dummy post data when no access token is configured.
     """
     def __init__(self):
-        # In a real implementation you would use access token from settings
-        self.access_token = getattr(settings, "instagram_access_token", None)
-        self.base_url = "https://graph.facebook.com/v20.0"  # Instagram Graph API base
+        self.access_token = settings.instagram_access_token
+        self.user_id = settings.instagram_user_id
+        self.base_url = (settings.instagram_base_url or INSTAGRAM_DEFAULT_BASE_URL).rstrip("/")
 
     async def fetch_posts(self, hashtag: str, max_results: int = 10) -> List[Dict[str, any]]:
-        """Fetch recent Instagram posts for a given hashtag.
+        """Fetch top and recent Instagram posts for a given hashtag.
         Returns a list of dicts with at least ``caption`` and ``hashtags`` keys.
-        Currently returns dummy data when no access token is configured.
+        Raises RateLimitExceeded when the weekly unique-hashtag quota or a
+        Graph API rate limit is hit.
         """
-        if not self.access_token:
-            # Return dummy posts
-            dummy = []
-            for i in range(max_results):
-                dummy.append({
-                    "caption": f"Dummy Instagram post {i+1} for #{hashtag}",
-                    "hashtags": [hashtag]
-                })
-            return dummy
-        # Real implementation would call the Instagram Graph API here.
-        # For brevity, we raise NotImplementedError.
-        raise NotImplementedError("Real Instagram API integration not implemented yet.")
+        if not self.access_token or not self.user_id:
+            return self._get_dummy_posts(hashtag, max_results)
+
+        try:
+            hashtag_id = await self._get_hashtag_id(hashtag)
+            if hashtag_id is None:
+                logger.warning(f"Instagram hashtag not found: #{hashtag}")
+                return []
+            # Fetch both edges concurrently; top media first in the merged result
+            top, recent = await asyncio.gather(
+                self._fetch_media(hashtag_id, "top_media", max_results),
+                self._fetch_media(hashtag_id, "recent_media", max_results),
+            )
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Instagram API error: {e}")
+            return self._get_dummy_posts(hashtag, max_results)
+
+        posts = []
+        seen = set()
+        for media in top + recent:
+            if media["id"] in seen or not media.get("caption"):
+                continue
+            seen.add(media["id"])
+            posts.append({
+                "id": media["id"],
+                "caption": media["caption"],
+                "hashtags": _HASHTAG.findall(media["caption"]) or [normalize_hashtag(hashtag)],
+                "like_count": media.get("like_count", 0),
+                "comments_count": media.get("comments_count", 0),
+                "timestamp": media.get("timestamp"),
+                "permalink": media.get("permalink"),
+            })
+            if len(posts) >= max_results:
+                break
+        return posts
+
+    async def _get_hashtag_id(self, hashtag: str) -> Optional[str]:
+        """Hashtag -> Graph API id, cached persistently (unique lookups are limited per week)."""
+        name = normalize_hashtag(hashtag)
+        db = SessionLocal()
+        try:
+            cached = db.query(InstagramHashtag).filter(InstagramHashtag.hashtag == name).first()
+            if cached:
+                return cached.hashtag_id
+
+            week_ago = datetime.utcnow() - timedelta(days=7)
+            recent = (
+                db.query(InstagramHashtag)
+                .filter(InstagramHashtag.created_at >= week_ago)
+                .order_by(InstagramHashtag.created_at)
+                .all()
+            )
+            if len(recent) >= settings.instagram_hashtag_weekly_limit:
+                oldest = recent[0].created_at.replace(tzinfo=None)
+                retry_after = (oldest + timedelta(days=7) - datetime.utcnow()).total_seconds()
+                raise RateLimitExceeded(
+                    f"Instagram weekly hashtag limit reached ({len(recent)} unique hashtags in 7 days)",
+                    retry_after=max(retry_after, 1.0)
+                )
+
+            data = await self._get("ig_hashtag_search", {"user_id": self.user_id, "q": name})
+            results = data.get("data") or []
+            if not results:
+                return None
+            hashtag_id = results[0]["id"]
+            db.add(InstagramHashtag(hashtag=name, hashtag_id=hashtag_id))
+            db.commit()
+            logger.info(f"Instagram hashtag id cached: #{name} -> {hashtag_id}")
+            return hashtag_id
+        finally:
+            db.close()
+
+    async def _fetch_media(self, hashtag_id: str, edge: str, limit: int) -> List[Dict]:
+        """Fetch one media edge (top_media / recent_media), following paging.next."""
+        media: List[Dict] = []
+        params = {"user_id": self.user_id, "fields": MEDIA_FIELDS, "limit": min(max(limit, 1), 50)}
+        url = f"{hashtag_id}/{edge}"
+        for _ in range(settings.instagram_media_pages):
+            data = await self._get(url, params)
+            media.extend(data.get("data") or [])
+            next_url = (data.get("paging") or {}).get("next")
+            if len(media) >= limit or not next_url:
+                break
+            # The next URL already carries every query parameter
+            url, params = next_url, None
+        return media
+
+    async def _get(self, path: str, params: Optional[Dict]) -> Dict:
+        client = get_instagram_client()
+        url = path if path.startswith("http") else f"{self.base_url}/{path}"
+        if params is not None:
+            params = {**params, "access_token": self.access_token}
+        response = await client.get(url, params=params)
+        try:
+            data = response.json()
+        except ValueError:
+            raise InstagramAPIError(f"Invalid response ({response.status_code}): {response.text[:200]}")
+        error = data.get("error") if isinstance(data, dict) else None
+        if error:
+            if error.get("code") in RATE_LIMIT_CODES:
+                raise RateLimitExceeded(
+                    f"Instagram API rate limit: {error.get('message')}",
+                    retry_after=RATE_LIMIT_RETRY_AFTER
+                )
+            raise InstagramAPIError(f"Instagram API error {error.get('code')}: {error.get('message')}")
+        if response.status_code != 200:
+            raise InstagramAPIError(f"Instagram API error {response.status_code}: {response.text[:200]}")
+        return data
+
+    def _get_dummy_posts(self, hashtag: str, max_results: int) -> List[Dict[str, any]]:
+        dummy = []
+        for i in range(max_results):
+            dummy.append({
+                "caption": f"Dummy Instagram post {i+1} for #{hashtag}",
+                "hashtags": [hashtag]
+            })
+        return dummy
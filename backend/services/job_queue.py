@@ -0,0 +1,199 @@
+"""
+영속 작업 큐
+API와 스케줄러는 jobs 테이블에 작업을 추가만 하고, 별도 워커 프로세스(backend.worker)가 실행합니다.
+- 작업 가져오기: SELECT ... FOR UPDATE SKIP LOCKED (PostgreSQL) + 조건부 UPDATE로 워커 간 중복 실행 방지
+  (SQLite는 FOR UPDATE가 없으므로 조건부 UPDATE만으로 한 워커만 가져감)
+- 리스: 워커는 실행 중인 작업의 locked_until을 주기적으로 연장하고, 워커가 죽으면 만료 후 다른 워커가 다시 실행
+- 실패: 지수 백오프로 재시도, max_attempts를 넘으면 failed
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import json
+import logging
+import random
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.orm import Session
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류
+GENERATE_INSIGHT = "generate_insight"
+GENERATE_POSTS = "generate_posts"
+GENERATE_INSTAGRAM_INSIGHT = "generate_instagram_insight"
+
+
+def enqueue(
+    kind: str,
+    payload: Dict,
+    dedupe_key: Optional[str] = None,
+    delay: float = 0,
+    db: Optional[Session] = None
+) -> int:
+    """
+    작업 추가
+    dedupe_key가 같은 대기/실행 중 작업이 있으면 새로 추가하지 않고 그 작업 ID를 반환합니다.
+    """
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        if dedupe_key is not None:
+            existing = db.query(Job.id).filter(
+                Job.dedupe_key == dedupe_key,
+                Job.status.in_([JobStatus.PENDING, JobStatus.RUNNING])
+            ).first()
+            if existing:
+                return existing.id
+        job = Job(
+            kind=kind,
+            payload=json.dumps(payload, ensure_ascii=False),
+            dedupe_key=dedupe_key,
+            status=JobStatus.PENDING,
+            attempts=0,
+            max_attempts=settings.job_max_attempts,
+            run_after=datetime.utcnow() + timedelta(seconds=delay),
+        )
+        db.add(job)
+        db.commit()
+        return job.id
+    finally:
+        if own_session:
+            db.close()
+
+
+def claim_jobs(worker_id: str, limit: int) -> List[Dict]:
+    """
+    실행할 작업을 최대 limit개 가져옴 (대기 중이고 실행 시각이 된 작업 + 리스가 만료된 실행 중 작업)
+    Returns: [{"id", "kind", "payload", "attempts"}]
+    """
+    if limit <= 0:
+        return []
+    now = datetime.utcnow()
+    claimable = or_(
+        and_(Job.status == JobStatus.PENDING, Job.run_after <= now),
+        and_(Job.status == JobStatus.RUNNING, Job.locked_until < now),
+    )
+    db = SessionLocal()
+    try:
+        # 리스가 만료됐는데 시도 횟수를 다 쓴 작업 (워커가 계속 죽는 작업)은 실패 처리
+        db.execute(
+            update(Job)
+            .where(Job.status == JobStatus.RUNNING, Job.locked_until < now, Job.attempts >= Job.max_attempts)
+            .values(status=JobStatus.FAILED, last_error="워커 리스 만료 (최대 시도 횟수 초과)", finished_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        candidates = (
+            db.query(Job.id)
+            .filter(claimable)
+            .order_by(Job.run_after, Job.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        claimed = []
+        for (job_id,) in candidates:
+            # 다른 워커가 먼저 가져갔으면 조건이 맞지 않아 0행
+            taken = db.execute(
+                update(Job)
+                .where(Job.id == job_id, claimable)
+                .values(
+                    status=JobStatus.RUNNING,
+                    locked_by=worker_id,
+                    locked_until=now + timedelta(seconds=settings.job_lease_seconds),
+                    attempts=Job.attempts + 1,
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if taken:
+                claimed.append(job_id)
+        db.commit()
+
+        jobs = db.query(Job).filter(Job.id.in_(claimed)).order_by(Job.run_after, Job.id).all() if claimed else []
+        return [
+            {"id": job.id, "kind": job.kind, "payload": json.loads(job.payload), "attempts": job.attempts}
+            for job in jobs
+        ]
+    finally:
+        db.close()
+
+
+def extend_leases(worker_id: str, job_ids: List[int]):
+    """실행 중인 작업의 리스 연장"""
+    if not job_ids:
+        return
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(Job)
+            .where(Job.id.in_(job_ids), Job.locked_by == worker_id, Job.status == JobStatus.RUNNING)
+            .values(locked_until=datetime.utcnow() + timedelta(seconds=settings.job_lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def complete_job(job_id: int, worker_id: str, result: Optional[str] = None):
+    """작업 완료 처리 (리스를 다른 워커가 가져간 뒤라면 무시)"""
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == JobStatus.RUNNING)
+            .values(status=JobStatus.DONE, result=result, locked_until=None, finished_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def retry_delay(attempts: int, retry_after: Optional[float] = None) -> float:
+    """재시도 대기 시간: 지수 백오프 + 지터 (레이트 리밋이 알려준 대기 시간이 더 길면 그 값)"""
+    delay = min(settings.job_retry_base * 2 ** max(attempts - 1, 0), settings.job_retry_max)
+    delay *= random.uniform(0.8, 1.2)
+    return max(delay, retry_after or 0)
+
+
+def fail_job(job_id: int, worker_id: str, error: str, retry_after: Optional[float] = None):
+    """작업 실패 처리: 시도 횟수가 남았으면 백오프 후 재시도, 아니면 failed"""
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(
+            Job.id == job_id, Job.locked_by == worker_id, Job.status == JobStatus.RUNNING
+        ).first()
+        if job is None:
+            return
+        job.last_error = error[:2000]
+        job.locked_until = None
+        if job.attempts < job.max_attempts:
+            delay = retry_delay(job.attempts, retry_after)
+            job.status = JobStatus.PENDING
+            job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+            logger.warning(
+                f"작업 {job_id} ({job.kind}) 실패, {delay:.0f}초 뒤 재시도 "
+                f"({job.attempts}/{job.max_attempts}): {error}"
+            )
+        else:
+            job.status = JobStatus.FAILED
+            job.finished_at = datetime.utcnow()
+            logger.error(f"작업 {job_id} ({job.kind}) 최종 실패 ({job.attempts}회 시도): {error}")
+        db.commit()
+    finally:
+        db.close()
+
+
+def queue_stats() -> Dict[str, int]:
+    """상태별 작업 수"""
+    db = SessionLocal()
+    try:
+        rows = db.query(Job.status, func.count(Job.id)).group_by(Job.status).all()
+        counts = {status.value: 0 for status in JobStatus}
+        counts.update({status.value: count for status, count in rows})
+        return counts
+    finally:
+        db.close()
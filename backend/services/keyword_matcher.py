@@ -0,0 +1,93 @@
+"""
+다중 키워드 매처 (Aho-Corasick)
+여러 키워드를 OR 쿼리 하나로 검색한 뒤, 받은 트윗을 한 번만 훑어
+어떤 키워드에 해당하는지 다시 나눕니다.
+"""
+from typing import Dict, List, Set
+from collections import deque
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    키워드 → 트윗 매칭
+    - 키워드의 공백은 AND (Twitter 검색과 동일): 모든 단어가 있어야 매칭
+    - 영문/숫자 단어는 단어 경계에서만 매칭, 한글 등은 조사가 붙으므로 부분 문자열로 매칭
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = list(keywords)
+        self._terms: List[str] = []
+        term_index: Dict[str, int] = {}
+        self._keyword_terms: List[Set[int]] = []
+        for keyword in self.keywords:
+            indexes = set()
+            for term in keyword.lower().split():
+                if term not in term_index:
+                    term_index[term] = len(self._terms)
+                    self._terms.append(term)
+                indexes.add(term_index[term])
+            self._keyword_terms.append(indexes)
+        self._build()
+
+    def _build(self):
+        # trie
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[List[int]] = [[]]
+        for index, term in enumerate(self._terms):
+            node = 0
+            for char in term:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._output.append([])
+                node = next_node
+            self._output[node].append(index)
+
+        # 실패 링크 (BFS)
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _find_terms(self, text: str) -> Set[int]:
+        found = set()
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for index in self._output[node]:
+                if index in found:
+                    continue
+                term = self._terms[index]
+                if term.isascii():
+                    start = position - len(term) + 1
+                    end = position + 1
+                    if (start > 0 and _is_word_char(text[start - 1]) and _is_word_char(term[0])) or (
+                        end < len(text) and _is_word_char(text[end]) and _is_word_char(term[-1])
+                    ):
+                        continue
+                found.add(index)
+        return found
+
+    def match(self, text: str) -> List[str]:
+        """텍스트에 해당하는 키워드 목록 (입력 순서)"""
+        found = self._find_terms(text.lower())
+        return [
+            keyword
+            for keyword, terms in zip(self.keywords, self._keyword_terms)
+            if terms and terms <= found
+        ]
@@ -0,0 +1,122 @@
+"""
+DB 기반 리더 리스
+uvicorn을 여러 워커로 띄우면 워커마다 스케줄러가 시작되므로, scheduler_leases 테이블의
+TTL 리스를 가진 워커 하나만 스케줄 작업을 실행합니다.
+- 리스 획득/갱신은 조건부 UPDATE 한 번 (본인 소유이거나 만료된 경우에만 성공)이라 워커 간 경합에도 원자적
+- 리더는 TTL보다 짧은 주기로 갱신하고, 리더가 죽으면 TTL 후 다른 워커가 가져감
+- 리더가 스케줄 작업을 마친 시각(last_sweep_at)을 리스 행에 남겨, 새 리더가 놓친 실행을 알 수 있음
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+import logging
+import os
+import socket
+import uuid
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from backend.database import SessionLocal
+from backend.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+# 이 프로세스의 워커 ID
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def acquire_lease(name: str, ttl: float, owner: str = WORKER_ID) -> bool:
+    """
+    리스 획득 또는 갱신
+    Returns: 이 owner가 리스를 가지고 있으면 True (만료 시각은 지금 + ttl로 연장)
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl)
+    db = SessionLocal()
+    try:
+        # 본인 리스면 연장, 아니면 만료된 리스만 가져옴 (각각 조건부 UPDATE 한 번)
+        renewed = db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.owner == owner)
+            .values(expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        taken = renewed or db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.expires_at < now)
+            .values(owner=owner, expires_at=expires_at, acquired_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        if taken:
+            if not renewed:
+                logger.info(f"리스 '{name}' 획득: {owner}")
+            return True
+
+        # 아직 행이 없으면 INSERT (동시에 INSERT한 워커가 있으면 PK 충돌로 실패)
+        if db.get(SchedulerLease, name) is not None:
+            return False
+        db.add(SchedulerLease(name=name, owner=owner, expires_at=expires_at, acquired_at=now))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def release_lease(name: str, owner: str = WORKER_ID):
+    """리스 반납 (종료 시 다른 워커가 TTL을 기다리지 않고 바로 가져가도록)"""
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.owner == owner)
+            .values(owner=None, expires_at=datetime.utcnow(), acquired_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def record_sweep(name: str, owner: str = WORKER_ID, at: Optional[datetime] = None):
+    """리스를 가진 owner가 스케줄 작업을 마친 시각 기록"""
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.owner == owner)
+            .values(last_sweep_at=at or datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def last_sweep_at(name: str) -> Optional[datetime]:
+    """마지막으로 스케줄 작업을 마친 시각 (기록이 없으면 None)"""
+    db = SessionLocal()
+    try:
+        lease = db.get(SchedulerLease, name)
+        return lease.last_sweep_at if lease else None
+    finally:
+        db.close()
+
+
+def lease_status(name: str) -> Optional[Dict]:
+    """현재 리스 소유자와 만료 시각"""
+    db = SessionLocal()
+    try:
+        lease = db.get(SchedulerLease, name)
+        if lease is None:
+            return None
+        return {
+            "owner": lease.owner,
+            "expires_at": lease.expires_at.isoformat() if lease.expires_at else None,
+            "acquired_at": lease.acquired_at.isoformat() if lease.acquired_at else None,
+            "last_sweep_at": lease.last_sweep_at.isoformat() if lease.last_sweep_at else None,
+            "is_self": lease.owner == WORKER_ID,
+        }
+    finally:
+        db.close()
@@ -0,0 +1,78 @@
+"""
+LLM 클라이언트 풀
+프로세스 전역에서 공유하는 비동기 OpenAI/Claude 클라이언트를 관리합니다.
+앱 시작 시 생성하고 종료 시 닫아 커넥션 풀과 keep-alive를 재사용합니다.
+"""
+import logging
+import httpx
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_openai_client = None
+_claude_client = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """LLM 호출용 공유 httpx 클라이언트 생성"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.ai_max_connections,
+            max_keepalive_connections=settings.ai_max_keepalive_connections,
+            keepalive_expiry=settings.ai_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(settings.ai_timeout, connect=10.0),
+    )
+
+
+def get_openai_client():
+    """공유 AsyncOpenAI 클라이언트 반환 (최초 호출 시 생성)"""
+    global _openai_client
+    if _openai_client is None and settings.openai_api_key:
+        from openai import AsyncOpenAI
+
+        _openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+            http_client=_build_http_client(),
+            max_retries=0,  # 재시도는 retry_with_backoff에서 처리
+        )
+        logger.info("OpenAI 비동기 클라이언트 생성")
+    return _openai_client
+
+
+def get_claude_client():
+    """공유 AsyncAnthropic 클라이언트 반환 (최초 호출 시 생성)"""
+    global _claude_client
+    if _claude_client is None and settings.claude_api_key:
+        import anthropic
+
+        _claude_client = anthropic.AsyncAnthropic(
+            api_key=settings.claude_api_key,
+            base_url=settings.claude_base_url,
+            http_client=_build_http_client(),
+            max_retries=0,  # 재시도는 retry_with_backoff에서 처리
+        )
+        logger.info("Claude 비동기 클라이언트 생성")
+    return _claude_client
+
+
+def init_llm_clients():
+    """앱 시작 시 클라이언트 미리 생성"""
+    get_openai_client()
+    get_claude_client()
+
+
+async def close_llm_clients():
+    """앱 종료 시 클라이언트 커넥션 풀 정리"""
+    global _openai_client, _claude_client
+    for client in (_openai_client, _claude_client):
+        if client is None:
+            continue
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"LLM 클라이언트 종료 중 오류: {e}")
+    _openai_client = None
+    _claude_client = None
+    logger.info("LLM 클라이언트 종료 완료")
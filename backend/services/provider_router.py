@@ -0,0 +1,181 @@
+"""
+AI provider 라우터
+provider/model별 최근 지연 시간과 오류를 기록하고,
+회로 차단기(circuit breaker)와 지연 시간 통계로 호출 순서를 결정합니다.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+from collections import deque
+import logging
+import math
+import time
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def percentile(samples: Sequence[float], q: float) -> Optional[float]:
+    """nearest-rank 방식 백분위수"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(len(ordered) * q) - 1))]
+
+
+class ProviderState:
+    """provider/model 하나의 통계 + 회로 차단기 상태"""
+
+    def __init__(self, window: int):
+        self.latencies: deque = deque(maxlen=window)
+        self.outcomes: deque = deque(maxlen=window)  # True=성공, False=실패
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+class ProviderRouter:
+    """지연 시간/오류 기반 provider 선택기"""
+
+    def __init__(self):
+        self._states: Dict[str, ProviderState] = {}
+
+    def _state(self, provider: str, model: str) -> ProviderState:
+        key = f"{provider}/{model}"
+        state = self._states.get(key)
+        if state is None:
+            state = ProviderState(settings.ai_router_window)
+            self._states[key] = state
+        return state
+
+    # ---- 기록 ----
+
+    def record_success(self, provider: str, model: str, latency: float):
+        """성공 호출 기록 (half-open 상태면 회로를 닫음)"""
+        state = self._state(provider, model)
+        state.latencies.append(latency)
+        state.outcomes.append(True)
+        state.consecutive_failures = 0
+        state.probe_in_flight = False
+        if state.state != CLOSED:
+            logger.info(f"{provider}/{model} 회로 차단기 닫힘 (복구)")
+            state.state = CLOSED
+
+    def record_failure(self, provider: str, model: str):
+        """실패 호출 기록 (연속 실패가 임계값을 넘으면 회로를 엶)"""
+        state = self._state(provider, model)
+        state.outcomes.append(False)
+        state.consecutive_failures += 1
+        state.probe_in_flight = False
+        if state.state == HALF_OPEN or (
+            state.state == CLOSED
+            and state.consecutive_failures >= settings.ai_breaker_failure_threshold
+        ):
+            logger.warning(
+                f"{provider}/{model} 회로 차단기 열림 "
+                f"({settings.ai_breaker_reset_timeout}초 동안 호출 중단)"
+            )
+            state.state = OPEN
+            state.opened_at = time.monotonic()
+
+    def record_cancelled(self, provider: str, model: str, elapsed: float):
+        """
+        헤지에서 져서 취소된 호출의 경과 시간을 지연 시간 샘플로 기록
+        실제 지연 시간은 이보다 길므로 하한값이지만, 느린 provider도 샘플이 쌓여 동적 순서 결정에 참여합니다.
+        (성공/실패로는 세지 않음)
+        """
+        self._state(provider, model).latencies.append(elapsed)
+
+    # ---- 조회 ----
+
+    def allow(self, provider: str, model: str) -> bool:
+        """호출 가능 여부 (열린 회로는 reset 시간이 지나면 probe 1건만 허용)"""
+        state = self._state(provider, model)
+        if state.state == CLOSED:
+            return True
+        if state.state == OPEN:
+            if time.monotonic() - state.opened_at < settings.ai_breaker_reset_timeout:
+                return False
+            state.state = HALF_OPEN
+            state.probe_in_flight = False
+        if state.probe_in_flight:
+            return False
+        state.probe_in_flight = True
+        return True
+
+    def is_available(self, provider: str, model: str) -> bool:
+        """상태 변경 없이 호출 후보인지 확인"""
+        state = self._state(provider, model)
+        if state.state == OPEN:
+            return time.monotonic() - state.opened_at >= settings.ai_breaker_reset_timeout
+        if state.state == HALF_OPEN:
+            return not state.probe_in_flight
+        return True
+
+    def is_open(self, provider: str, model: str) -> bool:
+        """회로가 열려 있는지 여부"""
+        return self._state(provider, model).state == OPEN
+
+    def release(self, provider: str, model: str):
+        """결과 없이 끝난 (취소된) half-open probe 슬롯 반환"""
+        self._state(provider, model).probe_in_flight = False
+
+    def sample_count(self, provider: str, model: str) -> int:
+        """기록된 지연 시간 샘플 수"""
+        return len(self._state(provider, model).latencies)
+
+    def latency_percentile(self, provider: str, model: str, q: float) -> Optional[float]:
+        """최근 호출(성공 + 헤지에서 취소된 호출)의 지연 시간 백분위수"""
+        return percentile(self._state(provider, model).latencies, q)
+
+    def _score(self, provider: str, model: str) -> Optional[float]:
+        state = self._state(provider, model)
+        if len(state.latencies) < settings.ai_router_min_samples:
+            return None
+        p50 = percentile(state.latencies, 0.5)
+        p99 = percentile(state.latencies, 0.99)
+        # 중앙값과 꼬리 지연을 함께 보고, 오류율만큼 패널티
+        return (p50 + p99) * (1 + 4 * state.error_rate())
+
+    def order(self, chain: List[tuple]) -> List[tuple]:
+        """
+        호출 순서 결정
+        - 회로가 열린 provider는 제외
+        - 모든 후보에 충분한 샘플이 있으면 p50/p99 점수가 낮은 순으로 정렬
+        - 그렇지 않으면 설정된 순서 유지
+        """
+        available = [item for item in chain if self.is_available(item[0], item[1])]
+        if not settings.ai_router_dynamic_order or len(available) < 2:
+            return available
+        scores = [self._score(item[0], item[1]) for item in available]
+        if any(score is None for score in scores):
+            return available
+        ranked = sorted(range(len(available)), key=lambda index: scores[index])
+        return [available[index] for index in ranked]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """provider별 상태 요약"""
+        result = {}
+        for key, state in self._states.items():
+            result[key] = {
+                "state": state.state,
+                "samples": len(state.latencies),
+                "p50": percentile(state.latencies, 0.5),
+                "p95": percentile(state.latencies, 0.95),
+                "p99": percentile(state.latencies, 0.99),
+                "error_rate": round(state.error_rate(), 4),
+                "consecutive_failures": state.consecutive_failures,
+            }
+        return result
+
+
+# 프로세스 전역 라우터
+provider_router = ProviderRouter()
@@ -0,0 +1,126 @@
+"""
+API 레이트 리밋 관리
+토큰 버킷으로 요청 간격을 조절하고, 응답의 x-rate-limit-remaining / x-rate-limit-reset
+헤더로 남은 호출 수와 창(window) 종료 시각을 맞춰 429 없이 창 전체를 고르게 사용합니다.
+"""
+from typing import Any, Dict, Mapping, Optional
+import asyncio
+import logging
+import time
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """레이트 리밋으로 요청하지 못함 (일반 API 오류와 구분)"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimitGovernor:
+    """프로세스 전역에서 공유하는 토큰 버킷"""
+
+    def __init__(self, name: str, limit: int, window: int, burst: int, max_wait: float):
+        self.name = name
+        self.default_rate = limit / window  # 초당 허용 요청 수
+        self.window = window
+        self.capacity = burst
+        self.max_wait = max_wait
+        self.rate = self.default_rate
+        self.tokens = float(burst)
+        self.remaining: Optional[int] = None  # 서버가 알려준 남은 호출 수
+        self.reset_at = 0.0  # 창 종료 시각 (epoch 초)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._stats = {"requests": 0, "waits": 0, "wait_seconds": 0.0, "rate_limited": 0}
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약 시도, 기다려야 할 시간(초) 반환 (0이면 예약 완료)"""
+        now = time.monotonic()
+        if self.remaining is not None and time.time() >= self.reset_at:
+            # 창이 끝나면 헤더 정보를 버리고 기본 속도로 복귀
+            self.remaining = None
+            self.rate = self.default_rate
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        if self.remaining is not None and self.remaining <= 0:
+            return max(self.reset_at - time.time(), 0.01)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            if self.remaining is not None:
+                self.remaining -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self):
+        """
+        요청 1건 허용될 때까지 대기
+        대기 시간이 max_wait를 넘으면 RateLimitExceeded 발생
+        """
+        # 대기자는 락 순서대로 (FIFO) 토큰을 받음
+        async with self._lock:
+            while True:
+                wait = self._reserve()
+                if wait <= 0:
+                    self._stats["requests"] += 1
+                    return
+                if wait > self.max_wait:
+                    self._stats["rate_limited"] += 1
+                    raise RateLimitExceeded(
+                        f"{self.name} 레이트 리밋: {wait:.0f}초 후 재시도 가능", retry_after=wait
+                    )
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += wait
+                await asyncio.sleep(wait)
+
+    def update(self, headers: Mapping[str, str]):
+        """응답 헤더로 남은 호출 수와 창 종료 시각 갱신"""
+        remaining = headers.get("x-rate-limit-remaining")
+        reset = headers.get("x-rate-limit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            self.remaining = int(remaining)
+            self.reset_at = float(reset)
+        except ValueError:
+            return
+        # 남은 호출을 창이 끝날 때까지 고르게 분배
+        window_left = max(self.reset_at - time.time(), 1.0)
+        if self.remaining > 0:
+            self.rate = self.remaining / window_left
+
+    def on_rate_limited(self, headers: Mapping[str, str]) -> float:
+        """429 응답 처리, 재시도까지 남은 시간(초) 반환"""
+        self.update(headers)
+        self.remaining = 0
+        if self.reset_at <= time.time():
+            self.reset_at = time.time() + self.window
+        self._stats["rate_limited"] += 1
+        retry_after = self.reset_at - time.time()
+        logger.warning(f"{self.name} 429 응답 ({retry_after:.0f}초 후 창 초기화)")
+        return retry_after
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 요약"""
+        return {
+            **self._stats,
+            "wait_seconds": round(self._stats["wait_seconds"], 3),
+            "remaining": self.remaining,
+            "reset_in": round(max(self.reset_at - time.time(), 0.0), 1) if self.remaining is not None else None,
+            "rate_per_second": round(self.rate, 4),
+            "tokens": round(self.tokens, 2),
+        }
+
+
+# Twitter API 전역 governor (동시에 실행되는 모든 키워드 검색이 공유)
+twitter_rate_limiter = RateLimitGovernor(
+    "Twitter API",
+    limit=settings.twitter_rate_limit,
+    window=settings.twitter_rate_window,
+    burst=settings.twitter_rate_burst,
+    max_wait=settings.twitter_rate_max_wait,
+)
@@ -0,0 +1,132 @@
+"""
+AI 응답 파서
+응답 텍스트를 한 번만 훑어 균형 잡힌 JSON 객체를 찾고,
+Pydantic TypeAdapter로 파싱과 검증을 한 번에 수행합니다.
+"""
+from typing import Any, Callable, Dict, Iterator, Optional
+from dataclasses import dataclass
+import json
+import logging
+import re
+from pydantic import TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# 파싱 경로
+PATH_JSON = "json"  # 응답 전체가 JSON 객체
+PATH_EXTRACTED = "extracted"  # 코드 블록/설명문 안에서 JSON 객체 추출
+PATH_TEXT = "text"  # JSON이 없거나 검증 실패, 텍스트 휴리스틱 사용
+PATH_FAILED = "failed"
+
+_DECODER = json.JSONDecoder()
+
+# 객체 안의 토큰: 문자열(이스케이프 포함, 닫히지 않으면 끝까지) 또는 중괄호
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*(?:"|\Z)|[{}]', re.DOTALL)
+
+# 경로별 사용 횟수 (종류별)
+parse_stats: Dict[str, Dict[str, int]] = {}
+
+
+@dataclass
+class ParseResult:
+    """파싱 결과 + 사용된 경로"""
+    value: Optional[Any]
+    path: str
+
+
+def _balanced_end(text: str, start: int) -> int:
+    """start의 여는 중괄호와 짝이 맞는 닫는 중괄호 다음 위치 (문자열은 토큰 하나로 건너뜀, 닫히지 않으면 -1)"""
+    depth = 0
+    for match in _TOKEN.finditer(text, start):
+        char = text[match.start()]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+def iter_json_objects(text: str, offset: int = 0) -> Iterator[tuple]:
+    """
+    텍스트에서 JSON으로 디코딩되는 최상위 객체 후보를 순서대로 반환 (start, end)
+    객체 끝은 C 구현 JSON 디코더로 찾고, 문법이 깨진 객체만 중괄호 짝으로 건너뛰어 텍스트를 한 번만 훑습니다.
+    """
+    start = text.find("{", offset)
+    while start != -1:
+        try:
+            _, end = _DECODER.raw_decode(text, start)
+        except ValueError:
+            end = _balanced_end(text, start)
+            if end == -1:
+                return  # 닫히지 않은 객체 (잘린 응답)
+        else:
+            yield start, end
+        start = text.find("{", end)
+
+
+def _record(kind: str, path: str):
+    counts = parse_stats.get(kind)
+    if counts is None:
+        counts = parse_stats[kind] = {}
+    counts[path] = counts.get(path, 0) + 1
+
+
+def _json_error(error: ValidationError) -> Optional[str]:
+    """JSON 문법 오류 메시지 (None이면 JSON은 맞지만 스키마 검증 실패)"""
+    detail = error.errors(include_url=False, include_context=False, include_input=False)[0]
+    return detail["msg"] if detail["type"] == "json_invalid" else None
+
+
+def parse_structured(
+    text: str,
+    adapter: TypeAdapter,
+    kind: str,
+    fallback: Optional[Callable[[str], Optional[Any]]] = None,
+) -> ParseResult:
+    """
+    응답 텍스트를 검증된 모델로 변환
+    첫 번째로 검증을 통과한 JSON 객체를 사용하고, 없으면 fallback(텍스트 휴리스틱)을 사용합니다.
+    """
+    stripped = text.strip()
+    first = stripped.find("{")
+    last = stripped.rfind("}") + 1
+    # 여는 중괄호 뒤에 닫는 중괄호가 없으면 객체 후보가 없음 (JSON 없음 또는 잘린 응답)
+    scan = first != -1 and last > first
+    if scan:
+        # 빠른 경로: 대부분의 응답은 가장 바깥 중괄호 구간이 곧 JSON
+        whole = first == 0 and last == len(stripped)
+        try:
+            value = adapter.validate_json(stripped if whole else stripped[first:last])
+            path = PATH_JSON if whole else PATH_EXTRACTED
+            _record(kind, path)
+            return ParseResult(value, path)
+        except ValidationError as e:
+            message = _json_error(e)
+            # 구간 전체가 객체 하나인데 스키마만 틀렸거나, 마지막 중괄호까지 닫히지 않은 잘린 응답이면
+            # 다른 객체 후보가 없으므로 스캔 생략
+            if message is None or "EOF while parsing" in message:
+                scan = False
+    if scan:
+        # 느린 경로: 텍스트를 한 번 스캔하며 객체 후보를 차례로 검증
+        for start, end in iter_json_objects(stripped, first):
+            if start == first and end == last:
+                continue
+            try:
+                value = adapter.validate_json(stripped[start:end])
+            except ValidationError:
+                continue
+            _record(kind, PATH_EXTRACTED)
+            return ParseResult(value, PATH_EXTRACTED)
+
+    if fallback is not None:
+        logger.warning(f"{kind} 응답에서 유효한 JSON을 찾지 못해 텍스트 파싱 시도")
+        value = fallback(stripped)
+        if value:
+            _record(kind, PATH_TEXT)
+            return ParseResult(value, PATH_TEXT)
+
+    _record(kind, PATH_FAILED)
+    return ParseResult(None, PATH_FAILED)
+
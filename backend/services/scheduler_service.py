@@ -2,125 +2,524 @@
 스케줄러 서비스
 주기적으로 활성화된 키워드에 대해 인사이트를 생성합니다.
 """
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timezone
 import asyncio
+import contextlib
+import time
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import Session
 from backend.database import SessionLocal
 from backend.models.keyword import Keyword
 from backend.services.twitter_service import TwitterService
 from backend.services.ai_service import AIService
+from backend.services.rate_limiter import RateLimitExceeded
+from backend.services.fetch_planner import FetchPlan, plan_fetch, plan_fetches
+from backend.services.leader_lease import WORKER_ID, acquire_lease, last_sweep_at, record_sweep, release_lease
+from backend.services.job_queue import GENERATE_INSIGHT, enqueue
+from backend.services.adaptive_scheduler import advance_schedules, select_due_keywords
+from backend.services.content_fingerprint import fingerprint_fields, find_unchanged_insight
 from backend.models.insight import Insight
 from backend.models.post import Post, PostType
+from backend.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
 
+# 여러 워커 중 스케줄 작업을 실행할 리더를 정하는 리스 이름
+LEADER_LEASE = "scheduler"
+_is_leader = False
 
-async def generate_insight_for_keyword(keyword_id: int):
-    """특정 키워드에 대한 인사이트 생성"""
+
+# 키워드 처리 결과
+CREATED = "created"
+SKIPPED = "skipped"
+RATE_LIMITED = "rate_limited"
+FAILED = "failed"
+TIMEOUT = "timeout"
+UNCHANGED = "unchanged"
+
+# 마지막 스케줄 실행 요약
+last_run_summary: Dict = {}
+
+
+@dataclass
+class RunLimits:
+    """
+    스케줄 실행 1회에서 공유하는 단계별 동시 실행 제한
+    timeout은 단계별 제한 시간으로, 슬롯을 기다리는 시간은 포함하지 않습니다.
+    """
+    fetch: Optional[asyncio.Semaphore] = None
+    llm: Optional[asyncio.Semaphore] = None
+    timeout: Optional[float] = None
+
+    @classmethod
+    def from_settings(cls) -> "RunLimits":
+        return cls(
+            fetch=asyncio.Semaphore(settings.scheduler_fetch_concurrency),
+            llm=asyncio.Semaphore(settings.scheduler_llm_concurrency),
+            timeout=settings.scheduler_keyword_timeout,
+        )
+
+
+def _slot(semaphore: Optional[asyncio.Semaphore]):
+    return semaphore if semaphore is not None else contextlib.nullcontext()
+
+
+def schedule_interval_seconds() -> float:
+    """스케줄 실행 간격 중 가장 짧은 값 (초)"""
+    if settings.adaptive_scheduling:
+        return settings.adaptive_tick_minutes * 60
+    try:
+        hours = sorted({int(hour) for hour in settings.scheduler_hours.split(",") if hour.strip()})
+    except ValueError:
+        # 범위/간격 표현식 등 단순 시간 목록이 아니면 하루 간격으로 간주
+        return 24 * 3600
+    if len(hours) < 2:
+        return 24 * 3600
+    gaps = [later - earlier for earlier, later in zip(hours, hours[1:])]
+    gaps.append(hours[0] + 24 - hours[-1])
+    return min(gaps) * 3600
+
+
+def batch_timeout() -> float:
+    """
+    batch 완료 대기 제한 시간
+    다음 스케줄 실행 전에 개별 호출 폴백과 저장까지 끝나도록 실행 간격의 절반을 넘지 않게 제한합니다.
+    """
+    return min(settings.ai_batch_timeout, schedule_interval_seconds() / 2)
+
+
+async def generate_insight_for_keyword(
+    keyword_id: int,
+    tweets: Optional[List[str]] = None,
+    plan: Optional[FetchPlan] = None,
+    limits: Optional[RunLimits] = None,
+    raise_rate_limit: bool = False
+) -> str:
+    """
+    특정 키워드에 대한 인사이트 생성
+    tweets를 주면 트윗 수집을 생략하고, plan이 없으면 키워드 발생량으로 검색 계획을 세웁니다.
+    limits가 있으면 트윗 수집/AI 생성 단계를 각각의 세마포어 안에서 제한 시간을 두고 실행합니다.
+    제한 시간은 외부 호출에만 적용되고, 인사이트와 포스트는 한 트랜잭션으로 저장합니다.
+    트윗 집합이 마지막 인사이트와 같거나 거의 같으면 LLM을 호출하지 않고 UNCHANGED를 반환합니다.
+    raise_rate_limit이면 레이트 리밋을 RATE_LIMITED로 바꾸지 않고 그대로 발생시킵니다 (워커가 retry_after만큼 기다린 뒤 재시도).
+    Returns: 처리 결과 (CREATED / SKIPPED / UNCHANGED / RATE_LIMITED / FAILED / TIMEOUT)
+    """
+    limits = limits or RunLimits()
+    # 세마포어를 기다리는 동안 DB 커넥션을 붙잡지 않도록 필요한 값만 꺼내고 세션을 바로 닫음
     db = SessionLocal()
     try:
         keyword = db.query(Keyword).filter(Keyword.id == keyword_id).first()
         if not keyword or not keyword.is_active:
             logger.info(f"키워드 {keyword_id}는 활성화되지 않았거나 존재하지 않습니다.")
-            return
-        
-        logger.info(f"키워드 '{keyword.keyword}'에 대한 인사이트 생성 시작...")
+            return SKIPPED
+        keyword_text = keyword.keyword
+    finally:
+        db.close()
+    
+    try:
+        logger.info(f"키워드 '{keyword_text}'에 대한 인사이트 생성 시작...")
         
         # 트윗 수집
-        twitter_service = TwitterService()
-        tweets = await twitter_service.search_tweets(keyword.keyword, max_results=10, hours=24)
+        if tweets is None:
+            plan = plan or plan_fetch(keyword_text)
+            twitter_service = TwitterService()
+            async with _slot(limits.fetch):
+                tweets = await asyncio.wait_for(
+                    twitter_service.search_tweets(
+                        keyword_text, hours=plan.hours, candidates=plan.max_results
+                    ),
+                    timeout=limits.timeout
+                )
         
         if not tweets:
-            logger.warning(f"키워드 '{keyword.keyword}'에 대한 트윗을 찾을 수 없습니다.")
-            return
+            logger.warning(f"키워드 '{keyword_text}'에 대한 트윗을 찾을 수 없습니다.")
+            return SKIPPED
         
-        # AI 분석
-        ai_service = AIService()
-        insights_data = await ai_service.generate_insights(tweets)
-        
-        # 인사이트 저장
-        insight = Insight(
-            keyword_id=keyword.id,
-            keyword=keyword.keyword,
-            summary_kr=insights_data["summary_kr"],
-            summary_en=insights_data["summary_en"],
-            tweets_analyzed=len(tweets)
-        )
-        db.add(insight)
-        db.commit()
-        db.refresh(insight)
+        db = SessionLocal()
+        try:
+            unchanged = find_unchanged_insight(db, keyword_id, tweets)
+            unchanged_id = unchanged.id if unchanged is not None else None
+        finally:
+            db.close()
+        if unchanged_id is not None:
+            logger.info(
+                f"키워드 '{keyword_text}'의 트윗이 마지막 인사이트(ID: {unchanged_id})와 같아 생성을 건너뜁니다."
+            )
+            return UNCHANGED
+        
+        # AI 분석 (제한 시간은 LLM 호출에만 적용)
+        async with _slot(limits.llm):
+            bundle = await asyncio.wait_for(generate_bundle(tweets), timeout=limits.timeout)
         
-        # 포스트 생성
-        await generate_posts_for_insight(insight.id, insights_data, db)
+        # 인사이트 + 포스트를 한 트랜잭션으로 저장 (중간에 끊겨도 포스트 없는 인사이트가 남지 않음)
+        db = SessionLocal()
+        try:
+            insight_id = save_insight_with_posts(keyword_id, keyword_text, tweets, bundle, db).id
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
         
-        logger.info(f"키워드 '{keyword.keyword}'에 대한 인사이트 생성 완료 (ID: {insight.id})")
+        logger.info(f"키워드 '{keyword_text}'에 대한 인사이트 생성 완료 (ID: {insight_id})")
+        return CREATED
         
+    except RateLimitExceeded as e:
+        if raise_rate_limit:
+            raise
+        logger.warning(f"키워드 {keyword_id} 인사이트 생성 건너뜀 (레이트 리밋): {e}")
+        return RATE_LIMITED
+    except asyncio.TimeoutError:
+        logger.warning(f"키워드 {keyword_id} 인사이트 생성 시간 초과 ({limits.timeout}초)")
+        return TIMEOUT
     except Exception as e:
         logger.error(f"키워드 {keyword_id} 인사이트 생성 중 오류: {e}", exc_info=True)
-        db.rollback()
-    finally:
-        db.close()
+        return FAILED
 
 
-async def generate_posts_for_insight(insight_id: int, insights_data: dict, db: Session):
-    """인사이트에 대한 포스트 생성"""
-    try:
-        ai_service = AIService()
-        
-        # 트윗 초안 생성
-        tweet_drafts = await ai_service.generate_tweets(insights_data, count=5)
-        for tweet_content in tweet_drafts:
-            post = Post(
-                insight_id=insight_id,
-                post_type=PostType.TWEET,
-                content=tweet_content,
-                hashtags=None
-            )
-            db.add(post)
-        
-        # 인스타그램 포스트 생성
-        instagram_data = await ai_service.generate_instagram_post(insights_data)
+async def generate_bundle(tweets: List[str]) -> Dict:
+    """
+    트윗으로 인사이트와 포스트 생성 (LLM 호출만, 저장하지 않음)
+    fused 모드면 한 번의 호출로, 아니면 인사이트 생성 후 트윗/인스타그램 포스트를 생성합니다.
+    Returns: {"insights", "tweets", "instagram"}
+    """
+    ai_service = AIService()
+    if settings.ai_fused_generation:
+        return await ai_service.generate_all(tweets, count=5)
+    insights_data = await ai_service.generate_insights(tweets)
+    return {
+        "insights": insights_data,
+        "tweets": await ai_service.generate_tweets(insights_data, count=5),
+        "instagram": await ai_service.generate_instagram_post(insights_data),
+    }
+
+
+def save_insight_with_posts(
+    keyword_id: int,
+    keyword: str,
+    tweets: List[str],
+    bundle: Dict,
+    db: Session
+) -> Insight:
+    """인사이트와 포스트를 한 번의 커밋으로 저장"""
+    insight = Insight(
+        keyword_id=keyword_id,
+        keyword=keyword,
+        summary_kr=bundle["insights"]["summary_kr"],
+        summary_en=bundle["insights"]["summary_en"],
+        tweets_analyzed=len(tweets),
+        **fingerprint_fields(tweets, bundle["insights"])
+    )
+    db.add(insight)
+    db.flush()
+    add_posts_for_insight(insight.id, bundle["tweets"], bundle["instagram"], db)
+    db.commit()
+    db.refresh(insight)
+    return insight
+
+
+def save_posts_for_insight(insight_id: int, tweet_drafts: list, instagram_data: dict, db: Session):
+    """생성된 트윗 초안과 인스타그램 포스트 저장"""
+    add_posts_for_insight(insight_id, tweet_drafts, instagram_data, db)
+    db.commit()
+
+
+def add_posts_for_insight(insight_id: int, tweet_drafts: list, instagram_data: dict, db: Session):
+    """트윗 초안과 인스타그램 포스트를 세션에 추가 (커밋은 호출자가)"""
+    for tweet_content in tweet_drafts:
         post = Post(
             insight_id=insight_id,
-            post_type=PostType.INSTAGRAM,
-            content=instagram_data["caption"],
-            hashtags=",".join(instagram_data["hashtags"])
+            post_type=PostType.TWEET,
+            content=tweet_content,
+            hashtags=None
         )
         db.add(post)
+    
+    post = Post(
+        insight_id=insight_id,
+        post_type=PostType.INSTAGRAM,
+        content=instagram_data["caption"],
+        hashtags=",".join(instagram_data["hashtags"])
+    )
+    db.add(post)
+
+
+async def generate_insights_in_batch(keyword_ids: list) -> Dict[str, str]:
+    """
+    provider batch API로 여러 키워드의 인사이트와 포스트를 한 번에 생성
+    Returns: {키워드: 처리 결과}
+    """
+    outcomes: Dict[str, str] = {}
+    keywords: List[Keyword] = []
+    db = SessionLocal()
+    try:
+        keywords = db.query(Keyword).filter(
+            Keyword.id.in_(keyword_ids), Keyword.is_active == True
+        ).all()
         
-        db.commit()
+        # 트윗 수집 (실행당 예산 안에서 키워드별 검색 계획, 동시 수집 수는 scheduler_fetch_concurrency)
+        twitter_service = TwitterService()
+        plans = plan_fetches([keyword.keyword for keyword in keywords])
+        prefetched = await prefetch_tweets(keywords, plans)
+        limits = RunLimits.from_settings()
+        
+        async def fetch(keyword: Keyword) -> Optional[List[str]]:
+            if prefetched is not None:
+                tweets = prefetched.get(keyword.keyword)
+                if tweets is None:
+                    logger.warning(f"키워드 '{keyword.keyword}' 건너뜀 (레이트 리밋)")
+                return tweets
+            plan = plans[keyword.keyword]
+            try:
+                async with limits.fetch:
+                    return await twitter_service.search_tweets(
+                        keyword.keyword, hours=plan.hours, candidates=plan.max_results
+                    )
+            except RateLimitExceeded as e:
+                logger.warning(f"키워드 '{keyword.keyword}' 건너뜀 (레이트 리밋): {e}")
+                return None
+        
+        tweet_sets = {}
+        results = await asyncio.gather(*[fetch(keyword) for keyword in keywords])
+        for keyword, tweets in zip(keywords, results):
+            if tweets is None:
+                outcomes[keyword.keyword] = RATE_LIMITED
+            elif not tweets:
+                logger.warning(f"키워드 '{keyword.keyword}'에 대한 트윗을 찾을 수 없습니다.")
+                outcomes[keyword.keyword] = SKIPPED
+            elif find_unchanged_insight(db, keyword.id, tweets) is not None:
+                logger.info(f"키워드 '{keyword.keyword}'의 트윗이 마지막 인사이트와 같아 생성을 건너뜁니다.")
+                outcomes[keyword.keyword] = UNCHANGED
+            else:
+                tweet_sets[str(keyword.id)] = tweets
+        
+        # 모든 키워드를 batch 하나로 생성
+        ai_service = AIService()
+        bundles = await ai_service.generate_all_batch(
+            tweet_sets, count=5, timeout=batch_timeout(), llm=limits.llm
+        )
+        
+        for keyword in keywords:
+            if str(keyword.id) not in tweet_sets:
+                continue
+            bundle = bundles.get(str(keyword.id))
+            if not bundle:
+                outcomes[keyword.keyword] = FAILED
+                continue
+            insight = save_insight_with_posts(
+                keyword.id, keyword.keyword, tweet_sets[str(keyword.id)], bundle, db
+            )
+            outcomes[keyword.keyword] = CREATED
+            logger.info(f"키워드 '{keyword.keyword}'에 대한 인사이트 생성 완료 (ID: {insight.id})")
     except Exception as e:
-        logger.error(f"포스트 생성 중 오류: {e}", exc_info=True)
+        logger.error(f"batch 인사이트 생성 중 오류: {e}", exc_info=True)
         db.rollback()
+        for keyword in keywords:
+            outcomes.setdefault(keyword.keyword, FAILED)
+    finally:
+        db.close()
+    return outcomes
+
 
+async def prefetch_tweets(
+    keywords: List[Keyword],
+    plans: Dict[str, FetchPlan]
+) -> Optional[Dict[str, List[str]]]:
+    """
+    twitter_batch_queries가 켜져 있으면 여러 키워드를 OR 쿼리로 묶어 한 번에 수집
+    Returns: {keyword: tweets} (레이트 리밋에 걸린 키워드는 빠짐), 꺼져 있으면 None
+    """
+    if not settings.twitter_batch_queries or len(keywords) < 2:
+        return None
+    twitter_service = TwitterService()
+    return await twitter_service.search_tweets_batch(
+        [keyword.keyword for keyword in keywords], plans=plans
+    )
 
-async def scheduled_insight_generation():
-    """스케줄된 인사이트 생성 작업"""
+
+async def scheduled_insight_generation(keyword_ids: Optional[List[int]] = None) -> Dict[int, str]:
+    """
+    스케줄된 인사이트 생성 작업
+    키워드를 동시에 처리하되, 트윗 수집과 AI 호출은 각각의 세마포어로 동시 실행 수를 제한합니다.
+    keyword_ids를 주면 그 키워드만 처리합니다 (적응형 스케줄).
+    Returns: keyword_id → 실행 결과 (작업 대기열 모드면 워커가 실행하므로 빈 dict)
+    """
     db = SessionLocal()
+    started = time.monotonic()
     try:
         # 활성화된 모든 키워드 조회
-        active_keywords = db.query(Keyword).filter(Keyword.is_active == True).all()
+        query = db.query(Keyword).filter(Keyword.is_active == True)
+        if keyword_ids is not None:
+            query = query.filter(Keyword.id.in_(keyword_ids))
+        active_keywords = query.all()
         
         logger.info(f"활성화된 키워드 {len(active_keywords)}개에 대한 인사이트 생성 시작...")
         
+        if settings.job_queue_enabled:
+            enqueue_insight_jobs(active_keywords, adaptive=keyword_ids is not None)
+            return {}
+        
+        if settings.ai_batch_mode:
+            outcomes = await generate_insights_in_batch([keyword.id for keyword in active_keywords])
+            record_run_summary(outcomes, len(active_keywords), started)
+            return {keyword.id: outcomes[keyword.keyword] for keyword in active_keywords if keyword.keyword in outcomes}
+        
+        # 실행당 트윗 예산을 키워드 발생량에 맞게 배분 (검색 간격은 twitter_rate_limiter가 조절)
+        plans = plan_fetches([keyword.keyword for keyword in active_keywords])
+        prefetched = await prefetch_tweets(active_keywords, plans)
+        limits = RunLimits.from_settings()
+        
+        tasks = []
+        outcomes: Dict[str, str] = {}
         for keyword in active_keywords:
-            await generate_insight_for_keyword(keyword.id)
-            # API 레이트 리밋을 고려하여 약간의 딜레이
-            await asyncio.sleep(2)
+            if prefetched is None:
+                tasks.append(generate_insight_for_keyword(keyword.id, plan=plans[keyword.keyword], limits=limits))
+            elif keyword.keyword in prefetched:
+                tasks.append(generate_insight_for_keyword(keyword.id, tweets=prefetched[keyword.keyword], limits=limits))
+            else:
+                logger.warning(f"키워드 '{keyword.keyword}' 건너뜀 (레이트 리밋)")
+                outcomes[keyword.keyword] = RATE_LIMITED
         
-        logger.info("스케줄된 인사이트 생성 완료")
+        results = await asyncio.gather(*tasks)
+        scheduled = [
+            keyword for keyword in active_keywords
+            if prefetched is None or keyword.keyword in prefetched
+        ]
+        outcomes.update({keyword.keyword: result for keyword, result in zip(scheduled, results)})
+        record_run_summary(outcomes, len(active_keywords), started)
+        return {keyword.id: outcomes[keyword.keyword] for keyword in active_keywords if keyword.keyword in outcomes}
     except Exception as e:
         logger.error(f"스케줄된 인사이트 생성 중 오류: {e}", exc_info=True)
+        return {}
     finally:
         db.close()
 
 
+def record_run_summary(outcomes: Dict[str, str], keyword_count: int, started: float):
+    """실행 결과 요약을 last_run_summary(/health/scheduler)에 기록"""
+    summary = {
+        "finished_at": datetime.utcnow().isoformat() + "Z",
+        "elapsed_seconds": round(time.monotonic() - started, 1),
+        "keywords": keyword_count,
+        **{status: 0 for status in (CREATED, SKIPPED, UNCHANGED, RATE_LIMITED, FAILED, TIMEOUT)},
+    }
+    for result in outcomes.values():
+        summary[result] += 1
+    summary["unfinished"] = sorted(
+        keyword for keyword, result in outcomes.items() if result in (FAILED, TIMEOUT, RATE_LIMITED)
+    )
+    last_run_summary.clear()
+    last_run_summary.update(summary)
+    
+    logger.info(
+        f"스케줄된 인사이트 생성 완료: {summary['elapsed_seconds']}초, "
+        f"생성 {summary[CREATED]} / 건너뜀 {summary[SKIPPED]} / 변화 없음 {summary[UNCHANGED]} / 레이트 리밋 {summary[RATE_LIMITED]} / "
+        f"실패 {summary[FAILED]} / 시간 초과 {summary[TIMEOUT]}"
+    )
+
+
+def enqueue_insight_jobs(keywords: List[Keyword], adaptive: bool = False):
+    """
+    키워드별 인사이트 생성 작업을 jobs 테이블에 추가 (실행은 backend.worker 프로세스)
+    adaptive면 워커가 실행을 마친 뒤 키워드 스케줄을 갱신합니다.
+    """
+    plans = plan_fetches([keyword.keyword for keyword in keywords])
+    job_ids = [
+        enqueue(
+            GENERATE_INSIGHT,
+            {
+                "keyword_id": keyword.id,
+                "hours": plans[keyword.keyword].hours,
+                "max_results": plans[keyword.keyword].max_results,
+                "adaptive": adaptive,
+            },
+            dedupe_key=f"insight:{keyword.id}"
+        )
+        for keyword in keywords
+    ]
+    logger.info(f"인사이트 생성 작업 {len(job_ids)}개를 대기열에 추가했습니다.")
+
+
+def renew_leadership(catch_up: bool = True) -> bool:
+    """
+    리더 리스 획득/갱신 (주기적으로 실행, 리더가 바뀌면 로그)
+    catch_up이면 새로 리더가 되었을 때 놓친 정시 실행을 따라잡습니다 (정시 실행 자체에서 부를 때는 False).
+    """
+    global _is_leader
+    try:
+        leader = acquire_lease(LEADER_LEASE, settings.scheduler_lease_ttl)
+    except Exception as e:
+        logger.error(f"리더 리스 갱신 중 오류: {e}")
+        leader = False
+    if leader != _is_leader:
+        if leader:
+            logger.info(f"이 워커({WORKER_ID})가 스케줄러 리더가 되었습니다.")
+            if catch_up:
+                run_missed_sweep()
+        else:
+            logger.warning(f"이 워커({WORKER_ID})가 스케줄러 리더 리스를 잃었습니다.")
+    _is_leader = leader
+    return leader
+
+
+def run_missed_sweep():
+    """
+    이전 리더가 죽어 놓친 정시 실행이 있으면 바로 한 번 실행
+    마지막 실행(last_sweep_at) 이후의 cron 시각이 이미 지났으면 놓친 것으로 봅니다.
+    (적응형 스케줄은 다음 tick에 밀린 키워드를 고르므로 해당 없음)
+    """
+    job = scheduler.get_job("daily_insight_generation")
+    if job is None:
+        return
+    try:
+        swept_at = last_sweep_at(LEADER_LEASE)
+    except Exception as e:
+        logger.error(f"마지막 스케줄 실행 시각 조회 중 오류: {e}")
+        return
+    if swept_at is None:
+        return
+    due_at = job.trigger.get_next_fire_time(None, swept_at.replace(tzinfo=timezone.utc))
+    if due_at is None or due_at > datetime.now(timezone.utc):
+        return
+    logger.warning(f"놓친 인사이트 생성({due_at.isoformat()})을 지금 실행합니다.")
+    scheduler.add_job(leader_insight_generation, id="missed_insight_generation", replace_existing=True)
+
+
+async def leader_insight_generation():
+    """
+    리더 워커에서만 스케줄된 인사이트 생성 실행 (나머지 워커는 건너뜀)
+    적응형 스케줄이면 실행 시각이 된 키워드만 LLM 예산 안에서 실행합니다.
+    """
+    if not renew_leadership(catch_up=False):
+        logger.info("스케줄러 리더가 아니므로 이번 인사이트 생성을 건너뜁니다.")
+        return
+    if settings.adaptive_scheduling:
+        started_at = datetime.utcnow()
+        keyword_ids = select_due_keywords(started_at)
+        if keyword_ids:
+            outcomes = await scheduled_insight_generation(keyword_ids)
+            # 생성/변화 없음으로 끝난 키워드만 다음 실행을 미룸 (나머지는 다음 tick에 재시도)
+            advance_schedules(
+                [keyword_id for keyword_id, result in outcomes.items() if result in (CREATED, UNCHANGED)],
+                started_at
+            )
+    else:
+        await scheduled_insight_generation()
+    record_sweep(LEADER_LEASE)
+
+
 def start_scheduler(hours: str = "9,15,21"):
-    """스케줄러 시작"""
+    """
+    스케줄러 시작
+    워커마다 스케줄러가 뜨지만, 리더 리스를 가진 워커 하나만 인사이트를 생성합니다.
+    """
     from backend.config import settings
     
     # 설정에서 스케줄러 비활성화되어 있으면 시작하지 않음
@@ -131,20 +530,45 @@ def start_scheduler(hours: str = "9,15,21"):
     # 설정에서 시간 가져오기 (기본값: 9,15,21)
     scheduler_hours = hours or settings.scheduler_hours
     
-    # 매일 지정된 시간에 실행
+    if settings.adaptive_scheduling:
+        # 일정 주기마다 실행 시각이 된 키워드를 골라 실행
+        scheduler.add_job(
+            leader_insight_generation,
+            trigger=IntervalTrigger(minutes=settings.adaptive_tick_minutes),
+            id="adaptive_insight_generation",
+            replace_existing=True
+        )
+        schedule_description = f"{settings.adaptive_tick_minutes}분마다 트렌드 속도에 따라 키워드별로"
+    else:
+        # 매일 지정된 시간에 실행
+        scheduler.add_job(
+            leader_insight_generation,
+            trigger=CronTrigger(hour=scheduler_hours, minute=0),
+            id="daily_insight_generation",
+            replace_existing=True
+        )
+        schedule_description = f"매일 {scheduler_hours}시에"
+    
+    # 리더 리스 갱신 (TTL의 1/3 주기, 스레드 풀에서 실행되어 긴 작업 중에도 갱신됨)
     scheduler.add_job(
-        scheduled_insight_generation,
-        trigger=CronTrigger(hour=scheduler_hours, minute=0),
-        id="daily_insight_generation",
+        renew_leadership,
+        trigger=IntervalTrigger(seconds=max(settings.scheduler_lease_ttl / 3, 1)),
+        id="leader_lease_renewal",
+        next_run_time=datetime.now(),
         replace_existing=True
     )
     
     scheduler.start()
-    logger.info(f"스케줄러가 시작되었습니다. 매일 {scheduler_hours}시에 인사이트를 생성합니다.")
+    logger.info(f"스케줄러가 시작되었습니다. {schedule_description} 인사이트를 생성합니다. (워커 {WORKER_ID})")
 
 
 def stop_scheduler():
-    """스케줄러 중지"""
+    """스케줄러 중지 (리더였다면 리스를 반납해 다른 워커가 바로 이어받게 함)"""
+    global _is_leader
+    if not scheduler.running:
+        return
     scheduler.shutdown()
+    if _is_leader:
+        release_lease(LEADER_LEASE)
+        _is_leader = False
     logger.info("스케줄러가 중지되었습니다.")
-
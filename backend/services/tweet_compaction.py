@@ -0,0 +1,148 @@
+"""
+트윗 압축 (near-duplicate 제거)
+리트윗/복사본처럼 거의 같은 트윗을 MinHash + LSH로 묶고,
+클러스터마다 대표 트윗 1개와 개수만 남긴 뒤 토큰 예산에 맞게 자릅니다.
+"""
+from typing import Dict, List, Set
+from dataclasses import dataclass
+import random
+import re
+import zlib
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_RT_PREFIX = re.compile(r"^rt\s+@\w+:?\s*")
+_URL = re.compile(r"https?://\S+")
+_MENTION = re.compile(r"@\w+")
+_NON_WORD = re.compile(r"[^\w\s#]")
+_SPACES = re.compile(r"\s+")
+
+
+@dataclass
+class TweetCluster:
+    """대표 트윗 + 클러스터 크기"""
+    text: str
+    count: int
+
+
+def normalize_tweet(text: str) -> str:
+    """비교용 정규화 (RT 접두사, URL, 멘션, 문장부호 제거)"""
+    text = text.lower().strip()
+    text = _RT_PREFIX.sub("", text)
+    text = _URL.sub(" ", text)
+    text = _MENTION.sub(" ", text)
+    text = _NON_WORD.sub(" ", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+def shingles(text: str, k: int = 5) -> Set[int]:
+    """문자 k-gram 집합 (해시값)"""
+    if len(text) <= k:
+        return {zlib.crc32(text.encode())} if text else set()
+    return {zlib.crc32(text[i:i + k].encode()) for i in range(len(text) - k + 1)}
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (UTF-8 4바이트 ≈ 1토큰, 한글은 글자당 약 0.75토큰)"""
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+class MinHasher:
+    """MinHash 서명 + LSH 밴딩"""
+
+    def __init__(self, num_perm: int = 32, bands: int = 8, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._params = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: Set[int]) -> List[int]:
+        if not shingle_set:
+            return [_MAX_HASH] * self.num_perm
+        return [
+            min(((a * x + b) % _MERSENNE_PRIME) & _MAX_HASH for x in shingle_set)
+            for a, b in self._params
+        ]
+
+    def band_keys(self, signature: List[int]) -> List[tuple]:
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        """서명 일치 비율 (Jaccard 유사도 추정치)"""
+        return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+_default_hasher = MinHasher()
+
+
+def cluster_tweets(tweets: List[str], threshold: float = 0.7) -> List[TweetCluster]:
+    """
+    유사 트윗 클러스터링
+    입력 순서를 유지하며, 클러스터의 첫 트윗을 대표로 사용합니다.
+    """
+    signatures = []
+    parent = list(range(len(tweets)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets: Dict[tuple, List[int]] = {}
+    exact: Dict[str, int] = {}
+    for index, tweet in enumerate(tweets):
+        normalized = normalize_tweet(tweet)
+        # 완전히 같은 트윗은 해싱 없이 바로 병합
+        if normalized in exact:
+            parent[index] = find(exact[normalized])
+            signatures.append(signatures[exact[normalized]])
+            continue
+        exact[normalized] = index
+
+        signature = _default_hasher.signature(shingles(normalized))
+        signatures.append(signature)
+        for band_key in _default_hasher.band_keys(signature):
+            for other in buckets.setdefault(band_key, []):
+                root_a, root_b = find(index), find(other)
+                if root_a == root_b:
+                    continue
+                if MinHasher.similarity(signature, signatures[other]) >= threshold:
+                    # 먼저 나온 트윗이 루트가 되도록 병합
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+            buckets[band_key].append(index)
+
+    counts: Dict[int, int] = {}
+    for index in range(len(tweets)):
+        root = find(index)
+        counts[root] = counts.get(root, 0) + 1
+    return [TweetCluster(text=tweets[root], count=count) for root, count in counts.items()]
+
+
+def compact_tweets(
+    tweets: List[str],
+    token_budget: int,
+    threshold: float = 0.7,
+) -> List[TweetCluster]:
+    """유사 트윗을 묶고 토큰 예산 안에 들어가는 대표 트윗만 반환"""
+    clusters = cluster_tweets(tweets, threshold)
+    result = []
+    used = 0
+    for cluster in clusters:
+        cost = estimate_tokens(cluster.text)
+        if result and used + cost > token_budget:
+            break
+        result.append(cluster)
+        used += cost
+    return result
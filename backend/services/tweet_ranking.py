@@ -0,0 +1,73 @@
+"""
+트윗 랭킹
+public_metrics(좋아요/리트윗/답글/인용)로 참여도 점수를 매기고 최근성 감쇠를 곱해
+힙으로 상위 k개만 남깁니다.
+"""
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+import heapq
+import math
+
+# 참여 유형별 가중치 (리트윗/인용은 확산, 답글은 토론 신호)
+ENGAGEMENT_WEIGHTS = {
+    "like_count": 1.0,
+    "retweet_count": 2.0,
+    "reply_count": 1.5,
+    "quote_count": 2.5,
+}
+
+
+def _age_hours(created_at: Optional[str], now: datetime) -> float:
+    if not created_at:
+        return 0.0
+    try:
+        created = datetime.fromisoformat(created_at.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return 0.0
+    return max((now - created).total_seconds() / 3600, 0.0)
+
+
+def engagement_score(tweet: Dict, now: datetime, half_life_hours: float) -> float:
+    """참여도 점수 (log 스케일) × 최근성 감쇠 (half_life_hours마다 절반)"""
+    metrics = tweet.get("public_metrics") or {}
+    engagement = sum(
+        weight * (metrics.get(name) or 0) for name, weight in ENGAGEMENT_WEIGHTS.items()
+    )
+    # 참여가 없는 트윗도 최근 것이 먼저 오도록 1을 더함
+    decay = 0.5 ** (_age_hours(tweet.get("created_at"), now) / half_life_hours)
+    return (1 + math.log1p(engagement)) * decay
+
+
+class TopK:
+    """크기 k의 최소 힙으로 점수 상위 k개 유지 (한 개씩 push 가능)"""
+
+    def __init__(self, k: int, half_life_hours: float, now: Optional[datetime] = None):
+        self.k = k
+        self.half_life_hours = half_life_hours
+        self.now = now or datetime.utcnow()
+        self._heap: List[tuple] = []
+        self._seen = 0
+
+    def push(self, tweet: Dict):
+        if self.k <= 0:
+            return
+        # 동점이면 먼저 들어온(더 최신) 트윗 우선
+        item = (engagement_score(tweet, self.now, self.half_life_hours), -self._seen, tweet)
+        self._seen += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def result(self) -> List[Dict]:
+        """점수 높은 순으로 정렬된 상위 k개"""
+        return [item[2] for item in sorted(self._heap, key=lambda item: item[:2], reverse=True)]
+
+
+def top_k_tweets(tweets: Iterable[Dict], k: int, half_life_hours: float) -> List[Dict]:
+    """참여도 상위 k개 트윗 (점수 순)"""
+    top = TopK(k, half_life_hours)
+    for tweet in tweets:
+        top.push(tweet)
+    return top.result()
+
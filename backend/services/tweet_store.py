@@ -0,0 +1,107 @@
+"""
+원본 트윗 저장소
+수집한 트윗을 tweets 테이블에 bulk INSERT ... ON CONFLICT DO NOTHING으로 저장하고,
+재분석/백필 시 API 대신 로컬 데이터를 조회합니다.
+"""
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+import logging
+from sqlalchemy.orm import Session
+from backend.database import SessionLocal, engine
+from backend.models.tweet import Tweet
+
+logger = logging.getLogger(__name__)
+
+# SQLite 바인드 변수 제한(999)을 넘지 않도록 나눠서 저장
+_CHUNK_SIZE = 100
+
+
+def _insert(dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def _to_row(keyword: str, tweet: Dict) -> Dict:
+    metrics = tweet.get("public_metrics") or {}
+    created_at = tweet.get("created_at")
+    if created_at:
+        # naive UTC로 저장 (SQLite는 시간대를 보존하지 않음)
+        created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00")).replace(tzinfo=None)
+    return {
+        "id": tweet["id"],
+        "keyword": keyword,
+        "text": tweet["text"],
+        "like_count": metrics.get("like_count", 0),
+        "retweet_count": metrics.get("retweet_count", 0),
+        "reply_count": metrics.get("reply_count", 0),
+        "quote_count": metrics.get("quote_count", 0),
+        "created_at": created_at,
+    }
+
+
+def store_tweets(keyword: str, tweets: List[Dict], db: Optional[Session] = None) -> int:
+    """
+    트윗 bulk 저장 (같은 키워드로 이미 저장된 트윗은 무시)
+    Returns: 새로 저장된 트윗 수
+    """
+    if not tweets:
+        return 0
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        insert = _insert(engine.dialect.name)
+        rows = [_to_row(keyword, tweet) for tweet in tweets]
+        inserted = 0
+        for start in range(0, len(rows), _CHUNK_SIZE):
+            statement = insert(Tweet).values(rows[start:start + _CHUNK_SIZE])
+            result = db.execute(statement.on_conflict_do_nothing(index_elements=["id", "keyword"]))
+            inserted += max(result.rowcount or 0, 0)
+        db.commit()
+        return inserted
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"'{keyword}' 트윗 저장 실패: {e}")
+        return 0
+    finally:
+        if own_session:
+            db.close()
+
+
+def load_tweets(
+    keyword: str,
+    hours: int = 24,
+    limit: int = 100,
+    db: Optional[Session] = None
+) -> List[Dict]:
+    """저장된 트윗 조회 (최신순, iter_tweets와 같은 형식)"""
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        since = datetime.utcnow() - timedelta(hours=hours)
+        rows = (
+            db.query(Tweet)
+            .filter(Tweet.keyword == keyword, Tweet.created_at >= since)
+            .order_by(Tweet.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [
+            {
+                "id": row.id,
+                "text": row.text,
+                "created_at": row.created_at.isoformat() + "Z" if row.created_at else None,
+                "public_metrics": {
+                    "like_count": row.like_count,
+                    "retweet_count": row.retweet_count,
+                    "reply_count": row.reply_count,
+                    "quote_count": row.quote_count,
+                },
+            }
+            for row in rows
+        ]
+    finally:
+        if own_session:
+            db.close()
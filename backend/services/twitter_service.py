@@ -1,62 +1,499 @@
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+import asyncio
+import json
+import logging
+import re
 import httpx
 from backend.config import settings
+from backend.database import SessionLocal
+from backend.models.tweet_cursor import TweetCursor
+from backend.services.rate_limiter import RateLimitExceeded, twitter_rate_limiter
+from backend.services.tweet_store import store_tweets
+from backend.services.keyword_matcher import KeywordMatcher
+from backend.services.tweet_ranking import TopK, top_k_tweets
+from backend.services.fetch_planner import FetchPlan
+
+logger = logging.getLogger(__name__)
+
+# 수집 중 원본 트윗을 이 개수 단위로 저장 (다음 페이지를 받는 동안 스레드에서 실행)
+_STORE_CHUNK = 100
+
+TWITTER_DEFAULT_BASE_URL = "https://api.twitter.com/2"
+
+# 앱 전역에서 공유하는 Twitter API 클라이언트 (HTTP/2 + keep-alive)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_twitter_client() -> httpx.AsyncClient:
+    """공유 httpx 클라이언트 반환 (최초 호출 시 생성)"""
+    global _client
+    if _client is None or _client.is_closed:
+        http2 = settings.twitter_http2 and _http2_available()
+        if settings.twitter_http2 and not http2:
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 Twitter API에 연결합니다.")
+        _client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.twitter_max_connections,
+                max_keepalive_connections=settings.twitter_max_keepalive_connections,
+                keepalive_expiry=settings.twitter_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.twitter_connect_timeout,
+                read=settings.twitter_read_timeout,
+                write=settings.twitter_write_timeout,
+                pool=settings.twitter_pool_timeout,
+            ),
+        )
+        logger.info(f"Twitter API 클라이언트 생성 (HTTP/2: {http2})")
+    return _client
+
+
+async def close_twitter_client():
+    """앱 종료 시 공유 클라이언트 정리"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Twitter API 클라이언트 종료 완료")
+
+
+class TwitterAPIError(Exception):
+    """Twitter API 호출 실패"""
+
+
+def _parse_time(value: Optional[str]) -> datetime:
+    """Twitter API 시각 문자열(ISO 8601, UTC)을 naive UTC datetime으로 변환"""
+    if not value:
+        return datetime.min
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return datetime.min
+
+
+# 검색 연산자가 들어간 키워드는 OR 쿼리로 묶지 않음
+_QUERY_OPERATORS = re.compile(r'[:"()]|^-|\bOR\b')
+
+
+def _keyword_clause(keyword: str) -> str:
+    """여러 단어 키워드는 AND 의미를 유지하도록 괄호로 감쌈"""
+    return f"({keyword})" if len(keyword.split()) > 1 else keyword
+
+
+def build_or_query(keywords: List[str]) -> str:
+    """키워드 목록을 OR 검색 쿼리 하나로 변환"""
+    if len(keywords) == 1:
+        return keywords[0]
+    return "(" + " OR ".join(_keyword_clause(keyword) for keyword in keywords) + ")"
+
+
+def pack_keyword_queries(keywords: List[str], max_length: int) -> List[List[str]]:
+    """
+    쿼리 길이 제한 안에서 키워드를 OR 쿼리 묶음으로 나눔
+    같은 키워드 집합은 항상 같은 쿼리가 되도록 정렬합니다 (cursor 재사용).
+    """
+    groups: List[List[str]] = []
+    current: List[str] = []
+    for keyword in sorted(set(keyword.strip() for keyword in keywords if keyword.strip())):
+        if _QUERY_OPERATORS.search(keyword):
+            groups.append([keyword])
+            continue
+        if current and len(build_or_query(current + [keyword])) > max_length:
+            groups.append(current)
+            current = []
+        current.append(keyword)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _merge_tweets(new: List[Dict], old: List[Dict], limit: int) -> List[Dict]:
+    """새 트윗과 저장된 트윗을 ID 기준으로 합쳐 최신순으로 정렬"""
+    merged = {tweet["id"]: tweet for tweet in old}
+    merged.update({tweet["id"]: tweet for tweet in new})
+    # 트윗 ID(snowflake)는 시간순으로 증가
+    ordered = sorted(merged.values(), key=lambda tweet: int(tweet["id"]), reverse=True)
+    return ordered[:limit]
+
+
+def _top_texts(tweets: List[Dict], count: int) -> List[str]:
+    """참여도 상위 트윗 텍스트"""
+    return [
+        tweet["text"]
+        for tweet in top_k_tweets(tweets, count, settings.twitter_recency_half_life)
+    ]
+
+
+def _update_volume(cursor: TweetCursor, rate: float):
+    """시간당 트윗 수를 지수 이동 평균으로 갱신"""
+    alpha = settings.twitter_volume_smoothing
+    if cursor.tweets_per_hour is None:
+        cursor.tweets_per_hour = rate
+    else:
+        cursor.tweets_per_hour = alpha * rate + (1 - alpha) * cursor.tweets_per_hour
+    cursor.last_fetched_at = datetime.utcnow()
 
 
 class TwitterService:
     def __init__(self):
         self.bearer_token = settings.twitter_bearer_token
-        self.base_url = "https://api.twitter.com/2"
+        self.base_url = (settings.twitter_base_url or TWITTER_DEFAULT_BASE_URL).rstrip("/")
 
     async def search_tweets(
         self, 
         keyword: str, 
-        max_results: int = 10,
-        hours: int = 24
+        max_results: Optional[int] = None,
+        hours: int = 24,
+        candidates: Optional[int] = None
     ) -> List[str]:
         """
-        키워드로 트윗 검색 (최근 N시간, 상위 N개)
+        키워드로 트윗 검색 (최근 N시간, 참여도 상위 N개)
+        저장된 cursor가 있으면 since_id로 새 트윗만 받아 기존 구간과 합치고,
+        후보 트윗 중 참여도 × 최근성 점수가 높은 순으로 반환합니다.
+        max_results: 반환할 트윗 수 (기본 twitter_prompt_pool). 유사 트윗 압축과 토큰 예산은
+        프롬프트 단계(AIService)에서 적용하므로, 복사본이 상위를 채워도 남은 예산은 다른 트윗으로 채워지도록 넉넉히 넘깁니다.
+        candidates: 이번에 새로 수집할 최대 트윗 수 (기본 twitter_candidate_pool, fetch_planner가 결정)
         Returns: List of tweet texts
+        Raises: RateLimitExceeded (레이트 리밋에 걸렸고 저장된 트윗도 없을 때)
         """
         if not self.bearer_token:
             # 더미 데이터 반환
-            return self._get_dummy_tweets(keyword, max_results)
+            return self._get_dummy_tweets(keyword, max_results or settings.twitter_prompt_pool)
 
+        max_results = max_results or settings.twitter_prompt_pool
+        # 페이지가 도착하는 대로 랭킹 (마지막 페이지를 기다리지 않음)
+        top = TopK(max_results, settings.twitter_recency_half_life)
         try:
-            # 실제 Twitter API v2 호출
-            start_time = (datetime.utcnow() - timedelta(hours=hours)).isoformat() + "Z"
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/tweets/search/recent",
-                    headers={
-                        "Authorization": f"Bearer {self.bearer_token}"
-                    },
-                    params={
-                        "query": keyword,
-                        "max_results": min(max_results, 100),
-                        "start_time": start_time,
-                        "tweet.fields": "text,created_at,public_metrics"
-                    },
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    tweets = [
-                        tweet["text"] 
-                        for tweet in data.get("data", [])
-                    ]
-                    return tweets
-                else:
-                    # API 오류 시 더미 데이터 반환
-                    return self._get_dummy_tweets(keyword, max_results)
-                    
+            await self._search_window(
+                keyword, candidates or max(max_results, settings.twitter_candidate_pool), hours, top=top
+            )
+        except RateLimitExceeded:
+            # 더미 데이터로 대체하지 않고 호출자에게 알림
+            raise
         except Exception as e:
             print(f"Twitter API 오류: {e}")
             # 오류 시 더미 데이터 반환
             return self._get_dummy_tweets(keyword, max_results)
+        return [tweet["text"] for tweet in top.result()]
+
+    async def search_tweets_batch(
+        self,
+        keywords: List[str],
+        max_results: Optional[int] = None,
+        hours: int = 24,
+        plans: Optional[Dict[str, FetchPlan]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        여러 키워드를 OR 쿼리로 묶어 검색한 뒤 키워드별로 나눠 반환
+        plans가 있으면 묶음의 검색 구간은 가장 긴 구간, 수집량은 합계를 사용합니다.
+        레이트 리밋에 걸린 키워드는 결과에서 빠집니다.
+        Returns: {keyword: List of tweet texts}
+        """
+        max_results = max_results or settings.twitter_prompt_pool
+        if not self.bearer_token:
+            return {keyword: self._get_dummy_tweets(keyword, max_results) for keyword in keywords}
+
+        groups = pack_keyword_queries(keywords, settings.twitter_query_max_length)
+        results: Dict[str, List[str]] = {}
+        for group_result in await asyncio.gather(
+            *[self._search_group(group, max_results, hours, plans) for group in groups]
+        ):
+            results.update(group_result)
+        logger.info(f"키워드 {len(keywords)}개를 검색 요청 {len(groups)}개로 묶어 수집")
+        return results
+
+    async def _search_group(
+        self,
+        group: List[str],
+        max_results: int,
+        hours: int,
+        plans: Optional[Dict[str, FetchPlan]] = None
+    ) -> Dict[str, List[str]]:
+        """OR 쿼리 하나로 검색하고 Aho-Corasick 매처로 키워드별 트윗 분배"""
+        group_plans = [plans[keyword] for keyword in group if plans and keyword in plans]
+        if group_plans:
+            hours = max(plan.hours for plan in group_plans)
+            volume = sum(plan.max_results for plan in group_plans)
+        else:
+            volume = max(max_results, settings.twitter_candidate_pool) * len(group)
+
+        if len(group) == 1:
+            try:
+                return {group[0]: await self.search_tweets(group[0], max_results, hours, volume)}
+            except RateLimitExceeded as e:
+                logger.warning(f"'{group[0]}' 검색 건너뜀 (레이트 리밋): {e}")
+                return {}
+
+        query = build_or_query(group)
+        try:
+            # 묶인 쿼리는 cursor/최근 구간도 쿼리 문자열 단위로 보관
+            window, rate = await self._search_window(query, volume, hours, store=False)
+        except RateLimitExceeded as e:
+            logger.warning(f"키워드 {len(group)}개 묶음 검색 건너뜀 (레이트 리밋): {e}")
+            return {}
+        except Exception as e:
+            logger.warning(f"키워드 {len(group)}개 묶음 검색 실패, 더미 트윗 사용: {e}")
+            return {keyword: self._get_dummy_tweets(keyword, max_results) for keyword in group}
+
+        matcher = KeywordMatcher(group)
+        matched: Dict[str, List[Dict]] = {keyword: [] for keyword in group}
+        for tweet in window:
+            for keyword in matcher.match(tweet["text"]):
+                matched[keyword].append(tweet)
+
+        # DB 쓰기는 이벤트 루프를 막지 않도록 스레드에서 한 번에
+        await asyncio.to_thread(self._store_matches, matched, rate, len(window))
+        return {keyword: _top_texts(tweets, max_results) for keyword, tweets in matched.items()}
+
+    def _store_matches(self, matched: Dict[str, List[Dict]], rate: Optional[float], window_size: int):
+        """키워드별 매칭 트윗 저장 + 발생량 기록 (묶음 발생량을 매칭 비율로 나눠 키워드별 발생량으로)"""
+        for keyword, tweets in matched.items():
+            store_tweets(keyword, tweets)
+            if rate is not None and window_size:
+                self._record_volume(keyword, rate * len(tweets) / window_size)
+
+    async def _search_window(
+        self,
+        query: str,
+        max_results: int,
+        hours: int,
+        store: bool = True,
+        top: Optional[TopK] = None
+    ) -> Tuple[List[Dict], Optional[float]]:
+        """
+        cursor 기반 증분 검색 후 최근 구간 반환 (최신순)
+        max_results는 이번에 새로 수집할 최대 트윗 수 (since_id 이후 최신순)입니다.
+        iter_tweets를 끝까지 모으지 않고 트윗이 도착하는 대로 top(랭킹)에 넣고,
+        원본 저장은 다음 페이지를 받는 동안 스레드에서 진행합니다.
+        top에는 반환되는 최근 구간의 트윗이 정확히 한 번씩 들어갑니다.
+        API 오류 시 저장된 구간(+ 오류 전까지 받은 트윗)을 반환하고, 둘 다 없으면 예외를 그대로 발생시킵니다.
+        Returns: (최근 구간, 관측된 시간당 트윗 수 또는 None)
+        """
+        now = datetime.utcnow()
+        since = now - timedelta(hours=hours)
+        newest_id, window, last_fetched_at = await asyncio.to_thread(self._load_cursor, query)
+        window = [tweet for tweet in window if _parse_time(tweet.get("created_at")) >= since]
+        if not window:
+            # 저장된 구간이 모두 만료되면 처음부터 다시 검색
+            newest_id = None
+
+        window_max = settings.twitter_window_max
+        fetched: List[Dict] = []
+        chunk: List[Dict] = []
+        saving: Optional[asyncio.Task] = None
+        error: Optional[Exception] = None
+        try:
+            # 실제 Twitter API v2 호출 (since_id 이후의 새 트윗을 페이지를 따라가며 수집, 최신순)
+            async for tweet in self.iter_tweets(
+                query, limit=max_results, hours=hours, since_id=newest_id
+            ):
+                fetched.append(tweet)
+                if top is not None and len(fetched) <= window_max:
+                    # since_id 이후 트윗은 저장된 구간보다 최신이므로 앞쪽 window_max개는 반드시 구간에 남음
+                    top.push(tweet)
+                if store:
+                    chunk.append(tweet)
+                    if len(chunk) >= _STORE_CHUNK:
+                        saving = await self._store_in_background(query, chunk, saving)
+                        chunk = []
+        except Exception as e:
+            error = e
+        finally:
+            if store:
+                # 원본 트윗 보관 (재분석/백필용), 오류가 나도 받은 트윗은 저장
+                saving = await self._store_in_background(query, chunk, saving)
+                await saving
+
+        if error is not None:
+            if not window and not fetched:
+                raise error
+            logger.warning(f"'{query}' 검색 실패로 저장된 트윗 사용: {error}")
+            window = _merge_tweets(fetched, window, window_max)
+            self._push_rest(top, window, fetched[:window_max])
+            return window, None
+
+        # 발생량 관측: 수집량이 한도에 걸렸으면 가장 오래된 트윗까지, 아니면 검색 시작점까지의 시간
+        if fetched and len(fetched) >= max_results:
+            start = min(_parse_time(tweet.get("created_at")) for tweet in fetched)
+        elif newest_id and last_fetched_at:
+            start = max(last_fetched_at, since)
+        else:
+            start = since
+        span_hours = max((now - start).total_seconds() / 3600, 1 / 60)
+        rate = len(fetched) / span_hours
+
+        window = _merge_tweets(fetched, window, window_max)
+        self._push_rest(top, window, fetched[:window_max])
+        if fetched:
+            newest_id = max(fetched, key=lambda tweet: int(tweet["id"]))["id"]
+        await asyncio.to_thread(self._save_cursor, query, newest_id, window, rate)
+        logger.info(
+            f"'{query}' 트윗 {len(fetched)}개 신규 수집 "
+            f"(보관 {len(window)}개, 시간당 {rate:.1f}개)"
+        )
+        return window, rate
+
+    @staticmethod
+    async def _store_in_background(
+        keyword: str,
+        tweets: List[Dict],
+        previous: Optional[asyncio.Task]
+    ) -> asyncio.Task:
+        """이전 저장이 끝나면 다음 묶음 저장을 스레드에서 시작 (SQLite 쓰기 잠금 때문에 한 번에 하나씩)"""
+        if previous is not None:
+            await previous
+        return asyncio.create_task(asyncio.to_thread(store_tweets, keyword, list(tweets)))
+
+    @staticmethod
+    def _push_rest(top: Optional[TopK], window: List[Dict], pushed: List[Dict]):
+        """수집 중 랭킹에 넣지 않은 구간 트윗(저장돼 있던 트윗)을 마저 넣음"""
+        if top is None:
+            return
+        pushed_ids = {tweet["id"] for tweet in pushed}
+        for tweet in window:
+            if tweet["id"] not in pushed_ids:
+                top.push(tweet)
+
+    async def iter_tweets(
+        self,
+        keyword: str,
+        limit: int = 100,
+        hours: int = 24,
+        since_id: Optional[str] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        키워드 검색 결과를 페이지 단위로 받아 트윗을 하나씩 반환 (최신순)
+        meta.next_token을 따라 다음 페이지를 필요할 때만 요청합니다.
+        API 오류 시 TwitterAPIError, 레이트 리밋 시 RateLimitExceeded를 발생시킵니다.
+        """
+        if not self.bearer_token:
+            for index, text in enumerate(self._get_dummy_tweets(keyword, limit)):
+                yield {"id": str(index + 1), "text": text, "created_at": None, "public_metrics": {}}
+            return
+
+        params = {
+            "query": keyword,
+            "start_time": (datetime.utcnow() - timedelta(hours=hours)).isoformat() + "Z",
+            "tweet.fields": "text,created_at,public_metrics"
+        }
+        if since_id:
+            params["since_id"] = since_id
+
+        client = get_twitter_client()
+        remaining = limit
+        rate_limited = False
+        while remaining > 0:
+            # 페이지 크기는 API 허용 범위(10~100) 안에서 남은 개수만큼
+            params["max_results"] = min(max(remaining, 10), 100)
+            await twitter_rate_limiter.acquire()
+            response = await client.get(
+                f"{self.base_url}/tweets/search/recent",
+                headers={
+                    "Authorization": f"Bearer {self.bearer_token}"
+                },
+                params=params
+            )
+            if response.status_code == 429:
+                retry_after = twitter_rate_limiter.on_rate_limited(response.headers)
+                if rate_limited or retry_after > settings.twitter_rate_max_wait:
+                    raise RateLimitExceeded(
+                        f"Twitter API 레이트 리밋 ({retry_after:.0f}초 후 재시도 가능)",
+                        retry_after=retry_after
+                    )
+                # 창이 곧 초기화되면 governor가 기다린 뒤 같은 페이지를 한 번 더 요청
+                rate_limited = True
+                continue
+            rate_limited = False
+            twitter_rate_limiter.update(response.headers)
+            if response.status_code != 200:
+                raise TwitterAPIError(
+                    f"Twitter API 오류 {response.status_code}: {response.text[:200]}"
+                )
+
+            try:
+                data = response.json()
+            except ValueError:
+                raise TwitterAPIError(f"Twitter API 응답 파싱 실패: {response.text[:200]}")
+            for tweet in data.get("data", [])[:remaining]:
+                yield {
+                    "id": tweet["id"],
+                    "text": tweet["text"],
+                    "created_at": tweet.get("created_at"),
+                    "public_metrics": tweet.get("public_metrics") or {}
+                }
+                remaining -= 1
+
+            next_token = (data.get("meta") or {}).get("next_token")
+            if not next_token:
+                break
+            params["next_token"] = next_token
+
+    def _load_cursor(self, keyword: str) -> Tuple[Optional[str], List[Dict], Optional[datetime]]:
+        """저장된 newest_id, 최근 트윗 구간, 마지막 수집 시각 조회"""
+        db = SessionLocal()
+        try:
+            cursor = db.query(TweetCursor).filter(TweetCursor.keyword == keyword).first()
+            if not cursor:
+                return None, [], None
+            try:
+                window = json.loads(cursor.recent_tweets or "[]")
+            except json.JSONDecodeError:
+                window = []
+            last_fetched_at = cursor.last_fetched_at.replace(tzinfo=None) if cursor.last_fetched_at else None
+            return cursor.newest_id, window, last_fetched_at
+        finally:
+            db.close()
+
+    def _save_cursor(
+        self,
+        keyword: str,
+        newest_id: Optional[str],
+        window: List[Dict],
+        rate: Optional[float] = None
+    ):
+        """newest_id, 최근 트윗 구간, 발생량 저장"""
+        db = SessionLocal()
+        try:
+            cursor = db.query(TweetCursor).filter(TweetCursor.keyword == keyword).first()
+            if not cursor:
+                cursor = TweetCursor(keyword=keyword)
+                db.add(cursor)
+            cursor.newest_id = newest_id
+            cursor.recent_tweets = json.dumps(window, ensure_ascii=False)
+            if rate is not None:
+                _update_volume(cursor, rate)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"'{keyword}' 트윗 cursor 저장 실패: {e}")
+        finally:
+            db.close()
+
+    def _record_volume(self, keyword: str, rate: float):
+        """키워드 발생량만 기록 (묶음 검색으로 수집한 키워드용)"""
+        db = SessionLocal()
+        try:
+            cursor = db.query(TweetCursor).filter(TweetCursor.keyword == keyword).first()
+            if not cursor:
+                cursor = TweetCursor(keyword=keyword)
+                db.add(cursor)
+            _update_volume(cursor, rate)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"'{keyword}' 발생량 저장 실패: {e}")
+        finally:
+            db.close()
 
     def _get_dummy_tweets(self, keyword: str, count: int) -> List[str]:
         """더미 트윗 데이터 생성"""
@@ -0,0 +1 @@
+# 로컬 테스트/벤치마크용 외부 API 스텁 서버
@@ -0,0 +1,151 @@
+"""
+Provider batch API 스텁 서버
+OpenAI Batch API와 Anthropic Message Batches API를 흉내 내어,
+API 키 없이 스케줄러 batch 모드를 로컬에서 테스트할 수 있게 합니다.
+
+실행:
+    uvicorn backend.stubs.batch_server:app --port 9100
+
+설정 (.env):
+    OPENAI_BASE_URL=http://localhost:9100/v1
+    CLAUDE_BASE_URL=http://localhost:9100
+    AI_BATCH_MODE=true
+    AI_BATCH_POLL_INTERVAL=1
+
+환경 변수:
+    STUB_BATCH_DELAY  batch가 완료되기까지 걸리는 시간 (초, 기본 2)
+    STUB_BATCH_FAIL_RATE  항목별 실패 확률 (0~1, 기본 0)
+"""
+from typing import Dict
+import json
+import os
+import random
+import time
+import uuid
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import PlainTextResponse
+from backend.stubs.common import fake_completion
+
+app = FastAPI(title="Batch API stub")
+
+BATCH_DELAY = float(os.getenv("STUB_BATCH_DELAY", "2"))
+FAIL_RATE = float(os.getenv("STUB_BATCH_FAIL_RATE", "0"))
+
+_files: Dict[str, str] = {}
+_batches: Dict[str, dict] = {}
+
+
+def _is_done(batch: dict) -> bool:
+    return batch["status"] != "cancelled" and time.time() - batch["created"] >= BATCH_DELAY
+
+
+# ---- OpenAI Batch API ----
+
+@app.post("/v1/files")
+async def upload_file(file: UploadFile = File(...), purpose: str = Form(...)):
+    file_id = f"file-{uuid.uuid4().hex[:12]}"
+    _files[file_id] = (await file.read()).decode()
+    return {"id": file_id, "object": "file", "purpose": purpose}
+
+
+@app.get("/v1/files/{file_id}/content", response_class=PlainTextResponse)
+async def file_content(file_id: str):
+    if file_id not in _files:
+        raise HTTPException(status_code=404, detail="file not found")
+    return _files[file_id]
+
+
+@app.post("/v1/batches")
+async def create_openai_batch(body: dict):
+    input_file = _files.get(body.get("input_file_id"))
+    if input_file is None:
+        raise HTTPException(status_code=400, detail="input file not found")
+    batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+    requests = [json.loads(line) for line in input_file.splitlines() if line.strip()]
+    _batches[batch_id] = {"kind": "openai", "requests": requests, "created": time.time(), "status": "in_progress"}
+    return {"id": batch_id, "object": "batch", "status": "validating"}
+
+
+@app.get("/v1/batches/{batch_id}")
+async def get_openai_batch(batch_id: str):
+    batch = _batches.get(batch_id)
+    if batch is None or batch["kind"] != "openai":
+        raise HTTPException(status_code=404, detail="batch not found")
+    if batch["status"] == "in_progress" and _is_done(batch):
+        lines = []
+        for request in batch["requests"]:
+            if random.random() < FAIL_RATE:
+                lines.append({"custom_id": request["custom_id"], "response": None,
+                              "error": {"code": "server_error", "message": "stub failure"}})
+                continue
+            lines.append({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {
+                    "choices": [{"message": {"role": "assistant", "content": fake_completion()}}]
+                }},
+                "error": None
+            })
+        output_id = f"file-{uuid.uuid4().hex[:12]}"
+        _files[output_id] = "\n".join(json.dumps(line, ensure_ascii=False) for line in lines)
+        batch.update(status="completed", output_file_id=output_id)
+    return {"id": batch_id, "object": "batch", "status": batch["status"],
+            "output_file_id": batch.get("output_file_id")}
+
+
+@app.post("/v1/batches/{batch_id}/cancel")
+async def cancel_openai_batch(batch_id: str):
+    if batch_id in _batches:
+        _batches[batch_id]["status"] = "cancelled"
+    return {"id": batch_id, "status": "cancelled"}
+
+
+# ---- Anthropic Message Batches API ----
+
+@app.post("/v1/messages/batches")
+async def create_claude_batch(body: dict):
+    batch_id = f"msgbatch_{uuid.uuid4().hex[:12]}"
+    _batches[batch_id] = {"kind": "claude", "requests": body.get("requests", []),
+                          "created": time.time(), "status": "in_progress"}
+    return {"id": batch_id, "type": "message_batch", "processing_status": "in_progress"}
+
+
+@app.get("/v1/messages/batches/{batch_id}")
+async def get_claude_batch(batch_id: str, request: Request):
+    batch = _batches.get(batch_id)
+    if batch is None or batch["kind"] != "claude":
+        raise HTTPException(status_code=404, detail="batch not found")
+    ended = batch["status"] == "cancelled" or _is_done(batch)
+    return {
+        "id": batch_id,
+        "type": "message_batch",
+        "processing_status": "ended" if ended else "in_progress",
+        "results_url": f"{str(request.base_url).rstrip('/')}/v1/messages/batches/{batch_id}/results"
+        if ended else None
+    }
+
+
+@app.get("/v1/messages/batches/{batch_id}/results", response_class=PlainTextResponse)
+async def claude_batch_results(batch_id: str):
+    batch = _batches.get(batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="batch not found")
+    lines = []
+    for item in batch["requests"]:
+        if batch["status"] == "cancelled":
+            lines.append({"custom_id": item["custom_id"], "result": {"type": "canceled"}})
+        elif random.random() < FAIL_RATE:
+            lines.append({"custom_id": item["custom_id"],
+                          "result": {"type": "errored", "error": {"type": "api_error"}}})
+        else:
+            lines.append({"custom_id": item["custom_id"], "result": {
+                "type": "succeeded",
+                "message": {"role": "assistant", "content": [{"type": "text", "text": fake_completion()}]}
+            }})
+    return "\n".join(json.dumps(line, ensure_ascii=False) for line in lines)
+
+
+@app.post("/v1/messages/batches/{batch_id}/cancel")
+async def cancel_claude_batch(batch_id: str):
+    if batch_id in _batches:
+        _batches[batch_id]["status"] = "cancelled"
+    return {"id": batch_id, "processing_status": "canceling"}
@@ -0,0 +1,90 @@
+"""
+스텁 서버 공통 모듈
+환경 변수로 지연 시간 분포, 오류율, 429 비율, 깨진 응답 비율을 설정하고
+요청마다 어떤 결과를 낼지 결정합니다.
+
+환경 변수:
+    STUB_LATENCY_MS  지연 시간 중앙값 (밀리초, 기본 0)
+    STUB_LATENCY_DIST  지연 시간 분포 fixed / uniform / exponential / lognormal (기본 lognormal)
+    STUB_LATENCY_SIGMA  lognormal 분포의 sigma (꼬리 지연 정도, 기본 0.5)
+    STUB_ERROR_RATE  500 오류 확률 (0~1, 기본 0)
+    STUB_429_RATE  429 응답 확률 (0~1, 기본 0)
+    STUB_MALFORMED_RATE  깨진 JSON 응답 확률 (0~1, 기본 0)
+    STUB_SEED  난수 시드 (재현 가능한 벤치마크용, 기본 없음)
+"""
+from typing import Dict, Optional
+import asyncio
+import json
+import math
+import os
+import random
+
+LATENCY_MS = float(os.getenv("STUB_LATENCY_MS", "0"))
+LATENCY_DIST = os.getenv("STUB_LATENCY_DIST", "lognormal")
+LATENCY_SIGMA = float(os.getenv("STUB_LATENCY_SIGMA", "0.5"))
+ERROR_RATE = float(os.getenv("STUB_ERROR_RATE", "0"))
+RATE_LIMIT_RATE = float(os.getenv("STUB_429_RATE", "0"))
+MALFORMED_RATE = float(os.getenv("STUB_MALFORMED_RATE", "0"))
+
+_rng = random.Random(os.getenv("STUB_SEED"))
+
+# 결과
+OK = "ok"
+ERROR = "error"
+RATE_LIMITED = "rate_limited"
+MALFORMED = "malformed"
+
+stats: Dict[str, int] = {OK: 0, ERROR: 0, RATE_LIMITED: 0, MALFORMED: 0}
+
+
+def sample_latency() -> float:
+    """설정된 분포에서 지연 시간 샘플 (초)"""
+    median = LATENCY_MS / 1000
+    if median <= 0:
+        return 0.0
+    if LATENCY_DIST == "fixed":
+        return median
+    if LATENCY_DIST == "uniform":
+        return _rng.uniform(0, 2 * median)
+    if LATENCY_DIST == "exponential":
+        return _rng.expovariate(math.log(2) / median)
+    # lognormal: 중앙값 = exp(mu)
+    return _rng.lognormvariate(math.log(median), LATENCY_SIGMA)
+
+
+async def simulate(outcome: Optional[str] = None) -> str:
+    """지연 시간을 적용하고 이번 요청의 결과를 결정"""
+    latency = sample_latency()
+    if latency:
+        await asyncio.sleep(latency)
+    if outcome is None:
+        roll = _rng.random()
+        if roll < ERROR_RATE:
+            outcome = ERROR
+        elif roll < ERROR_RATE + RATE_LIMIT_RATE:
+            outcome = RATE_LIMITED
+        elif roll < ERROR_RATE + RATE_LIMIT_RATE + MALFORMED_RATE:
+            outcome = MALFORMED
+        else:
+            outcome = OK
+    stats[outcome] += 1
+    return outcome
+
+
+def truncate(text: str) -> str:
+    """응답을 중간에서 잘라 깨진 JSON으로 만듦"""
+    return text[: max(1, int(len(text) * _rng.uniform(0.3, 0.8)))]
+
+
+def fake_completion() -> str:
+    """인사이트/트윗/인스타그램/fused 프롬프트 모두에 맞는 고정 형식의 응답"""
+    return json.dumps({
+        "summary_kr": "스텁 서버가 생성한 한국어 트렌드 요약입니다. 주요 논의가 늘고 있습니다.",
+        "summary_en": "Stub server trend summary. Discussion volume is growing steadily.",
+        "tweets": [
+            f"📊 스텁 트윗 {i + 1}: 오늘의 트렌드를 확인해보세요! #트렌드" for i in range(5)
+        ],
+        "caption": "📈 스텁 서버 인스타그램 캡션입니다. 이번 주 트렌드를 한눈에 정리했어요. "
+                   "여러분은 어떻게 생각하시나요? 댓글로 알려주세요! 👇",
+        "hashtags": ["트렌드", "인사이트", "스텁"]
+    }, ensure_ascii=False)
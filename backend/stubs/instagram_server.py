@@ -0,0 +1,112 @@
+"""
+Instagram Graph API 스텁 서버
+해시태그 검색(ig_hashtag_search)과 top_media / recent_media 엣지를 흉내 내어,
+토큰 없이 InstagramService의 실제 HTTP 경로를 로컬에서 테스트할 수 있게 합니다.
+
+실행:
+    uvicorn backend.stubs.instagram_server:app --port 9200
+
+설정 (.env):
+    INSTAGRAM_ACCESS_TOKEN=stub
+    INSTAGRAM_USER_ID=17841400000000000
+    INSTAGRAM_BASE_URL=http://localhost:9200/v20.0
+
+환경 변수:
+    STUB_IG_MEDIA_PER_EDGE  엣지별 전체 미디어 수 (기본 60)
+    STUB_IG_DELAY  요청당 지연 시간 (초, 기본 0)
+    STUB_IG_RATE_LIMIT_RATE  rate limit 오류(code 4) 확률 (0~1, 기본 0)
+"""
+import asyncio
+import os
+import random
+import zlib
+from urllib.parse import urlencode
+from datetime import datetime, timedelta
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+app = FastAPI(title="Instagram Graph API stub")
+
+MEDIA_PER_EDGE = int(os.getenv("STUB_IG_MEDIA_PER_EDGE", "60"))
+DELAY = float(os.getenv("STUB_IG_DELAY", "0"))
+RATE_LIMIT_RATE = float(os.getenv("STUB_IG_RATE_LIMIT_RATE", "0"))
+
+_hashtags = {}  # hashtag id -> name
+_stats = {"hashtag_searches": 0, "media_requests": 0}
+
+
+def _error(code: int, message: str, status: int = 400) -> JSONResponse:
+    return JSONResponse(
+        status_code=status,
+        content={"error": {"message": message, "type": "OAuthException", "code": code}},
+    )
+
+
+async def _simulate(request: Request):
+    if DELAY:
+        await asyncio.sleep(DELAY)
+    if not request.query_params.get("access_token"):
+        return _error(190, "Invalid OAuth access token.")
+    if random.random() < RATE_LIMIT_RATE:
+        return _error(4, "Application request limit reached", status=403)
+    return None
+
+
+@app.get("/{version}/ig_hashtag_search")
+async def hashtag_search(version: str, request: Request):
+    error = await _simulate(request)
+    if error:
+        return error
+    name = request.query_params.get("q", "").lower()
+    if not name:
+        return _error(100, "Missing q parameter")
+    _stats["hashtag_searches"] += 1
+    hashtag_id = str(17843000000000000 + zlib.crc32(name.encode()))
+    _hashtags[hashtag_id] = name
+    return {"data": [{"id": hashtag_id}]}
+
+
+@app.get("/{version}/{hashtag_id}/{edge}")
+async def hashtag_media(version: str, hashtag_id: str, edge: str, request: Request):
+    error = await _simulate(request)
+    if error:
+        return error
+    if edge not in ("top_media", "recent_media") or hashtag_id not in _hashtags:
+        return _error(100, "Unsupported get request.")
+    _stats["media_requests"] += 1
+
+    name = _hashtags[hashtag_id]
+    limit = min(int(request.query_params.get("limit", "25")), 50)
+    offset = int(request.query_params.get("after", "0"))
+    now = datetime.utcnow()
+    data = []
+    for index in range(offset, min(offset + limit, MEDIA_PER_EDGE)):
+        # 같은 미디어가 두 엣지에 모두 나올 수 있도록 top은 짝수 번째만 사용
+        media_index = index * 2 if edge == "top_media" else index
+        data.append({
+            "id": f"{hashtag_id}_{media_index}",
+            "caption": f"스텁 인스타그램 포스트 {media_index + 1} #{name} #트렌드",
+            "like_count": (media_index * 37) % 500,
+            "comments_count": (media_index * 11) % 40,
+            "timestamp": (now - timedelta(minutes=media_index * 7)).strftime("%Y-%m-%dT%H:%M:%S+0000"),
+            "permalink": f"https://www.instagram.com/p/stub{media_index}/",
+            "media_type": "IMAGE",
+        })
+
+    body = {"data": data}
+    next_offset = offset + limit
+    if next_offset < MEDIA_PER_EDGE:
+        params = dict(request.query_params)
+        params["after"] = str(next_offset)
+        query = urlencode(params)
+        body["paging"] = {
+            "cursors": {"after": str(next_offset)},
+            "next": f"{str(request.base_url).rstrip('/')}{request.url.path}?{query}",
+        }
+    return body
+
+
+@app.get("/stats")
+async def stats():
+    """스텁 서버 요청 통계"""
+    return _stats
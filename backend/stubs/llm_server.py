@@ -0,0 +1,144 @@
+"""
+OpenAI / Anthropic 호환 LLM 스텁 서버
+/v1/chat/completions와 /v1/messages (스트리밍 포함)를 흉내 내어, API 키 없이
+AIService의 실제 HTTP / 재시도 / 파싱 / provider 전환 경로를 로컬에서 테스트합니다.
+
+실행:
+    uvicorn backend.stubs.llm_server:app --port 9400
+
+설정 (.env):
+    OPENAI_API_KEY=stub
+    CLAUDE_API_KEY=stub
+    OPENAI_BASE_URL=http://localhost:9400/v1
+    CLAUDE_BASE_URL=http://localhost:9400
+
+환경 변수:
+    STUB_STREAM_CHUNK  스트리밍 청크 크기 (글자 수, 기본 8)
+    지연 시간/오류율 설정은 backend.stubs.common 참고
+    (깨진 응답은 HTTP 본문은 정상이고 모델 출력 JSON이 잘린 형태)
+"""
+import json
+import os
+import time
+import uuid
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from backend.stubs import common
+
+app = FastAPI(title="LLM API stub")
+
+STREAM_CHUNK = int(os.getenv("STUB_STREAM_CHUNK", "8"))
+
+
+def _content(outcome: str) -> str:
+    text = common.fake_completion()
+    return common.truncate(text) if outcome == common.MALFORMED else text
+
+
+def _chunks(text: str):
+    for start in range(0, len(text), STREAM_CHUNK):
+        yield text[start:start + STREAM_CHUNK]
+
+
+def _sse(data: dict, event: str = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _failure(outcome: str, kind: str):
+    """오류/429 응답 (provider별 오류 형식)"""
+    status = 429 if outcome == common.RATE_LIMITED else 500
+    if kind == "openai":
+        error = {"error": {"message": "stub failure", "type": "rate_limit_exceeded" if status == 429 else "server_error"}}
+    else:
+        error = {"type": "error", "error": {"type": "rate_limit_error" if status == 429 else "api_error", "message": "stub failure"}}
+    return JSONResponse(status_code=status, content=error, headers={"retry-after": "1"})
+
+
+# ---- OpenAI ----
+
+@app.post("/v1/chat/completions")
+async def chat_completions(body: dict):
+    outcome = await common.simulate()
+    if outcome in (common.ERROR, common.RATE_LIMITED):
+        return _failure(outcome, "openai")
+
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+    created = int(time.time())
+    model = body.get("model", "stub")
+    text = _content(outcome)
+
+    if body.get("stream"):
+        def stream():
+            for piece in _chunks(text):
+                yield _sse({
+                    "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]
+                })
+            yield _sse({
+                "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+            })
+            yield "data: [DONE]\n\n"
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": text},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": len(text) // 4, "total_tokens": len(text) // 4}
+    }
+
+
+# ---- Anthropic ----
+
+@app.post("/v1/messages")
+async def messages(body: dict):
+    outcome = await common.simulate()
+    if outcome in (common.ERROR, common.RATE_LIMITED):
+        return _failure(outcome, "claude")
+
+    message_id = f"msg_{uuid.uuid4().hex[:12]}"
+    model = body.get("model", "stub")
+    text = _content(outcome)
+    usage = {"input_tokens": 0, "output_tokens": len(text) // 4}
+
+    if body.get("stream"):
+        def stream():
+            yield _sse({"type": "message_start", "message": {
+                "id": message_id, "type": "message", "role": "assistant", "model": model,
+                "content": [], "stop_reason": None, "stop_sequence": None, "usage": usage
+            }}, "message_start")
+            yield _sse({"type": "content_block_start", "index": 0,
+                        "content_block": {"type": "text", "text": ""}}, "content_block_start")
+            for piece in _chunks(text):
+                yield _sse({"type": "content_block_delta", "index": 0,
+                            "delta": {"type": "text_delta", "text": piece}}, "content_block_delta")
+            yield _sse({"type": "content_block_stop", "index": 0}, "content_block_stop")
+            yield _sse({"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                        "usage": {"output_tokens": usage["output_tokens"]}}, "message_delta")
+            yield _sse({"type": "message_stop"}, "message_stop")
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return {
+        "id": message_id,
+        "type": "message",
+        "role": "assistant",
+        "model": model,
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": usage
+    }
+
+
+@app.get("/stats")
+async def stats():
+    """스텁 서버 요청 결과 통계"""
+    return common.stats
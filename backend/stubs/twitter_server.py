@@ -0,0 +1,153 @@
+"""
+Twitter API v2 검색 스텁 서버
+/2/tweets/search/recent를 흉내 내어, bearer token 없이 TwitterService의 실제 HTTP 경로
+(since_id, next_token 페이지네이션, x-rate-limit 헤더, 429, 깨진 응답)를 로컬에서 테스트합니다.
+
+실행:
+    uvicorn backend.stubs.twitter_server:app --port 9300
+
+설정 (.env):
+    TWITTER_BEARER_TOKEN=stub
+    TWITTER_BASE_URL=http://localhost:9300/2
+
+환경 변수:
+    STUB_TWEETS_PER_MINUTE  쿼리당 생성되는 트윗 수 (분당, 기본 2)
+    STUB_TWITTER_RATE_LIMIT  15분 창당 허용 요청 수 (기본 450)
+    STUB_429_RESET  STUB_429_RATE로 주입한 429의 창 초기화까지 남은 시간 (초, 기본 5)
+    지연 시간/오류율 설정은 backend.stubs.common 참고
+"""
+from typing import List
+import json
+import os
+import re
+import time
+import zlib
+from datetime import datetime, timezone
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from backend.stubs import common
+
+app = FastAPI(title="Twitter API v2 stub")
+
+TWEETS_PER_MINUTE = float(os.getenv("STUB_TWEETS_PER_MINUTE", "2"))
+RATE_LIMIT = int(os.getenv("STUB_TWITTER_RATE_LIMIT", "450"))
+RATE_WINDOW = 900
+INJECTED_429_RESET = int(os.getenv("STUB_429_RESET", "5"))
+
+_window = {"reset": 0, "used": 0}
+
+_TEMPLATES = [
+    "{term} 관련 소식이 계속 올라오네요. 다들 어떻게 보세요?",
+    "오늘 {term} 얘기가 타임라인에 가득합니다 🔥",
+    "{term}에 대한 새로운 분석 글을 읽었는데 꽤 설득력 있어요.",
+    "RT @trend_watch: {term} 트렌드 정리 스레드 🧵",
+    "Honestly {term} is everywhere today. Thoughts?",
+    "{term} 때문에 업계 분위기가 달라지고 있다는 말이 많네요.",
+]
+
+
+def _terms(query: str) -> List[str]:
+    """OR 쿼리를 키워드 목록으로 분해 (트윗 본문에 넣을 용도)"""
+    query = re.sub(r"\b(is|has|lang|from|to):\S+", " ", query)
+    parts = [part.strip(" ()") for part in query.split(" OR ")]
+    return [part for part in parts if part] or ["트렌드"]
+
+
+def _tweet(query: str, terms: List[str], slot: int) -> dict:
+    """시간 슬롯 번호로 결정되는 트윗 (같은 쿼리/슬롯이면 항상 같은 내용)"""
+    created = slot * 60 / TWEETS_PER_MINUTE
+    seed = zlib.crc32(f"{query}:{slot}".encode())
+    term = terms[seed % len(terms)]
+    return {
+        # snowflake처럼 시간순으로 증가하는 ID
+        "id": str(int(created * 1000) * 1000 + seed % 1000),
+        "text": _TEMPLATES[seed % len(_TEMPLATES)].format(term=term),
+        "created_at": datetime.fromtimestamp(created, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "public_metrics": {
+            "like_count": seed % 300,
+            "retweet_count": (seed >> 8) % 60,
+            "reply_count": (seed >> 16) % 25,
+            "quote_count": (seed >> 24) % 10,
+        },
+    }
+
+
+def _rate_headers() -> dict:
+    return {
+        "x-rate-limit-limit": str(RATE_LIMIT),
+        "x-rate-limit-remaining": str(max(RATE_LIMIT - _window["used"], 0)),
+        "x-rate-limit-reset": str(_window["reset"]),
+    }
+
+
+@app.get("/2/tweets/search/recent")
+async def search_recent(request: Request):
+    now = time.time()
+    if now >= _window["reset"]:
+        _window["reset"] = int(now) + RATE_WINDOW
+        _window["used"] = 0
+
+    outcome = await common.simulate()
+    if _window["used"] >= RATE_LIMIT:
+        # 실제 한도 소진: 창이 끝날 때까지 429
+        return JSONResponse(
+            status_code=429,
+            content={"title": "Too Many Requests", "status": 429},
+            headers=_rate_headers(),
+        )
+    if outcome == common.RATE_LIMITED:
+        # 주입된 일시적 429: 짧은 시간 뒤 초기화
+        return JSONResponse(
+            status_code=429,
+            content={"title": "Too Many Requests", "status": 429},
+            headers={
+                **_rate_headers(),
+                "x-rate-limit-remaining": "0",
+                "x-rate-limit-reset": str(int(now) + INJECTED_429_RESET),
+            },
+        )
+    _window["used"] += 1
+    if outcome == common.ERROR:
+        return JSONResponse(status_code=503, content={"title": "Service Unavailable"}, headers=_rate_headers())
+
+    params = request.query_params
+    query = params.get("query", "")
+    max_results = min(max(int(params.get("max_results", "10")), 10), 100)
+    start_time = params.get("start_time")
+    start = (
+        datetime.fromisoformat(start_time.replace("Z", "+00:00")).timestamp()
+        if start_time else now - 7 * 86400
+    )
+    since_id = int(params.get("since_id", "0"))
+
+    # 최신 슬롯(또는 next_token이 가리키는 슬롯)부터 거꾸로 한 페이지 생성
+    terms = _terms(query)
+    interval = 60 / TWEETS_PER_MINUTE
+    next_token = params.get("next_token")
+    slot = int(next_token) if next_token else int(now / interval)
+    data = []
+    while len(data) < max_results and slot * interval >= start:
+        tweet = _tweet(query, terms, slot)
+        if int(tweet["id"]) <= since_id:
+            break
+        data.append(tweet)
+        slot -= 1
+
+    meta = {"result_count": len(data)}
+    if data:
+        meta["newest_id"] = data[0]["id"]
+        meta["oldest_id"] = data[-1]["id"]
+        last = _tweet(query, terms, slot)
+        if slot * interval >= start and int(last["id"]) > since_id:
+            meta["next_token"] = str(slot)
+    body = json.dumps({"data": data, "meta": meta} if data else {"meta": meta}, ensure_ascii=False)
+
+    if outcome == common.MALFORMED:
+        body = common.truncate(body)
+    return Response(content=body, media_type="application/json", headers=_rate_headers())
+
+
+@app.get("/stats")
+async def stats():
+    """스텁 서버 요청 결과 통계"""
+    return {**common.stats, "window_used": _window["used"]}
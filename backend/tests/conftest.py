@@ -0,0 +1,27 @@
+"""
+테스트 공통 설정
+백엔드 모듈을 import하기 전에 임시 SQLite DB와 메모리 전용 AI 캐시를 쓰도록 환경 변수를 지정합니다.
+"""
+import os
+import tempfile
+
+_DB_DIR = tempfile.mkdtemp(prefix="twitter_insights_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ["AI_CACHE_PATH"] = ""
+
+import pytest
+
+
+@pytest.fixture
+def db():
+    """테스트마다 빈 테이블을 만들고 세션을 반환"""
+    import backend.models  # noqa: F401 (모든 테이블 등록)
+    from backend.database import Base, SessionLocal, engine
+
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
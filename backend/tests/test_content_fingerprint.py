@@ -0,0 +1,79 @@
+import pytest
+
+from backend.config import settings
+from backend.models.keyword import Keyword
+from backend.services.ai_service import FALLBACK_KEY
+from backend.services.content_fingerprint import (
+    find_unchanged_insight, fingerprint, fingerprint_fields, similarity, tweet_hashes
+)
+from backend.services.scheduler_service import save_insight_with_posts
+
+TWEETS = [f"Tweet number {i} about the launch" for i in range(20)]
+INSIGHTS = {"summary_kr": "출시 관련 논의가 늘었습니다.", "summary_en": "Launch discussion grew."}
+BUNDLE = {
+    "insights": INSIGHTS,
+    "tweets": ["초안 트윗입니다 #launch"],
+    "instagram": {"caption": "캡션", "hashtags": ["launch"]},
+}
+
+
+@pytest.fixture(autouse=True)
+def skip_settings(monkeypatch):
+    monkeypatch.setattr(settings, "insight_skip_unchanged", True)
+    monkeypatch.setattr(settings, "insight_skip_similarity", 0.9)
+
+
+@pytest.fixture
+def keyword(db):
+    keyword = Keyword(keyword="launch", is_active=True)
+    db.add(keyword)
+    db.commit()
+    return keyword
+
+
+def test_fingerprint_ignores_order_duplicates_case_and_spacing():
+    variant = [tweet.upper().replace(" ", "  ") for tweet in reversed(TWEETS)] + TWEETS[:3]
+
+    assert tweet_hashes(variant) == tweet_hashes(TWEETS)
+    assert fingerprint(tweet_hashes(variant)) == fingerprint(tweet_hashes(TWEETS))
+    assert fingerprint(tweet_hashes(TWEETS[1:])) != fingerprint(tweet_hashes(TWEETS))
+
+
+def test_similarity():
+    assert similarity(tweet_hashes(TWEETS), tweet_hashes(TWEETS)) == 1.0
+    assert similarity(tweet_hashes(TWEETS[:10]), tweet_hashes(TWEETS[10:])) == 0.0
+    assert similarity([], []) == 1.0
+
+
+def test_fields_are_skipped_for_fallback_insights():
+    assert set(fingerprint_fields(TWEETS, INSIGHTS)) == {"content_fingerprint", "tweet_hashes"}
+    assert fingerprint_fields(TWEETS, {**INSIGHTS, FALLBACK_KEY: True}) == {}
+
+
+def test_same_tweets_find_the_last_insight(db, keyword):
+    saved = save_insight_with_posts(keyword.id, keyword.keyword, TWEETS, BUNDLE, db)
+
+    assert find_unchanged_insight(db, keyword.id, list(reversed(TWEETS))).id == saved.id
+
+
+def test_nearly_same_tweets_count_as_unchanged(db, keyword):
+    save_insight_with_posts(keyword.id, keyword.keyword, TWEETS, BUNDLE, db)
+
+    # 20개 중 1개만 바뀜 → Jaccard 19/21 ≈ 0.905
+    assert find_unchanged_insight(db, keyword.id, TWEETS[:-1] + ["A brand new tweet"]) is not None
+    assert find_unchanged_insight(db, keyword.id, TWEETS[:10] + ["new"] * 5) is None
+
+
+def test_fallback_insight_is_never_treated_as_unchanged(db, keyword):
+    fallback = {**BUNDLE, "insights": {**INSIGHTS, FALLBACK_KEY: True}}
+    saved = save_insight_with_posts(keyword.id, keyword.keyword, TWEETS, fallback, db)
+
+    assert saved.content_fingerprint is None
+    assert find_unchanged_insight(db, keyword.id, TWEETS) is None
+
+
+def test_skip_can_be_disabled(db, keyword, monkeypatch):
+    save_insight_with_posts(keyword.id, keyword.keyword, TWEETS, BUNDLE, db)
+    monkeypatch.setattr(settings, "insight_skip_unchanged", False)
+
+    assert find_unchanged_insight(db, keyword.id, TWEETS) is None
@@ -0,0 +1,78 @@
+import pytest
+
+from backend.config import settings
+from backend.models.tweet_cursor import TweetCursor
+from backend.services.fetch_planner import MIN_RESULTS, allocate, plan_fetch, plan_fetches
+
+
+@pytest.fixture(autouse=True)
+def planner_settings(monkeypatch):
+    monkeypatch.setattr(settings, "twitter_target_tweets", 50)
+    monkeypatch.setattr(settings, "twitter_max_results_cap", 300)
+    monkeypatch.setattr(settings, "twitter_min_hours", 1)
+    monkeypatch.setattr(settings, "twitter_max_hours", 168)
+    monkeypatch.setattr(settings, "twitter_default_tweets_per_hour", 10.0)
+
+
+def test_quiet_keyword_gets_a_longer_window():
+    plans = allocate({"quiet": 1.0, "busy": 500.0}, budget=100)
+
+    assert (plans["quiet"].hours, plans["quiet"].max_results) == (50, 50)
+    assert (plans["busy"].hours, plans["busy"].max_results) == (1, 50)
+
+
+def test_window_is_capped_at_max_hours():
+    plans = allocate({"silent": 0.0}, budget=100)
+
+    assert plans["silent"].hours == 168
+    assert plans["silent"].max_results == MIN_RESULTS
+
+
+def test_over_budget_scales_down_proportionally():
+    plans = allocate({"a": 100.0, "b": 100.0}, budget=60)
+
+    assert [plan.max_results for plan in plans.values()] == [30, 30]
+
+
+def test_scaling_never_goes_below_minimum():
+    plans = allocate({"a": 100.0, "b": 100.0, "c": 100.0}, budget=20)
+
+    assert all(plan.max_results == MIN_RESULTS for plan in plans.values())
+
+
+def test_leftover_goes_to_busier_keywords_by_rate():
+    plans = allocate({"a": 300.0, "b": 100.0}, budget=200)
+
+    assert plans["a"].max_results == 125
+    assert plans["b"].max_results == 75
+
+
+def test_leftover_is_limited_by_what_the_window_holds():
+    plans = allocate({"busy": 500.0, "quiet": 1.0}, budget=1000)
+
+    assert plans["busy"].max_results == 300  # twitter_max_results_cap
+    assert plans["quiet"].max_results == 50  # 50시간 구간의 기대 트윗 수
+
+
+@pytest.mark.parametrize("budget", [40, 100, 250, 777])
+def test_total_stays_within_budget(budget):
+    rates = {"a": 0.5, "b": 3.0, "c": 40.0, "d": 900.0}
+
+    assert sum(plan.max_results for plan in allocate(rates, budget).values()) <= budget
+
+
+def test_plan_fetches_uses_recorded_volume(db):
+    db.add(TweetCursor(keyword="busy", tweets_per_hour=500.0))
+    db.commit()
+
+    plans = plan_fetches(["busy", "unknown"], budget=100)
+
+    assert plans["busy"].hours == 1
+    assert plans["unknown"].hours == 5  # 기본 발생량 10개/시간으로 목표 50개
+
+
+def test_plan_fetch_stays_within_target_sample(db):
+    db.add(TweetCursor(keyword="busy", tweets_per_hour=500.0))
+    db.commit()
+
+    assert plan_fetch("busy").max_results == 50
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.config import settings
+from backend.models.job import Job, JobStatus
+from backend.services.job_queue import (
+    GENERATE_INSIGHT, claim_jobs, complete_job, enqueue, extend_leases, fail_job, queue_stats
+)
+
+
+@pytest.fixture(autouse=True)
+def queue_settings(monkeypatch, db):
+    monkeypatch.setattr(settings, "job_max_attempts", 2)
+    monkeypatch.setattr(settings, "job_retry_base", 30.0)
+    monkeypatch.setattr(settings, "job_lease_seconds", 300)
+
+
+def _job(db, job_id):
+    db.expire_all()
+    return db.get(Job, job_id)
+
+
+def test_claim_returns_payload_and_locks(db):
+    job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": 7})
+
+    jobs = claim_jobs("worker-a", 5)
+
+    assert jobs == [{"id": job_id, "kind": GENERATE_INSIGHT, "payload": {"keyword_id": 7}, "attempts": 1}]
+    job = _job(db, job_id)
+    assert job.status == JobStatus.RUNNING
+    assert job.locked_by == "worker-a"
+    # 이미 가져간 작업은 다른 워커가 가져가지 못함
+    assert claim_jobs("worker-b", 5) == []
+
+
+def test_claim_respects_limit_and_run_after(db):
+    first = enqueue(GENERATE_INSIGHT, {"keyword_id": 1})
+    enqueue(GENERATE_INSIGHT, {"keyword_id": 2})
+    enqueue(GENERATE_INSIGHT, {"keyword_id": 3}, delay=3600)
+
+    assert [job["id"] for job in claim_jobs("worker-a", 1)] == [first]
+    assert len(claim_jobs("worker-a", 5)) == 1
+    assert claim_jobs("worker-a", 0) == []
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(db):
+    job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": 1})
+    claim_jobs("worker-a", 1)
+    job = _job(db, job_id)
+    job.locked_until = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+
+    jobs = claim_jobs("worker-b", 1)
+
+    assert [(job["id"], job["attempts"]) for job in jobs] == [(job_id, 2)]
+    # 리스를 잃은 워커의 완료 처리는 무시
+    complete_job(job_id, "worker-a", "created")
+    assert _job(db, job_id).status == JobStatus.RUNNING
+
+
+def test_extend_leases_only_touches_own_jobs(db):
+    job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": 1})
+    claim_jobs("worker-a", 1)
+    before = _job(db, job_id).locked_until
+
+    extend_leases("worker-b", [job_id])
+    assert _job(db, job_id).locked_until == before
+
+    extend_leases("worker-a", [job_id])
+    assert _job(db, job_id).locked_until >= before
+
+
+def test_complete_job(db):
+    job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": 1})
+    claim_jobs("worker-a", 1)
+
+    complete_job(job_id, "worker-a", "created")
+
+    job = _job(db, job_id)
+    assert (job.status, job.result, job.locked_until) == (JobStatus.DONE, "created", None)
+    assert job.finished_at is not None
+
+
+def test_failure_retries_with_backoff_then_fails(db):
+    job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": 1})
+    claim_jobs("worker-a", 1)
+
+    fail_job(job_id, "worker-a", "boom")
+
+    job = _job(db, job_id)
+    assert job.status == JobStatus.PENDING
+    assert job.last_error == "boom"
+    assert job.run_after > datetime.utcnow() + timedelta(seconds=20)
+    assert claim_jobs("worker-a", 1) == []
+
+    job.run_after = datetime.utcnow()
+    db.commit()
+    claim_jobs("worker-a", 1)
+    fail_job(job_id, "worker-a", "boom again")
+
+    job = _job(db, job_id)
+    assert (job.status, job.attempts) == (JobStatus.FAILED, 2)
+    assert job.finished_at is not None
+
+
+def test_retry_waits_at_least_retry_after(db):
+    job_id = enqueue(GENERATE_INSIGHT, {"keyword_id": 1})
+    claim_jobs("worker-a", 1)
+
+    fail_job(job_id, "worker-a", "rate limited", retry_after=900)
+
+    assert _job(db, job_id).run_after > datetime.utcnow() + timedelta(seconds=890)
+
+
+def test_dedupe_key_reuses_pending_and_running_jobs(db):
+    first = enqueue(GENERATE_INSIGHT, {"keyword_id": 1}, dedupe_key="insight:1")
+    assert enqueue(GENERATE_INSIGHT, {"keyword_id": 1}, dedupe_key="insight:1") == first
+
+    claim_jobs("worker-a", 1)
+    assert enqueue(GENERATE_INSIGHT, {"keyword_id": 1}, dedupe_key="insight:1") == first
+    assert enqueue(GENERATE_INSIGHT, {"keyword_id": 2}, dedupe_key="insight:2") != first
+
+    complete_job(first, "worker-a", "created")
+    assert enqueue(GENERATE_INSIGHT, {"keyword_id": 1}, dedupe_key="insight:1") != first
+
+
+def test_queue_stats_counts_every_status(db):
+    enqueue(GENERATE_INSIGHT, {"keyword_id": 1})
+    done = enqueue(GENERATE_INSIGHT, {"keyword_id": 2}, delay=-1)
+    claim_jobs("worker-a", 1)
+    complete_job(done, "worker-a", "created")
+
+    assert queue_stats() == {"pending": 1, "running": 0, "done": 1, "failed": 0}
@@ -0,0 +1,42 @@
+from backend.services.keyword_matcher import KeywordMatcher
+
+
+def test_one_tweet_matches_several_keywords():
+    matcher = KeywordMatcher(["OpenAI", "GPT", "인공지능", "Nvidia"])
+
+    assert matcher.match("OpenAI just shipped a new GPT model — 인공지능 업계가 들썩입니다") == [
+        "OpenAI", "GPT", "인공지능"
+    ]
+
+
+def test_results_follow_keyword_order():
+    matcher = KeywordMatcher(["rust", "python", "go"])
+
+    assert matcher.match("Go vs Python vs Rust benchmarks") == ["rust", "python", "go"]
+
+
+def test_ascii_terms_need_word_boundaries():
+    matcher = KeywordMatcher(["AI", "GPT"])
+
+    assert matcher.match("Said the AI researcher") == ["AI"]
+    assert matcher.match("A mountain trail with GPTs nearby") == []
+    assert matcher.match("pain and rain") == []
+
+
+def test_korean_terms_match_with_particles():
+    matcher = KeywordMatcher(["삼성", "반도체"])
+
+    assert matcher.match("삼성전자가 반도체를 늘린다") == ["삼성", "반도체"]
+
+
+def test_multi_word_keyword_requires_all_terms():
+    matcher = KeywordMatcher(["apple vision", "apple"])
+
+    assert matcher.match("Apple earnings beat estimates") == ["apple"]
+    assert matcher.match("Vision Pro sales: Apple says demand is strong") == ["apple vision", "apple"]
+
+
+def test_overlapping_terms_share_the_trie():
+    matcher = KeywordMatcher(["he", "she", "hers"])
+
+    assert matcher.match("ushers and she said hers") == ["she", "hers"]
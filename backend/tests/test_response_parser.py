@@ -0,0 +1,80 @@
+import json
+
+from backend.services.ai_models import InsightResponse
+from backend.services.ai_service import INSIGHT_ADAPTER, TWEET_ADAPTER
+from backend.services.response_parser import (
+    PATH_EXTRACTED, PATH_FAILED, PATH_JSON, PATH_TEXT, iter_json_objects, parse_structured, parse_stats
+)
+
+SUMMARY = {
+    "summary_kr": "AI 에이전트 관련 논의가 급증했습니다.",
+    "summary_en": "Discussion of AI agents spiked this week.",
+}
+
+
+def _text_fallback(text):
+    return InsightResponse(summary_kr="텍스트에서 뽑은 한글 요약입니다.", summary_en="Summary taken from plain text.")
+
+
+def test_whole_response_is_json():
+    result = parse_structured(json.dumps(SUMMARY, ensure_ascii=False), INSIGHT_ADAPTER, "test")
+
+    assert result.path == PATH_JSON
+    assert result.value.summary_en == SUMMARY["summary_en"]
+
+
+def test_json_extracted_from_code_block():
+    text = "다음은 분석입니다:\n```json\n" + json.dumps(SUMMARY, ensure_ascii=False, indent=2) + "\n```\n끝."
+
+    result = parse_structured(text, INSIGHT_ADAPTER, "test")
+
+    assert result.path == PATH_EXTRACTED
+    assert result.value.summary_kr == SUMMARY["summary_kr"]
+
+
+def test_first_valid_object_wins_over_invalid_one():
+    text = '{"summary_kr": "짧음", "summary_en": "short"} 수정본: ' + json.dumps(SUMMARY, ensure_ascii=False)
+
+    result = parse_structured(text, INSIGHT_ADAPTER, "test")
+
+    assert result.path == PATH_EXTRACTED
+    assert result.value.summary_en == SUMMARY["summary_en"]
+
+
+def test_text_fallback_when_no_valid_json():
+    truncated = json.dumps(SUMMARY, ensure_ascii=False)[:-10]
+
+    result = parse_structured(truncated, INSIGHT_ADAPTER, "test", _text_fallback)
+
+    assert result.path == PATH_TEXT
+    assert result.value.summary_en == "Summary taken from plain text."
+
+
+def test_failed_when_schema_invalid_and_no_fallback():
+    result = parse_structured('{"tweets": []}', TWEET_ADAPTER, "test")
+
+    assert result.path == PATH_FAILED
+    assert result.value is None
+
+
+def test_failed_when_fallback_finds_nothing():
+    result = parse_structured("no json here", INSIGHT_ADAPTER, "test", lambda text: None)
+
+    assert result.path == PATH_FAILED
+
+
+def test_paths_are_counted_per_kind():
+    parse_stats.pop("counted", None)
+    parse_structured(json.dumps(SUMMARY), INSIGHT_ADAPTER, "counted")
+    parse_structured("nothing", INSIGHT_ADAPTER, "counted")
+
+    assert parse_stats["counted"] == {PATH_JSON: 1, PATH_FAILED: 1}
+
+
+def test_scanner_ignores_braces_inside_strings():
+    text = 'x {"a": "}{\\"", "b": {"c": 1}} y {"d": 2} {"broken": '
+
+    assert [text[start:end] for start, end in iter_json_objects(text)] == [
+        '{"a": "}{\\"", "b": {"c": 1}}',
+        '{"d": 2}',
+    ]
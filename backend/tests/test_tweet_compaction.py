@@ -0,0 +1,59 @@
+from backend.services.tweet_compaction import (
+    cluster_tweets, compact_tweets, estimate_tokens, normalize_tweet
+)
+
+VIRAL = "Breaking: the new open model beats every benchmark we tried, details in the thread"
+
+
+def test_normalize_strips_retweet_urls_and_mentions():
+    assert normalize_tweet(f"RT @someone: {VIRAL} https://t.co/abc @friend!") == normalize_tweet(VIRAL)
+
+
+def test_near_duplicates_form_one_cluster():
+    tweets = [
+        VIRAL,
+        f"RT @news: {VIRAL}",
+        VIRAL + " 🔥🔥",
+        f"{VIRAL} https://t.co/xyz",
+        "Completely unrelated post about cooking pasta at home tonight",
+    ]
+    clusters = cluster_tweets(tweets)
+
+    assert [cluster.count for cluster in clusters] == [4, 1]
+    # 클러스터의 첫 트윗이 대표
+    assert clusters[0].text == VIRAL
+    assert clusters[1].text.startswith("Completely unrelated")
+
+
+def test_distinct_tweets_stay_separate():
+    tweets = [f"Distinct opinion number {i} about topic {chr(65 + i)} with different wording" for i in range(5)]
+    tweets += ["Totally different: weather is great", "Another one about football scores"]
+
+    assert sum(cluster.count for cluster in cluster_tweets(tweets)) == len(tweets)
+    assert len(cluster_tweets(["a", "b", "c"])) == 3
+
+
+def test_compaction_stops_at_token_budget():
+    tweets = [f"Tweet {i}: " + "unique words " * 3 + str(i) * 20 for i in range(20)]
+    cost = estimate_tokens(tweets[0])
+
+    compacted = compact_tweets(tweets, token_budget=cost * 5)
+
+    assert len(compacted) == 5
+    assert [cluster.text for cluster in compacted] == tweets[:5]
+
+
+def test_compaction_keeps_one_cluster_even_over_budget():
+    compacted = compact_tweets([VIRAL, VIRAL, "short"], token_budget=1)
+
+    assert len(compacted) == 1
+    assert compacted[0].count == 2
+
+
+def test_duplicates_do_not_consume_budget():
+    tweets = [VIRAL] * 30 + [f"Independent take {i}: " + "x" * i for i in range(10)]
+
+    compacted = compact_tweets(tweets, token_budget=estimate_tokens(VIRAL) + 200)
+
+    assert compacted[0].count == 30
+    assert len(compacted) > 1
@@ -0,0 +1,241 @@
+"""
+파이프라인 워커
+jobs 테이블의 작업(인사이트 생성, 포스트 생성)을 가져와 실행하는 별도 프로세스입니다.
+API 프로세스와 이벤트 루프를 공유하지 않고, 재시작해도 작업이 DB에 남아 다른 워커가 이어서 실행합니다.
+여러 프로세스로 띄워 수평 확장할 수 있습니다 (작업은 한 워커만 가져감).
+
+실행:
+    JOB_QUEUE_ENABLED=true python -m backend.worker --concurrency 4
+"""
+from typing import Awaitable, Callable, Dict, Optional
+import argparse
+import asyncio
+import logging
+import signal
+from backend.config import settings
+from backend.database import SessionLocal, init_db
+from backend.models.insight import Insight
+from backend.models.keyword import Keyword
+from backend.models.post import Post, PostType
+from backend.services.adaptive_scheduler import advance_schedules
+from backend.services.ai_service import AIService
+from backend.services.content_fingerprint import find_unchanged_insight, fingerprint_fields
+from backend.services.fetch_planner import FetchPlan
+from backend.services.instagram_service import InstagramService, close_instagram_client
+from backend.services.job_queue import (
+    GENERATE_INSIGHT, GENERATE_INSTAGRAM_INSIGHT, GENERATE_POSTS,
+    claim_jobs, complete_job, extend_leases, fail_job
+)
+from backend.services.leader_lease import WORKER_ID
+from backend.services.llm_clients import close_llm_clients, init_llm_clients
+from backend.services.rate_limiter import RateLimitExceeded
+from backend.services.scheduler_service import (
+    CREATED, SKIPPED, UNCHANGED, RunLimits, generate_insight_for_keyword, save_posts_for_insight
+)
+from backend.services.twitter_service import close_twitter_client
+
+logger = logging.getLogger(__name__)
+
+
+class JobFailed(Exception):
+    """재시도할 작업 실패"""
+
+
+async def run_generate_insight(payload: Dict, limits: RunLimits) -> str:
+    """키워드 하나의 인사이트 + 포스트 생성 (레이트 리밋은 그대로 발생시켜 창이 초기화된 뒤 재시도)"""
+    plan = None
+    if payload.get("hours") and payload.get("max_results"):
+        plan = FetchPlan(hours=payload["hours"], max_results=payload["max_results"])
+    result = await generate_insight_for_keyword(
+        payload["keyword_id"], plan=plan, limits=limits, raise_rate_limit=True
+    )
+    if result not in (CREATED, SKIPPED, UNCHANGED):
+        raise JobFailed(f"키워드 {payload['keyword_id']} 인사이트 생성 결과: {result}")
+    if payload.get("adaptive") and result in (CREATED, UNCHANGED):
+        advance_schedules([payload["keyword_id"]])
+    return result
+
+
+async def run_generate_posts(payload: Dict, limits: RunLimits) -> str:
+    """이미 저장된 인사이트의 포스트 생성"""
+    insight_id = payload["insight_id"]
+    db = SessionLocal()
+    try:
+        # 이전 시도가 저장까지 마쳤으면 다시 만들지 않음
+        if db.query(Post.id).filter(Post.insight_id == insight_id).first():
+            return SKIPPED
+        async with limits.llm:
+            ai_service = AIService()
+            tweet_drafts = await ai_service.generate_tweets(payload["insights_data"], count=5)
+            instagram_data = await ai_service.generate_instagram_post(payload["insights_data"])
+        save_posts_for_insight(insight_id, tweet_drafts, instagram_data, db)
+        return CREATED
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def run_generate_instagram_insight(payload: Dict, limits: RunLimits) -> str:
+    """인스타그램 해시태그 포스트로 인사이트 생성 (인사이트와 수집한 포스트를 한 트랜잭션으로 저장)"""
+    keyword_id = payload["keyword_id"]
+    db = SessionLocal()
+    try:
+        keyword = db.query(Keyword).filter(Keyword.id == keyword_id).first()
+        if not keyword or not keyword.is_active:
+            return SKIPPED
+        keyword_text = keyword.keyword
+    finally:
+        db.close()
+
+    async with limits.fetch:
+        posts_data = await asyncio.wait_for(
+            InstagramService().fetch_posts(keyword_text, max_results=10), timeout=limits.timeout
+        )
+    if not posts_data:
+        return SKIPPED
+    captions = [post["caption"] for post in posts_data]
+
+    db = SessionLocal()
+    try:
+        if find_unchanged_insight(db, keyword_id, captions) is not None:
+            return UNCHANGED
+    finally:
+        db.close()
+
+    async with limits.llm:
+        insights_data = await asyncio.wait_for(
+            AIService().generate_insights(captions), timeout=limits.timeout
+        )
+
+    db = SessionLocal()
+    try:
+        insight = Insight(
+            keyword_id=keyword_id,
+            keyword=keyword_text,
+            summary_kr=insights_data.get("summary_kr"),
+            summary_en=insights_data.get("summary_en"),
+            tweets_analyzed=len(posts_data),  # 분석된 포스트 수
+            **fingerprint_fields(captions, insights_data)
+        )
+        db.add(insight)
+        db.flush()
+        for post_item in posts_data:
+            db.add(Post(
+                insight_id=insight.id,
+                post_type=PostType.INSTAGRAM,
+                content=post_item["caption"],
+                hashtags=",".join(post_item.get("hashtags", []))
+            ))
+        db.commit()
+        return CREATED
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+JOB_HANDLERS: Dict[str, Callable[[Dict, RunLimits], Awaitable[str]]] = {
+    GENERATE_INSIGHT: run_generate_insight,
+    GENERATE_POSTS: run_generate_posts,
+    GENERATE_INSTAGRAM_INSIGHT: run_generate_instagram_insight,
+}
+
+
+class Worker:
+    """작업을 최대 concurrency개까지 동시에 실행하고, 실행 중인 작업의 리스를 주기적으로 연장"""
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.limits = RunLimits.from_settings()
+        self.running: Dict[int, asyncio.Task] = {}
+        self.stopping = asyncio.Event()
+        self.wakeup = asyncio.Event()
+
+    def stop(self):
+        logger.info("워커 종료 요청: 실행 중인 작업을 마친 뒤 종료합니다.")
+        self.stopping.set()
+        self.wakeup.set()
+
+    async def run(self):
+        logger.info(f"워커 시작 (ID: {WORKER_ID}, 동시 실행 {self.concurrency})")
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            while not self.stopping.is_set():
+                jobs = claim_jobs(WORKER_ID, self.concurrency - len(self.running))
+                for job in jobs:
+                    task = asyncio.create_task(self._execute(job))
+                    self.running[job["id"]] = task
+                    task.add_done_callback(lambda _, job_id=job["id"]: self._finished(job_id))
+                if not jobs or len(self.running) >= self.concurrency:
+                    # 새 작업이 없거나 슬롯이 꽉 찼으면 작업 완료 / 폴링 간격까지 대기
+                    try:
+                        await asyncio.wait_for(self.wakeup.wait(), timeout=settings.worker_poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    self.wakeup.clear()
+            if self.running:
+                await asyncio.gather(*self.running.values(), return_exceptions=True)
+        finally:
+            heartbeat.cancel()
+        logger.info("워커가 종료되었습니다.")
+
+    def _finished(self, job_id: int):
+        self.running.pop(job_id, None)
+        self.wakeup.set()
+
+    async def _heartbeat(self):
+        interval = max(settings.job_lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                extend_leases(WORKER_ID, list(self.running))
+            except Exception as e:
+                logger.error(f"작업 리스 연장 중 오류: {e}")
+
+    async def _execute(self, job: Dict):
+        job_id, kind = job["id"], job["kind"]
+        handler: Optional[Callable] = JOB_HANDLERS.get(kind)
+        if handler is None:
+            fail_job(job_id, WORKER_ID, f"알 수 없는 작업 종류: {kind}")
+            return
+        logger.info(f"작업 {job_id} ({kind}) 시작 (시도 {job['attempts']})")
+        try:
+            result = await handler(job["payload"], self.limits)
+        except RateLimitExceeded as e:
+            fail_job(job_id, WORKER_ID, str(e), retry_after=e.retry_after)
+        except Exception as e:
+            if not isinstance(e, JobFailed):
+                logger.error(f"작업 {job_id} ({kind}) 실행 중 오류: {e}", exc_info=True)
+            fail_job(job_id, WORKER_ID, str(e) or type(e).__name__)
+        else:
+            complete_job(job_id, WORKER_ID, result)
+            logger.info(f"작업 {job_id} ({kind}) 완료: {result}")
+
+
+async def main(concurrency: int):
+    init_db()
+    init_llm_clients()
+    worker = Worker(concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await close_llm_clients()
+        await close_twitter_client()
+        await close_instagram_client()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="jobs 테이블 작업 실행 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))